@@ -0,0 +1,55 @@
+"""maintain updated_at with a BEFORE UPDATE trigger instead of ORM onupdate
+
+Revision ID: a8b9c0d1e2f3
+Revises: f7a8b9c0d1e2
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+
+revision = "a8b9c0d1e2f3"
+down_revision = "f7a8b9c0d1e2"
+branch_labels = None
+depends_on = None
+
+
+TABLES = (
+    "admins",
+    "real_estate_agents",
+    "end_users",
+    "phone_numbers",
+    "documents",
+    "contacts",
+    "properties",
+    "voice_agents",
+    "voice_agent_requests",
+    "calls",
+    "showings",
+    "rag_embedding_jobs",
+    "rag_query_logs",
+)
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION tg_set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table in TABLES:
+        op.execute(
+            f"CREATE TRIGGER set_updated_at BEFORE UPDATE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION tg_set_updated_at()"
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS set_updated_at ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS tg_set_updated_at()")
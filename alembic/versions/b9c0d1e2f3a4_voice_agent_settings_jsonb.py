@@ -0,0 +1,47 @@
+"""store voice_agents.settings as jsonb with a GIN index
+
+Revision ID: b9c0d1e2f3a4
+Revises: a8b9c0d1e2f3
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "b9c0d1e2f3a4"
+down_revision = "a8b9c0d1e2f3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "voice_agents",
+        "settings",
+        existing_type=sa.JSON(),
+        type_=postgresql.JSONB(),
+        existing_nullable=False,
+        server_default=sa.text("'{}'::jsonb"),
+        postgresql_using="settings::jsonb",
+    )
+    op.create_index(
+        "idx_voice_agent_settings",
+        "voice_agents",
+        ["settings"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_voice_agent_settings", table_name="voice_agents")
+    op.alter_column(
+        "voice_agents",
+        "settings",
+        existing_type=postgresql.JSONB(),
+        type_=sa.JSON(),
+        existing_nullable=False,
+        server_default=None,
+        postgresql_using="settings::json",
+    )
@@ -0,0 +1,32 @@
+"""add (agent, created_at, id) indexes for keyset pagination of properties and documents
+
+Revision ID: c0d1e2f3a4b5
+Revises: b9c0d1e2f3a4
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+
+revision = "c0d1e2f3a4b5"
+down_revision = "b9c0d1e2f3a4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_properties_agent_created_id",
+        "properties",
+        ["real_estate_agent_id", "created_at", "id"],
+    )
+    op.create_index(
+        "idx_documents_agent_created_id",
+        "documents",
+        ["real_estate_agent_id", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_documents_agent_created_id", table_name="documents")
+    op.drop_index("idx_properties_agent_created_id", table_name="properties")
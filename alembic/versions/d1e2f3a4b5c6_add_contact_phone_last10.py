@@ -0,0 +1,34 @@
+"""add contacts.phone_last10 for indexed inbound caller matching
+
+Revision ID: d1e2f3a4b5c6
+Revises: c0d1e2f3a4b5
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "d1e2f3a4b5c6"
+down_revision = "c0d1e2f3a4b5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("contacts", sa.Column("phone_last10", sa.String(length=10), nullable=True))
+    # Same key as app.models.contact.phone_last10(): last 10 digits, non-digits dropped
+    op.execute(
+        "UPDATE contacts SET phone_last10 = right(regexp_replace(phone_number, '[^0-9]', '', 'g'), 10)"
+    )
+    op.alter_column("contacts", "phone_last10", existing_type=sa.String(length=10), nullable=False)
+    op.create_index(
+        "idx_agent_phone_last10",
+        "contacts",
+        ["real_estate_agent_id", "phone_last10"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_agent_phone_last10", table_name="contacts")
+    op.drop_column("contacts", "phone_last10")
@@ -0,0 +1,35 @@
+"""add covering and partial indexes on calls for dashboard queries
+
+Revision ID: d5e6f7a8b9c0
+Revises: c4d5e6f7a8b9
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "d5e6f7a8b9c0"
+down_revision = "c4d5e6f7a8b9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_calls_agent_created_covering",
+        "calls",
+        ["real_estate_agent_id", "created_at"],
+        postgresql_include=["status", "duration_seconds"],
+    )
+    op.create_index(
+        "idx_calls_active",
+        "calls",
+        ["real_estate_agent_id"],
+        postgresql_where=sa.text("status IN ('initiated', 'ringing', 'in-progress')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_calls_active", table_name="calls")
+    op.drop_index("idx_calls_agent_created_covering", table_name="calls")
@@ -0,0 +1,43 @@
+"""maintain contacts.phone_last10 with a BEFORE INSERT/UPDATE trigger
+
+Revision ID: e2f3a4b5c6d7
+Revises: d1e2f3a4b5c6
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+
+revision = "e2f3a4b5c6d7"
+down_revision = "d1e2f3a4b5c6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Same key as app.models.contact.phone_last10(): last 10 digits, non-digits dropped.
+    # Covers writes that bypass the ORM's @validates hook (Core UPDATEs, raw SQL)
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION tg_set_phone_last10() RETURNS trigger AS $$
+        BEGIN
+            NEW.phone_last10 = right(regexp_replace(NEW.phone_number, '[^0-9]', '', 'g'), 10);
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER set_phone_last10 BEFORE INSERT OR UPDATE OF phone_number ON contacts "
+        "FOR EACH ROW EXECUTE FUNCTION tg_set_phone_last10()"
+    )
+    # Rows written outside the ORM since the column was added
+    op.execute(
+        "UPDATE contacts SET phone_last10 = right(regexp_replace(phone_number, '[^0-9]', '', 'g'), 10) "
+        "WHERE phone_last10 IS DISTINCT FROM right(regexp_replace(phone_number, '[^0-9]', '', 'g'), 10)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS set_phone_last10 ON contacts")
+    op.execute("DROP FUNCTION IF EXISTS tg_set_phone_last10()")
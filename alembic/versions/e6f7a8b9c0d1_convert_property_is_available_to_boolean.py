@@ -0,0 +1,42 @@
+"""convert properties.is_available from string to boolean
+
+Revision ID: e6f7a8b9c0d1
+Revises: d5e6f7a8b9c0
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "e6f7a8b9c0d1"
+down_revision = "d5e6f7a8b9c0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Indexes on the column (ix_properties_is_available, idx_agent_available,
+    # idx_contact_properties) are rebuilt by Postgres as part of ALTER TYPE.
+    op.alter_column("properties", "is_available", server_default=None)
+    op.alter_column(
+        "properties",
+        "is_available",
+        existing_type=sa.String(),
+        type_=sa.Boolean(),
+        nullable=False,
+        server_default=sa.true(),
+        postgresql_using="lower(coalesce(is_available, 'true')) = 'true'",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column("properties", "is_available", server_default=None)
+    op.alter_column(
+        "properties",
+        "is_available",
+        existing_type=sa.Boolean(),
+        type_=sa.String(),
+        nullable=True,
+        postgresql_using="CASE WHEN is_available THEN 'true' ELSE 'false' END",
+    )
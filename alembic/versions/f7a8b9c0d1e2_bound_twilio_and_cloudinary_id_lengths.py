@@ -0,0 +1,63 @@
+"""bound lengths of twilio sid and cloudinary public id columns
+
+Revision ID: f7a8b9c0d1e2
+Revises: e6f7a8b9c0d1
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "f7a8b9c0d1e2"
+down_revision = "e6f7a8b9c0d1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "calls",
+        "twilio_call_sid",
+        existing_type=sa.String(),
+        type_=sa.String(length=36),
+        existing_nullable=False,
+    )
+    op.alter_column(
+        "calls",
+        "recording_sid",
+        existing_type=sa.String(),
+        type_=sa.String(length=34),
+        existing_nullable=True,
+    )
+    op.alter_column(
+        "documents",
+        "cloudinary_public_id",
+        existing_type=sa.String(),
+        type_=sa.String(length=255),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "documents",
+        "cloudinary_public_id",
+        existing_type=sa.String(length=255),
+        type_=sa.String(),
+        existing_nullable=False,
+    )
+    op.alter_column(
+        "calls",
+        "recording_sid",
+        existing_type=sa.String(length=34),
+        type_=sa.String(),
+        existing_nullable=True,
+    )
+    op.alter_column(
+        "calls",
+        "twilio_call_sid",
+        existing_type=sa.String(length=36),
+        type_=sa.String(),
+        existing_nullable=False,
+    )
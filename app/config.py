@@ -1,9 +1,14 @@
 from pydantic_settings import BaseSettings
+from functools import cached_property
 from typing import Optional
 
 
 class Settings(BaseSettings):
     DATABASE_URL: str
+    # Async engine pool (per worker process); keep pool_size + max_overflow under the server's connection limit
+    DB_POOL_SIZE: int = 25
+    DB_MAX_OVERFLOW: int = 25
+    DB_POOL_RECYCLE_SECONDS: int = 1800
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
@@ -71,6 +76,11 @@ class Settings(BaseSettings):
             self.ADMIN_THREE_EMAIL.lower(),
         ]
 
+    @cached_property
+    def admin_email_set(self) -> frozenset[str]:
+        """Admin email whitelist as a set, for membership checks on every login"""
+        return frozenset(self.admin_email_list)
+
 
 settings = Settings()
 
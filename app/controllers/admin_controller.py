@@ -1,11 +1,14 @@
-from fastapi import APIRouter, HTTPException, Depends, status, Query
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Depends, status, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from typing import Dict, List, Optional
+import hashlib
 from app.schemas.real_estate_agent import RealEstateAgentResponse, RealEstateAgentUpdateRequest
 from app.schemas.admin_dashboard import AdminDashboardResponse
 from app.schemas.admin import AgentFullDetailsResponse
 from app.schemas.property import PropertyResponse, PaginatedPropertiesResponse
 from app.schemas.document import DocumentResponse, PaginatedDocumentsResponse
 from app.schemas.phone_number import PhoneNumberResponse
+from app.schemas.contact import ContactResponse
 from app.services.real_estate_agent_service import (
     get_all_real_estate_agents,
     get_real_estate_agent_by_id,
@@ -19,7 +22,10 @@ from app.services.admin_service import (
     get_agent_documents_for_admin,
     get_agent_documents_paginated_for_admin,
     get_agent_contacts_for_admin,
-    get_agent_phone_number_for_admin
+    get_agent_phone_number_for_admin,
+    get_agent_full_details_cache_info,
+    clear_agent_full_details_cache,
+    get_agent_data_version
 )
 from app.services.voice_agent_service import (
     get_all_voice_agent_requests,
@@ -37,6 +43,7 @@ from app.schemas.call import CallStatisticsResponse
 from app.services.call_statistics_service import get_call_statistics
 from pydantic import BaseModel
 from app.utils.dependencies import get_current_admin_id
+from app.utils.json_stream import orjson_stream
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
@@ -128,12 +135,64 @@ async def get_dashboard_stats(admin_id: str = Depends(get_current_admin_id)):
     return AdminDashboardResponse(**stats)
 
 
-@router.get("/real-estate-agents/{agent_id}/full-details", response_model=AgentFullDetailsResponse)
+@router.get("/cache/info", response_model=dict)
+async def get_cache_info(admin_id: str = Depends(get_current_admin_id)):
+    """Get agent full-details cache statistics (Admin only)"""
+    return get_agent_full_details_cache_info()
+
+
+@router.post("/cache/clear", response_model=dict)
+async def clear_cache(admin_id: str = Depends(get_current_admin_id)):
+    """Clear the agent full-details cache (Admin only)"""
+    cleared = clear_agent_full_details_cache()
+    return {"cleared": cleared}
+
+
+# The admin detail endpoints below get already-serialized (or streamed) rows
+# from admin_service (model_construct + TypeAdapter); response_model=None and
+# ORJSONResponse/StreamingResponse stop FastAPI re-validating/re-encoding them
+# (the documented schema is kept via `responses`).
+# The non-streamed ones carry a weak ETag from the agent's data version, so a
+# revisit with a matching If-None-Match gets a 304 before anything is fetched.
+def _agent_etag(version: str, *variant) -> str:
+    """Weak ETag for an agent's data at `version`; `variant` (page, cursor, ...) tells different views of it apart"""
+    if variant:
+        version = f"{version}-{hashlib.blake2s(repr(variant).encode(), digest_size=8).hexdigest()}"
+    return f'W/"{version}"'
+
+
+def _etag_headers(agent_id: str, version: str, etag: str) -> Dict[str, str]:
+    """ETag header for a body built at `version`, none if the agent's data changed meanwhile (the body may predate it)"""
+    return {"ETag": etag} if get_agent_data_version(agent_id) == version else {}
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+@router.get(
+    "/real-estate-agents/{agent_id}/full-details",
+    response_model=None,
+    responses={200: {"model": AgentFullDetailsResponse}},
+)
 async def get_agent_full_details_endpoint(
     agent_id: str,
+    request: Request,
     admin_id: str = Depends(get_current_admin_id)
 ):
     """Get full details of an agent including all properties, documents, phone number, and contacts (Admin only)"""
+    version = get_agent_data_version(agent_id)
+    etag = _agent_etag(version)
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    
     details = await get_agent_full_details(agent_id)
     
     if not details:
@@ -142,35 +201,55 @@ async def get_agent_full_details_endpoint(
             detail="Real estate agent not found"
         )
     
-    return AgentFullDetailsResponse(**details)
+    # details is the cached dict, so build a new one rather than overwrite "agent"
+    agent = RealEstateAgentResponse.model_construct(**details["agent"]).model_dump()
+    return ORJSONResponse(content={**details, "agent": agent}, headers=_etag_headers(agent_id, version, etag))
 
 
-@router.get("/real-estate-agents/{agent_id}/properties", response_model=List[PropertyResponse])
+@router.get(
+    "/real-estate-agents/{agent_id}/properties",
+    response_model=None,
+    responses={200: {"model": List[PropertyResponse]}},
+)
 async def get_agent_properties(
     agent_id: str,
     admin_id: str = Depends(get_current_admin_id)
 ):
     """Get all properties for an agent (Admin only) - Legacy endpoint for full details"""
-    properties = await get_agent_properties_for_admin(agent_id)
-    
-    if properties is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Real estate agent not found"
-        )
-    
-    return [PropertyResponse(**prop) for prop in properties]
+    return StreamingResponse(
+        orjson_stream(get_agent_properties_for_admin(agent_id)),
+        media_type="application/json",
+    )
 
 
-@router.get("/real-estate-agents/{agent_id}/properties/paginated", response_model=PaginatedPropertiesResponse)
+@router.get(
+    "/real-estate-agents/{agent_id}/properties/paginated",
+    response_model=None,
+    responses={200: {"model": PaginatedPropertiesResponse}},
+)
 async def get_agent_properties_paginated(
     agent_id: str,
+    request: Request,
     page: int = 1,
     page_size: int = 16,
+    cursor: Optional[str] = None,
     admin_id: str = Depends(get_current_admin_id)
 ):
-    """Get paginated properties for an agent (Admin only)"""
-    result = await get_agent_properties_paginated_for_admin(agent_id, page=page, page_size=page_size)
+    """Get paginated properties for an agent (Admin only); pass next_cursor back as `cursor` for keyset paging"""
+    version = get_agent_data_version(agent_id)
+    etag = _agent_etag(version, page, page_size, cursor)
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    
+    try:
+        result = await get_agent_properties_paginated_for_admin(
+            agent_id, page=page, page_size=page_size, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     
     if result is None:
         raise HTTPException(
@@ -178,42 +257,61 @@ async def get_agent_properties_paginated(
             detail="Real estate agent not found"
         )
     
-    properties, total = result
+    properties, total, next_cursor = result
     
-    return PaginatedPropertiesResponse(
-        items=[PropertyResponse(**prop) for prop in properties],
-        total=total,
-        page=page,
-        page_size=page_size,
-    )
-
-
-@router.get("/real-estate-agents/{agent_id}/documents", response_model=List[DocumentResponse])
+    return ORJSONResponse(content={
+        "items": properties,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "next_cursor": next_cursor,
+    }, headers=_etag_headers(agent_id, version, etag))
+
+
+@router.get(
+    "/real-estate-agents/{agent_id}/documents",
+    response_model=None,
+    responses={200: {"model": List[DocumentResponse]}},
+)
 async def get_agent_documents(
     agent_id: str,
     admin_id: str = Depends(get_current_admin_id)
 ):
     """Get all documents for an agent (Admin only) - Legacy endpoint for full details"""
-    documents = await get_agent_documents_for_admin(agent_id)
-    
-    if documents is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Real estate agent not found"
-        )
-    
-    return [DocumentResponse(**doc) for doc in documents]
+    return StreamingResponse(
+        orjson_stream(get_agent_documents_for_admin(agent_id)),
+        media_type="application/json",
+    )
 
 
-@router.get("/real-estate-agents/{agent_id}/documents/paginated", response_model=PaginatedDocumentsResponse)
+@router.get(
+    "/real-estate-agents/{agent_id}/documents/paginated",
+    response_model=None,
+    responses={200: {"model": PaginatedDocumentsResponse}},
+)
 async def get_agent_documents_paginated(
     agent_id: str,
+    request: Request,
     page: int = 1,
     page_size: int = 16,
+    cursor: Optional[str] = None,
     admin_id: str = Depends(get_current_admin_id)
 ):
-    """Get paginated documents for an agent (Admin only)"""
-    result = await get_agent_documents_paginated_for_admin(agent_id, page=page, page_size=page_size)
+    """Get paginated documents for an agent (Admin only); pass next_cursor back as `cursor` for keyset paging"""
+    version = get_agent_data_version(agent_id)
+    etag = _agent_etag(version, page, page_size, cursor)
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    
+    try:
+        result = await get_agent_documents_paginated_for_admin(
+            agent_id, page=page, page_size=page_size, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     
     if result is None:
         raise HTTPException(
@@ -221,31 +319,36 @@ async def get_agent_documents_paginated(
             detail="Real estate agent not found"
         )
     
-    documents, total = result
+    documents, total, next_cursor = result
     
-    return PaginatedDocumentsResponse(
-        items=[DocumentResponse(**doc) for doc in documents],
-        total=total,
-        page=page,
-        page_size=page_size,
-    )
-
-
-@router.get("/real-estate-agents/{agent_id}/contacts", response_model=List[dict])
+    return ORJSONResponse(content={
+        "items": documents,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "next_cursor": next_cursor,
+    }, headers=_etag_headers(agent_id, version, etag))
+
+
+@router.get(
+    "/real-estate-agents/{agent_id}/contacts",
+    response_model=None,
+    responses={200: {"model": List[ContactResponse]}},
+)
 async def get_agent_contacts(
     agent_id: str,
+    request: Request,
     admin_id: str = Depends(get_current_admin_id)
 ):
     """Get all contacts for an agent (Admin only)"""
-    contacts = await get_agent_contacts_for_admin(agent_id)
+    version = get_agent_data_version(agent_id)
+    etag = _agent_etag(version)
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
     
-    if contacts is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Real estate agent not found"
-        )
+    contacts = await get_agent_contacts_for_admin(agent_id)
     
-    return contacts
+    return ORJSONResponse(content=contacts, headers=_etag_headers(agent_id, version, etag))
 
 
 # Voice Agent Management (Admin)
@@ -339,12 +442,22 @@ async def get_voice_agent_by_agent_id(
     return VoiceAgentResponse(**voice_agent)
 
 
-@router.get("/real-estate-agents/{agent_id}/phone-number", response_model=PhoneNumberResponse)
+@router.get(
+    "/real-estate-agents/{agent_id}/phone-number",
+    response_model=None,
+    responses={200: {"model": PhoneNumberResponse}},
+)
 async def get_agent_phone_number(
     agent_id: str,
+    request: Request,
     admin_id: str = Depends(get_current_admin_id)
 ):
     """Get phone number for an agent (Admin only)"""
+    version = get_agent_data_version(agent_id)
+    etag = _agent_etag(version)
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    
     phone_number = await get_agent_phone_number_for_admin(agent_id)
     
     if phone_number is None:
@@ -353,7 +466,7 @@ async def get_agent_phone_number(
             detail="Real estate agent not found or phone number not assigned"
         )
     
-    return PhoneNumberResponse(**phone_number)
+    return ORJSONResponse(content=phone_number.model_dump(), headers=_etag_headers(agent_id, version, etag))
 
 
 # Call Statistics (Admin)
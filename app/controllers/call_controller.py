@@ -147,22 +147,32 @@ async def get_calls_endpoint(
     status: Optional[str] = Query(None),
     direction: Optional[str] = Query(None),
     search: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
     agent_id: str = Depends(get_current_real_estate_agent_id)
 ):
-    """Get paginated call history with server-side filtering and search"""
-    calls, total = await get_calls_by_agent(
-        real_estate_agent_id=agent_id,
-        page=page,
-        page_size=page_size,
-        status=status,
-        direction=direction,
-        search=search
-    )
+    """Get paginated call history with server-side filtering and search; pass next_cursor back as `cursor` for keyset paging"""
+    try:
+        calls, total, next_cursor = await get_calls_by_agent(
+            real_estate_agent_id=agent_id,
+            page=page,
+            page_size=page_size,
+            status=status,
+            direction=direction,
+            search=search,
+            cursor=cursor
+        )
+    except ValueError as e:
+        # `status` is the filter param here, so use the code directly
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
     return PaginatedCallsResponse(
         items=[CallResponse(**call) for call in calls],
         total=total,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        next_cursor=next_cursor
     )
 
 
@@ -22,7 +22,7 @@ async def get_my_properties(
     search: Optional[str] = None,
     property_type: Optional[str] = None,
     city: Optional[str] = None,
-    is_available: Optional[str] = None,
+    is_available: Optional[bool] = None,
     contact_id: Optional[str] = None,
     bedrooms: Optional[int] = None,
     page: int = 1,
@@ -1,5 +1,5 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncAttrs, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.engine.url import make_url
 from app.config import settings
 
@@ -45,9 +45,10 @@ engine = create_async_engine(
     echo=settings.DEBUG,
     future=True,
     pool_pre_ping=True,  # Verify connections before using them
-    pool_recycle=3600,  # Recycle connections after 1 hour
-    pool_size=10,  # Number of connections to maintain
-    max_overflow=20,  # Maximum overflow connections
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,  # Recycle connections after 30 min by default
+    pool_size=settings.DB_POOL_SIZE,  # Number of connections to maintain
+    max_overflow=settings.DB_MAX_OVERFLOW,  # Maximum overflow connections
+    pool_use_lifo=True,  # Reuse the most recent connection so idle extras can age out via pool_recycle
     connect_args=get_connect_args()
 )
 
@@ -59,7 +60,19 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False
 )
 
-Base = declarative_base()
+
+class Base(AsyncAttrs, DeclarativeBase):
+    """Declarative base for all ORM models.
+
+    AsyncAttrs exposes ``obj.awaitable_attrs.<name>`` for the rare case where a
+    relationship has to be loaded after the fact without blocking the loop.
+
+    eager_defaults reads server-generated columns back in the INSERT/UPDATE
+    itself (RETURNING), so ``updated_at`` bumped by the set_updated_at trigger
+    is current on the instance after a flush instead of the value it was
+    loaded with.
+    """
+    __mapper_args__ = {"eager_defaults": True}
 
 
 async def get_db():
@@ -1,11 +1,14 @@
 from pathlib import Path
 from fastapi import FastAPI, Request, Response, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from contextlib import asynccontextmanager
 from sqlalchemy import text
 from app.database.connection import close_db, engine
+from app.services.ai.llm_service import aclose_llm_client, warm_llm_client
+from app.services.twilio_service.client import aclose_twilio_http_client
 from app.controllers.auth_controller import router as auth_router
 from app.controllers.admin_controller import router as admin_router
 from app.controllers.real_estate_agent_auth_controller import router as agent_auth_router
@@ -23,7 +26,9 @@ from app.controllers.showing_controller import router as showing_router
 from app.controllers.twilio_controller.webhook_controller import router as webhook_router
 from app.controllers.end_user_controller import router as end_user_router
 from app.controllers.admin_rag_metrics_controller import router as admin_rag_metrics_router
+import asyncio
 import logging
+import sys
 import time
 
 # Configure root logger so ALL logger.info() calls in services actually output to console
@@ -39,21 +44,48 @@ logging.getLogger("hpack").setLevel(logging.WARNING)
 
 logger = logging.getLogger(__name__)
 
+# Paths polled by health checks or bound by Twilio's webhook SLA — never logged
+_SKIP_LOGGING_PATHS = frozenset({"/health", "/"})
+_SKIP_LOGGING_PREFIX = "/webhooks"
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log all incoming requests"""
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
+# Static parts of the request log block, built once at import
+_BANNER_RULE = "=" * 70
+_BANNER_TOP = f"\n{_BANNER_RULE}\nINCOMING REQUEST\n{_BANNER_RULE}"
+_BANNER_END = f"{_BANNER_RULE}\n\n"
+
+
+class RequestLoggingMiddleware:
+    """ASGI middleware to log all incoming requests.
+
+    Only the ``http.response.start`` message is inspected; body messages are
+    passed straight through so streamed responses are never buffered.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        if path in _SKIP_LOGGING_PATHS or path.startswith(_SKIP_LOGGING_PREFIX):
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.perf_counter_ns()
+        request = Request(scope)
         client_ip = request.client.host if request.client else "unknown"
         
         # Log incoming request (ASCII only — Windows cp1252 consoles break on emoji)
-        print(f"\n{'='*70}")
-        print("INCOMING REQUEST")
-        print(f"{'='*70}")
-        print(f"Method: {request.method}")
-        print(f"Path: {request.url.path}")
-        print(f"Query: {request.url.query or 'None'}")
-        print(f"Client IP: {client_ip}")
+        lines = [
+            _BANNER_TOP,
+            f"Method: {request.method}",
+            f"Path: {path}",
+            f"Query: {request.url.query or 'None'}",
+            f"Client IP: {client_ip}",
+        ]
         
         # Log important headers only
         headers_to_log = {}
@@ -64,26 +96,31 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                 else:
                     headers_to_log[header] = request.headers[header]
         if headers_to_log:
-            print(f"Headers: {headers_to_log}")
+            lines.append(f"Headers: {headers_to_log}")
         
         # For POST/PUT/PATCH, log that body exists (actual body will be logged in endpoint)
         if request.method in ["POST", "PUT", "PATCH"]:
             content_type = request.headers.get("content-type", "")
             content_length = request.headers.get("content-length", "unknown")
-            print(f"Body: Content-Type={content_type}, Length={content_length}")
-        
-        print(f"{'='*70}\n")
-        logger.info(f"Request: {request.method} {request.url.path} from {client_ip}")
-        
-        # Process request
-        response = await call_next(request)
-        
-        # Log response
-        process_time = time.time() - start_time
-        print(f"Response: {response.status_code} ({process_time:.3f}s)\n")
-        logger.info(f"Response: {response.status_code} for {request.method} {request.url.path} ({process_time:.3f}s)")
+            lines.append(f"Body: Content-Type={content_type}, Length={content_length}")
         
-        return response
+        lines.append(_BANNER_END)
+        sys.stdout.write("\n".join(lines))
+        logger.info(f"Request: {request.method} {path} from {client_ip}")
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed_ns = time.perf_counter_ns() - start_ns
+                process_time = elapsed_ns / 1_000_000_000
+                sys.stdout.write(f"Response: {status_code} ({process_time:.3f}s)\n\n")
+                logger.info(
+                    f"Response: {status_code} for {request.method} {path} ({process_time:.3f}s)",
+                    extra={"duration_ns": elapsed_ns},
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
 
 
 @asynccontextmanager
@@ -99,20 +136,34 @@ async def lifespan(app: FastAPI):
         # Don't raise - allow app to start even if DB is temporarily unavailable
         # This is important for webhook endpoints that need to respond quickly
     
+    # Handshake with Gemini in the background so the first call's greeting reuses the connection
+    llm_warmup = asyncio.create_task(warm_llm_client())
+    
     yield
     
+    llm_warmup.cancel()
+    
     # Cleanup on shutdown
     try:
         await close_db()
         logger.info("Database connections closed")
     except Exception as e:
         logger.error(f"Error closing database: {str(e)}")
+    try:
+        await aclose_llm_client()
+    except Exception as e:
+        logger.error(f"Error closing LLM client: {str(e)}")
+    try:
+        await aclose_twilio_http_client()
+    except Exception as e:
+        logger.error(f"Error closing Twilio client: {str(e)}")
 
 
 app = FastAPI(
     title="PropTalk API",
     description="AI-Powered Receptionist Service for Real Estate",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -127,26 +178,31 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-app.include_router(auth_router)
-app.include_router(admin_router)
-app.include_router(agent_auth_router)
-app.include_router(google_auth_router)
-app.include_router(phone_number_router)
-app.include_router(document_router)
 # Agent property router has enhanced features (filters, sorting).
 # Old generic property_router has been removed to avoid route conflicts
 # and to ensure all filters work correctly for agents.
-app.include_router(contact_router)
-app.include_router(agent_dashboard_router)
-app.include_router(agent_property_router)
-app.include_router(agent_profile_router)
-app.include_router(rag_metrics_router)
-app.include_router(voice_agent_router)
-app.include_router(call_router)
-app.include_router(showing_router)
-app.include_router(webhook_router)
-app.include_router(end_user_router)
-app.include_router(admin_rag_metrics_router)
+_ROUTERS = (
+    auth_router,
+    admin_router,
+    agent_auth_router,
+    google_auth_router,
+    phone_number_router,
+    document_router,
+    contact_router,
+    agent_dashboard_router,
+    agent_property_router,
+    agent_profile_router,
+    rag_metrics_router,
+    voice_agent_router,
+    call_router,
+    showing_router,
+    webhook_router,
+    end_user_router,
+    admin_rag_metrics_router,
+)
+
+for _router in _ROUTERS:
+    app.include_router(_router)
 
 _assets_dir = Path(__file__).resolve().parent.parent / "assets"
 if _assets_dir.is_dir():
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime
+from sqlalchemy import Column, String, Boolean, DateTime, FetchedValue
 from sqlalchemy.sql import func
 from app.database.connection import Base
 from datetime import datetime
@@ -14,4 +14,4 @@ class Admin(Base):
     is_active = Column(Boolean, default=True)
     is_super_admin = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())  # Bumped by the set_updated_at DB trigger
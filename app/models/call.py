@@ -1,59 +1,74 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Text, Index, JSON
+from datetime import datetime
+from typing import Any, Optional
+from sqlalchemy import String, DateTime, ForeignKey, Integer, Text, Index, JSON, text, FetchedValue
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database.connection import Base
 
 
 class Call(Base):
     __tablename__ = "calls"
     
-    id = Column(String, primary_key=True)
-    voice_agent_id = Column(
+    id: Mapped[str] = mapped_column(String, primary_key=True)
+    voice_agent_id: Mapped[str] = mapped_column(
         String, 
         ForeignKey("voice_agents.id", ondelete="CASCADE"), 
         nullable=False, 
         index=True
     )
-    real_estate_agent_id = Column(
+    real_estate_agent_id: Mapped[str] = mapped_column(
         String, 
         ForeignKey("real_estate_agents.id", ondelete="CASCADE"), 
         nullable=False, 
         index=True
     )
-    twilio_call_sid = Column(String, unique=True, nullable=False, index=True)  # Twilio Call SID
-    contact_id = Column(
+    twilio_call_sid: Mapped[str] = mapped_column(String(36), unique=True, nullable=False, index=True)  # Twilio Call SID (34 chars; 36-char call id placeholder until Twilio answers)
+    contact_id: Mapped[Optional[str]] = mapped_column(
         String, 
         ForeignKey("contacts.id", ondelete="SET NULL"), 
         nullable=True, 
         index=True
     )
-    from_number = Column(String, nullable=False)  # Caller's phone number
-    to_number = Column(String, nullable=False)  # Voice agent's Twilio number
-    status = Column(String, nullable=False, index=True)  # 'initiated', 'ringing', 'in-progress', 'completed', 'failed', 'busy', 'no-answer'
-    direction = Column(String, nullable=False, index=True)  # 'inbound' | 'outbound'
-    duration_seconds = Column(Integer, default=0, nullable=False)
-    recording_url = Column(Text, nullable=True)  # Twilio recording URL
-    recording_sid = Column(String, nullable=True, index=True)  # Twilio Recording SID
-    transcript = Column(Text, nullable=True)  # STT transcript (if available)
-    transcript_json = Column(JSON, nullable=True)  # Structured transcript (list of messages)
-    user_pov_summary = Column(Text, nullable=True)  # 1-2 line summary of user intent/POV
-    sentiment_label = Column(String(32), nullable=True)  # positive | neutral | negative (from sentiment API)
-    sentiment_scores = Column(JSON, nullable=True)  # { negative, neutral, positive }
-    started_at = Column(DateTime(timezone=True), nullable=True)
-    answered_at = Column(DateTime(timezone=True), nullable=True)
-    ended_at = Column(DateTime(timezone=True), nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    from_number: Mapped[str] = mapped_column(String, nullable=False)  # Caller's phone number
+    to_number: Mapped[str] = mapped_column(String, nullable=False)  # Voice agent's Twilio number
+    status: Mapped[str] = mapped_column(String, nullable=False, index=True)  # 'initiated', 'ringing', 'in-progress', 'completed', 'failed', 'busy', 'no-answer'
+    direction: Mapped[str] = mapped_column(String, nullable=False, index=True)  # 'inbound' | 'outbound'
+    duration_seconds: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    recording_url: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Twilio recording URL
+    recording_sid: Mapped[Optional[str]] = mapped_column(String(34), nullable=True, index=True)  # Twilio Recording SID (RE + 32 hex)
+    transcript: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # STT transcript (if available)
+    transcript_json: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)  # Structured transcript (list of messages)
+    user_pov_summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # 1-2 line summary of user intent/POV
+    sentiment_label: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)  # positive | neutral | negative (from sentiment API)
+    sentiment_scores: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)  # { negative, neutral, positive }
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    answered_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    ended_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now(), index=True)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())  # Bumped by the set_updated_at DB trigger
     
-    # Relationships
-    voice_agent = relationship("VoiceAgent", backref="calls")
-    real_estate_agent = relationship("RealEstateAgent", backref="calls")
-    contact = relationship("Contact", foreign_keys=[contact_id])
+    # Relationships (one-way, never lazy-loaded: use selectinload() where needed)
+    voice_agent: Mapped["VoiceAgent"] = relationship("VoiceAgent", lazy="raise")
+    real_estate_agent: Mapped["RealEstateAgent"] = relationship("RealEstateAgent", lazy="raise")
+    contact: Mapped[Optional["Contact"]] = relationship("Contact", foreign_keys=[contact_id], lazy="raise")
     
     # Composite indexes for fast queries
     __table_args__ = (
         Index('idx_calls_agent_created', 'real_estate_agent_id', 'created_at'),
         Index('idx_calls_agent_status', 'real_estate_agent_id', 'status'),
         Index('idx_calls_voice_agent_created', 'voice_agent_id', 'created_at'),
+        # Dashboard stats filter on agent + created_at range and aggregate status/duration;
+        # INCLUDE lets Postgres answer them with index-only scans
+        Index(
+            'idx_calls_agent_created_covering',
+            'real_estate_agent_id',
+            'created_at',
+            postgresql_include=['status', 'duration_seconds'],
+        ),
+        # Live calls are a tiny slice of the table; keep a partial index just for them
+        Index(
+            'idx_calls_active',
+            'real_estate_agent_id',
+            postgresql_where=text("status IN ('initiated', 'ringing', 'in-progress')"),
+        ),
     )
-
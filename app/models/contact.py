@@ -1,26 +1,47 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Index
+import re
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import String, DateTime, ForeignKey, Index, FetchedValue
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 from app.database.connection import Base
 
 
+# ASCII digits only, like the set_phone_last10 trigger's [^0-9]
+_NON_DIGITS = re.compile(r'[^0-9]')
+
+
+def phone_last10(phone: Optional[str]) -> str:
+    """Last 10 digits of a phone number, ignoring '+', spaces and dashes (the caller-match key)"""
+    return _NON_DIGITS.sub('', phone or '')[-10:]
+
+
 class Contact(Base):
     __tablename__ = "contacts"
     
-    id = Column(String, primary_key=True)
-    real_estate_agent_id = Column(String, ForeignKey("real_estate_agents.id", ondelete="CASCADE"), nullable=False, index=True)
-    name = Column(String, nullable=False)
-    phone_number = Column(String, nullable=False, index=True)  # Indexed for fast lookups and Twilio calls
-    email = Column(String, nullable=True)
-    notes = Column(String, nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    id: Mapped[str] = mapped_column(String, primary_key=True)
+    real_estate_agent_id: Mapped[str] = mapped_column(String, ForeignKey("real_estate_agents.id", ondelete="CASCADE"), nullable=False, index=True)
+    name: Mapped[str] = mapped_column(String, nullable=False)
+    phone_number: Mapped[str] = mapped_column(String, nullable=False, index=True)  # Indexed for fast lookups and Twilio calls
+    phone_last10: Mapped[str] = mapped_column(String(10), nullable=False)  # Set from phone_number by the set_phone_last10 DB trigger (and @validates below); inbound caller matching
+    email: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    notes: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())  # Bumped by the set_updated_at DB trigger
     
-    # Relationships
-    real_estate_agent = relationship("RealEstateAgent", backref="contacts")
+    # Relationships (one-way, never lazy-loaded: use selectinload() where needed)
+    real_estate_agent: Mapped["RealEstateAgent"] = relationship("RealEstateAgent", lazy="raise")
     
     # Composite index for fast lookups by agent and phone (for deduplication)
     __table_args__ = (
         Index('idx_agent_phone', 'real_estate_agent_id', 'phone_number'),
+        Index('idx_agent_phone_last10', 'real_estate_agent_id', 'phone_last10'),
     )
+    
+    # The trigger is the source of truth; this keeps the in-memory value right
+    # before a flush (and on databases without the trigger, e.g. SQLite in tests)
+    @validates('phone_number')
+    def _sync_phone_last10(self, key, value):
+        self.phone_last10 = phone_last10(value)
+        return value
 
@@ -1,23 +1,30 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import String, DateTime, ForeignKey, Index, FetchedValue
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database.connection import Base
 
 
 class Document(Base):
     __tablename__ = "documents"
     
-    id = Column(String, primary_key=True)
-    real_estate_agent_id = Column(String, ForeignKey("real_estate_agents.id", ondelete="CASCADE"), nullable=False)
-    file_name = Column(String, nullable=False)
-    file_type = Column(String, nullable=False)  # "csv", "pdf", "docx"
-    file_size = Column(String, nullable=True)  # in bytes
-    cloudinary_public_id = Column(String, unique=True, nullable=False)
-    cloudinary_url = Column(String, nullable=False)
-    description = Column(String, nullable=True)
-    upload_kind = Column(String, nullable=False, default="property_import")
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    id: Mapped[str] = mapped_column(String, primary_key=True)
+    real_estate_agent_id: Mapped[str] = mapped_column(String, ForeignKey("real_estate_agents.id", ondelete="CASCADE"), nullable=False)
+    file_name: Mapped[str] = mapped_column(String, nullable=False)
+    file_type: Mapped[str] = mapped_column(String, nullable=False)  # "csv", "pdf", "docx"
+    file_size: Mapped[Optional[str]] = mapped_column(String, nullable=True)  # in bytes
+    cloudinary_public_id: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)  # folder/uuid.ext
+    cloudinary_url: Mapped[str] = mapped_column(String, nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    upload_kind: Mapped[str] = mapped_column(String, nullable=False, default="property_import")
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())  # Bumped by the set_updated_at DB trigger
     
-    # Relationship
-    real_estate_agent = relationship("RealEstateAgent", backref="documents")
+    # Relationship (one-way, never lazy-loaded: use selectinload() where needed)
+    real_estate_agent: Mapped["RealEstateAgent"] = relationship("RealEstateAgent", lazy="raise")
+    
+    __table_args__ = (
+        # Keyset pagination: WHERE agent = ? AND (created_at, id) < (?, ?) ORDER BY created_at DESC, id DESC
+        Index('idx_documents_agent_created_id', 'real_estate_agent_id', 'created_at', 'id'),
+    )
@@ -1,41 +1,46 @@
-from sqlalchemy import Column, String, Integer, Numeric, DateTime, ForeignKey, Index
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+from sqlalchemy import String, Integer, Numeric, Boolean, DateTime, ForeignKey, Index, true, FetchedValue
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database.connection import Base
 
 
 class Property(Base):
     __tablename__ = "properties"
     
-    id = Column(String, primary_key=True)
-    real_estate_agent_id = Column(String, ForeignKey("real_estate_agents.id", ondelete="CASCADE"), nullable=False, index=True)
-    document_id = Column(String, ForeignKey("documents.id", ondelete="SET NULL"), nullable=True)
-    contact_id = Column(String, ForeignKey("contacts.id", ondelete="SET NULL"), nullable=True, index=True)  # Link to contact for Twilio calls
-    property_type = Column(String, nullable=True, index=True)  # Indexed for filtering
-    address = Column(String, nullable=False)
-    city = Column(String, nullable=True, index=True)  # Indexed for filtering
-    state = Column(String, nullable=True)
-    zip_code = Column(String, nullable=True)
-    price = Column(Numeric(12, 2), nullable=True)
-    bedrooms = Column(Integer, nullable=True)
-    bathrooms = Column(Integer, nullable=True)
-    square_feet = Column(Integer, nullable=True)
-    description = Column(String, nullable=True)
-    amenities = Column(String, nullable=True)  # JSON string or comma-separated
-    owner_name = Column(String, nullable=True)  # Keep for backward compatibility
-    owner_phone = Column(String, nullable=False)  # Keep for backward compatibility and Twilio calls
-    is_available = Column(String, default="true", index=True)  # Indexed for filtering
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    id: Mapped[str] = mapped_column(String, primary_key=True)
+    real_estate_agent_id: Mapped[str] = mapped_column(String, ForeignKey("real_estate_agents.id", ondelete="CASCADE"), nullable=False, index=True)
+    document_id: Mapped[Optional[str]] = mapped_column(String, ForeignKey("documents.id", ondelete="SET NULL"), nullable=True)
+    contact_id: Mapped[Optional[str]] = mapped_column(String, ForeignKey("contacts.id", ondelete="SET NULL"), nullable=True, index=True)  # Link to contact for Twilio calls
+    property_type: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True)  # Indexed for filtering
+    address: Mapped[str] = mapped_column(String, nullable=False)
+    city: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True)  # Indexed for filtering
+    state: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    zip_code: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    price: Mapped[Optional[Decimal]] = mapped_column(Numeric(12, 2), nullable=True)
+    bedrooms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    bathrooms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    square_feet: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    description: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    amenities: Mapped[Optional[str]] = mapped_column(String, nullable=True)  # JSON string or comma-separated
+    owner_name: Mapped[Optional[str]] = mapped_column(String, nullable=True)  # Keep for backward compatibility
+    owner_phone: Mapped[str] = mapped_column(String, nullable=False)  # Keep for backward compatibility and Twilio calls
+    is_available: Mapped[bool] = mapped_column(Boolean, default=True, server_default=true(), nullable=False, index=True)  # Indexed for filtering
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())  # Bumped by the set_updated_at DB trigger
     
-    # Relationships
-    real_estate_agent = relationship("RealEstateAgent", backref="properties")
-    document = relationship("Document", backref="properties")
-    contact = relationship("Contact", backref="properties")  # Link to contact for Twilio integration
+    # Relationships (one-way, never lazy-loaded: use selectinload() where needed)
+    real_estate_agent: Mapped["RealEstateAgent"] = relationship("RealEstateAgent", lazy="raise")
+    document: Mapped[Optional["Document"]] = relationship("Document", lazy="raise")
+    contact: Mapped[Optional["Contact"]] = relationship("Contact", lazy="raise")  # Link to contact for Twilio integration
     
     # Composite indexes for common query patterns
     __table_args__ = (
         Index('idx_agent_available', 'real_estate_agent_id', 'is_available'),
         Index('idx_agent_type', 'real_estate_agent_id', 'property_type'),
         Index('idx_contact_properties', 'contact_id', 'is_available'),
+        # Keyset pagination: WHERE agent = ? AND (created_at, id) < (?, ?) ORDER BY created_at DESC, id DESC
+        Index('idx_properties_agent_created_id', 'real_estate_agent_id', 'created_at', 'id'),
     )
@@ -8,6 +8,7 @@ from sqlalchemy import (
     Float,
     Index,
     JSON,
+    FetchedValue,
 )
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -40,7 +41,7 @@ class RagEmbeddingJob(Base):
     notes = Column(Text, nullable=True)
     metrics_json = Column(JSON, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())  # Bumped by the set_updated_at DB trigger
 
     real_estate_agent = relationship("RealEstateAgent", backref="rag_embedding_jobs")
     document = relationship("Document", backref="rag_embedding_jobs")
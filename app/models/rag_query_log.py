@@ -9,6 +9,7 @@ from sqlalchemy import (
     Float,
     Index,
     JSON,
+    FetchedValue,
 )
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -62,7 +63,7 @@ class RagQueryLog(Base):
     metadata_json = Column(JSON, nullable=True)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())  # Bumped by the set_updated_at DB trigger
 
     real_estate_agent = relationship("RealEstateAgent", backref="rag_query_logs")
     end_user = relationship("EndUser", backref="rag_query_logs")
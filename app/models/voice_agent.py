@@ -1,4 +1,5 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Text, JSON
+from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Text, JSON, Index, text, FetchedValue
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database.connection import Base
@@ -25,11 +26,19 @@ class VoiceAgent(Base):
     system_prompt = Column(Text, nullable=True)  # Custom system prompt (if use_default_prompt = false)
     use_default_prompt = Column(Boolean, default=True, nullable=False)
     status = Column(String, nullable=False, default="pending_setup", index=True)  # 'active', 'inactive', 'pending_setup'
-    settings = Column(JSON, nullable=False, default={})  # Voice settings, greeting, commands
+    settings = Column(
+        JSON().with_variant(JSONB(), "postgresql"),  # JSONB on Postgres, plain JSON elsewhere (tests)
+        nullable=False,
+        default=dict,
+        server_default=text("'{}'"),
+    )  # Voice settings, greeting, commands
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())  # Bumped by the set_updated_at DB trigger
     
     # Relationships
     real_estate_agent = relationship("RealEstateAgent", backref="voice_agent")
     phone_number = relationship("PhoneNumber", foreign_keys=[phone_number_id])
-
+    
+    __table_args__ = (
+        Index('idx_voice_agent_settings', 'settings', postgresql_using='gin'),
+    )
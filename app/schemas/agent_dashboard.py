@@ -9,7 +9,7 @@ class PropertySummaryResponse(BaseModel):
     city: Optional[str]
     property_type: Optional[str]
     price: Optional[str]
-    is_available: str
+    is_available: bool
     created_at: str
 
 
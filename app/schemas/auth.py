@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 from typing import Optional
 
 
@@ -34,8 +34,7 @@ class AdminResponse(BaseModel):
     is_super_admin: bool
     created_at: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, extra='ignore', defer_build=False)
 
 
 class RealEstateAgentAuthResponse(BaseModel):
@@ -49,6 +48,5 @@ class RealEstateAgentAuthResponse(BaseModel):
     is_verified: bool
     created_at: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, extra='ignore', defer_build=False)
 
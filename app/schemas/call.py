@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any, Union
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Annotated, Optional, List, Dict, Any
 from datetime import datetime
 
 
@@ -26,14 +26,13 @@ class CallResponse(BaseModel):
     user_pov_summary: Optional[str] = None
     sentiment_label: Optional[str] = None  # positive | neutral | negative
     sentiment_scores: Optional[Dict[str, Any]] = None
-    started_at: Optional[str] = None
-    answered_at: Optional[str] = None
-    ended_at: Optional[str] = None
-    created_at: str
-    updated_at: str
+    started_at: Optional[datetime] = None
+    answered_at: Optional[datetime] = None
+    ended_at: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, extra='ignore', defer_build=False)
 
 
 class PaginatedCallsResponse(BaseModel):
@@ -42,6 +41,7 @@ class PaginatedCallsResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = None  # pass back as `cursor` for the next page
 
 
 class CallInitiateRequest(BaseModel):
@@ -52,9 +52,18 @@ class CallInitiateRequest(BaseModel):
 
 class CallBatchRequest(BaseModel):
     """Request schema for batch calls"""
-    contact_ids: List[str] = Field(..., min_items=1, description="List of contact IDs to call")
+    contact_ids: Annotated[
+        List[str],
+        Field(min_length=1, max_length=500, description="List of contact IDs to call"),
+    ]
     delay_seconds: int = Field(default=30, ge=0, le=300, description="Delay between calls in seconds")
 
+    @field_validator('contact_ids', mode='after')
+    @classmethod
+    def _dedup_contact_ids(cls, v: List[str]) -> List[str]:
+        # Keep first-seen order so calls go out in the order the agent picked them
+        return list(dict.fromkeys(v))
+
 
 class CallRecordingResponse(BaseModel):
     """Response schema for call recording"""
@@ -68,6 +77,14 @@ class CallTranscriptResponse(BaseModel):
     transcript: str
 
 
+class CallsByDayItem(BaseModel):
+    """One bucket of the call statistics chart"""
+    date: str  # "2025-01-15", or "2025-01-15 14:00" for the 'day' period
+    count: int
+
+    model_config = ConfigDict(extra='ignore')
+
+
 class CallStatisticsResponse(BaseModel):
     """Response schema for call statistics"""
     period: str  # 'day' | 'week' | 'month'
@@ -77,5 +94,5 @@ class CallStatisticsResponse(BaseModel):
     total_duration_seconds: int
     average_duration_seconds: float
     calls_by_status: Dict[str, int]
-    calls_by_day: List[Dict[str, Union[str, int]]]  # [{"date": "2025-01-15", "count": 5}, ...]
+    calls_by_day: List[CallsByDayItem]
 
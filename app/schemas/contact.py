@@ -1,37 +1,44 @@
-from pydantic import BaseModel, EmailStr, Field, validator
-from typing import Optional, List
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, StringConstraints
+from typing import Annotated, Optional, List
 from datetime import datetime
 
 
+# Common phone separators, stripped in C via str.translate before validation
+_PHONE_STRIP = str.maketrans('', '', ' ()-+.\t')
+_PHONE_DIGITS_PATTERN = r'^[0-9]+$'
+
+
+def _strip_phone_separators(v):
+    return v.translate(_PHONE_STRIP) if isinstance(v, str) else v
+
+
+# Phone number reduced to its digits; length and digit checks run in pydantic-core
+PhoneNumberStr = Annotated[
+    str,
+    BeforeValidator(_strip_phone_separators),
+    StringConstraints(min_length=10, max_length=20, pattern=_PHONE_DIGITS_PATTERN),
+]
+
+
+# Syntactic email check run by pydantic-core; contacts are agent-entered data,
+# so the heavier email-validator (EmailStr) is kept for account sign-up only
+_EMAIL_PATTERN = r'^[^@\s]+@[^@\s]+\.[^@\s]+$'
+
+ContactEmailStr = Annotated[str, StringConstraints(pattern=_EMAIL_PATTERN, max_length=254)]
+
+
 class ContactCreateRequest(BaseModel):
     name: str = Field(..., min_length=1, max_length=255, description="Contact full name")
-    phone_number: str = Field(..., min_length=10, max_length=20, description="Contact phone number")
-    email: Optional[EmailStr] = Field(None, description="Contact email address")
+    phone_number: PhoneNumberStr = Field(..., description="Contact phone number")
+    email: Optional[ContactEmailStr] = Field(None, description="Contact email address")
     notes: Optional[str] = Field(None, max_length=1000, description="Additional notes about the contact")
-    
-    @validator('phone_number')
-    def validate_phone(cls, v):
-        # Basic phone validation - remove spaces, dashes, parentheses
-        cleaned = ''.join(filter(str.isdigit, v))
-        if len(cleaned) < 10:
-            raise ValueError('Phone number must contain at least 10 digits')
-        return cleaned
 
 
 class ContactUpdateRequest(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=255)
-    phone_number: Optional[str] = Field(None, min_length=10, max_length=20)
-    email: Optional[EmailStr] = None
+    phone_number: Optional[PhoneNumberStr] = None
+    email: Optional[ContactEmailStr] = None
     notes: Optional[str] = Field(None, max_length=1000)
-    
-    @validator('phone_number')
-    def validate_phone(cls, v):
-        if v:
-            cleaned = ''.join(filter(str.isdigit, v))
-            if len(cleaned) < 10:
-                raise ValueError('Phone number must contain at least 10 digits')
-            return cleaned
-        return v
 
 
 class ContactResponse(BaseModel):
@@ -44,8 +51,7 @@ class ContactResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, extra='ignore', defer_build=False)
 
 
 class ContactWithPropertiesResponse(ContactResponse):
@@ -59,6 +65,5 @@ class ContactSummaryResponse(BaseModel):
     phone_number: str
     properties_count: int
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, extra='ignore', defer_build=False)
 
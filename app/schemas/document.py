@@ -1,5 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List
+from datetime import datetime
 
 
 class DocumentResponse(BaseModel):
@@ -13,11 +14,10 @@ class DocumentResponse(BaseModel):
     upload_kind: str = "property_import"
     properties_count: int = 0
     contacts_count: int = 0
-    created_at: str
-    updated_at: str
+    created_at: datetime
+    updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, extra='ignore', defer_build=False)
 
 
 class DocumentUploadResponse(BaseModel):
@@ -37,4 +37,5 @@ class PaginatedDocumentsResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = None  # Opaque keyset cursor; pass back as ?cursor= for the next page
 
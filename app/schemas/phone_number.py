@@ -1,5 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
+from datetime import datetime
 
 
 class PhoneNumberResponse(BaseModel):
@@ -8,11 +9,10 @@ class PhoneNumberResponse(BaseModel):
     twilio_phone_number: str
     twilio_sid: str
     is_active: bool
-    created_at: str
-    updated_at: str
+    created_at: datetime
+    updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, extra='ignore', defer_build=False)
 
 
 class PhoneNumberUpdateRequest(BaseModel):
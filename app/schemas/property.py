@@ -1,5 +1,6 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, RootModel
 from typing import Optional, List
+from datetime import datetime
 
 
 class PropertyResponse(BaseModel):
@@ -20,12 +21,11 @@ class PropertyResponse(BaseModel):
     amenities: Optional[str] = None
     owner_name: Optional[str] = None
     owner_phone: str
-    is_available: str
-    created_at: str
-    updated_at: str
+    is_available: bool
+    created_at: datetime
+    updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, extra='ignore', defer_build=False, frozen=True)
 
 
 class PropertyCreateRequest(BaseModel):
@@ -42,7 +42,7 @@ class PropertyCreateRequest(BaseModel):
     amenities: Optional[str] = None
     owner_name: Optional[str] = None
     owner_phone: str = Field(..., min_length=10)
-    is_available: str = "true"
+    is_available: bool = True
     contact_id: Optional[str] = None  # Link to contact
 
 
@@ -60,13 +60,17 @@ class PropertyUpdateRequest(BaseModel):
     amenities: Optional[str] = None
     owner_name: Optional[str] = None
     owner_phone: Optional[str] = None
-    is_available: Optional[str] = None
+    is_available: Optional[bool] = None
     contact_id: Optional[str] = None  # Link to contact
 
 
+_PropListRoot = RootModel[List[PropertyResponse]]  # Serializes as a plain JSON array
+
+
 class PaginatedPropertiesResponse(BaseModel):
-    items: List[PropertyResponse]
+    items: _PropListRoot
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = None  # Opaque keyset cursor; pass back as ?cursor= for the next page
 
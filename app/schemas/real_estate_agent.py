@@ -1,5 +1,6 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 from typing import Optional
+from datetime import datetime
 
 
 class AgentSummaryStats(BaseModel):
@@ -18,12 +19,11 @@ class RealEstateAgentResponse(BaseModel):
     address: Optional[str] = None
     is_active: bool
     is_verified: bool
-    created_at: str
-    updated_at: str
+    created_at: datetime
+    updated_at: datetime
     stats: Optional[AgentSummaryStats] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, extra='ignore', defer_build=False)
 
 
 class RealEstateAgentUpdateRequest(BaseModel):
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Dict, List
 from datetime import datetime
 
@@ -31,8 +31,7 @@ class VoiceAgentRequestResponse(BaseModel):
     voice_agent_id: Optional[str] = None
     voice_agent_phone_number: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, extra='ignore', defer_build=False)
 
 
 class VoiceAgentResponse(BaseModel):
@@ -45,12 +44,11 @@ class VoiceAgentResponse(BaseModel):
     system_prompt: Optional[str] = None
     use_default_prompt: bool
     status: str  # 'active', 'inactive', 'pending_setup'
-    settings: Dict = Field(default_factory=dict)
-    created_at: str
-    updated_at: str
+    settings: Optional[Dict] = None  # Services always pass the stored JSON through
+    created_at: datetime
+    updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, extra='ignore', defer_build=False)
 
 
 class VoiceAgentUpdateRequest(BaseModel):
@@ -1,343 +1,364 @@
-from typing import Optional, List
-from sqlalchemy import select, func, desc
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Callable, Dict, Optional, List, Tuple
+from pydantic import TypeAdapter
+from sqlalchemy import select, func
 from app.database.connection import AsyncSessionLocal
 from app.models.real_estate_agent import RealEstateAgent
 from app.models.property import Property
 from app.models.document import Document
 from app.models.contact import Contact
 from app.models.phone_number import PhoneNumber
+from app.schemas.property import PropertyResponse
+from app.schemas.document import DocumentResponse
+from app.schemas.phone_number import PhoneNumberResponse
+from app.utils.pagination import next_cursor, paginate_latest_first
+from app.utils.serialization import price_text
 
 
-async def get_agent_full_details(agent_id: str) -> Optional[dict]:
-    """Get full details of an agent including all related data - OPTIMIZED with single session"""
-    # OPTIMIZATION: Use single session and batch queries
+# Built once at import; dump_python() runs pydantic's Rust serializer over the
+# whole list instead of FastAPI encoding row by row. Datetimes stay datetimes
+# and are formatted by orjson in the response
+_PROP_LIST_ADAPTER = TypeAdapter(List[PropertyResponse])
+_DOC_LIST_ADAPTER = TypeAdapter(List[DocumentResponse])
+
+# Rows pulled per server-side cursor fetch for the streamed (unpaginated) lists
+_STREAM_BATCH_SIZE = 500
+
+# Full-details payloads per agent_id -> (payload, data version it was loaded at,
+# cached_at), dropped by the agent/property/document/contact/phone services
+# whenever they write that agent's data
+_full_details_cache: Dict[str, Tuple[dict, int, datetime]] = {}
+_FULL_DETAILS_CACHE_TTL = timedelta(minutes=5)
+
+
+# Paginated list totals per (table, agent_id): page clicks reuse the count
+# instead of re-counting the agent's rows every time
+_count_cache: Dict[Tuple[str, str], Tuple[int, datetime]] = {}
+_COUNT_CACHE_TTL = timedelta(seconds=60)
+
+# Per-agent data version, bumped alongside the cache invalidation; the admin
+# controller turns it into an ETag. The epoch keeps versions from a previous
+# process (or another worker) from ever matching.
+_agent_versions: Dict[str, int] = {}
+_VERSION_EPOCH = uuid.uuid4().hex[:8]
+
+
+def invalidate_agent_full_details(agent_id: str) -> None:
+    """Drop the cached full details and list counts of an agent and bump its data version after its data changed"""
+    _full_details_cache.pop(agent_id, None)
+    _count_cache.pop((Property.__tablename__, agent_id), None)
+    _count_cache.pop((Document.__tablename__, agent_id), None)
+    _agent_versions[agent_id] = _agent_versions.get(agent_id, 0) + 1
+
+
+def get_agent_data_version(agent_id: str) -> str:
+    """Opaque token that changes whenever the agent's admin-visible data changes"""
+    return f"{_VERSION_EPOCH}-{_agent_versions.get(agent_id, 0)}"
+
+
+def clear_agent_full_details_cache() -> int:
+    """Drop every cached full-details payload and list count, returns how many entries were dropped"""
+    cleared = len(_full_details_cache) + len(_count_cache)
+    _full_details_cache.clear()
+    _count_cache.clear()
+    return cleared
+
+
+def get_agent_full_details_cache_info() -> dict:
+    """Size and TTL of the full-details cache"""
+    now = datetime.utcnow()
+    live = sum(1 for _, _, cached_at in _full_details_cache.values() if now - cached_at < _FULL_DETAILS_CACHE_TTL)
+    return {
+        "entries": len(_full_details_cache),
+        "live_entries": live,
+        "ttl_seconds": int(_FULL_DETAILS_CACHE_TTL.total_seconds()),
+    }
+
+
+# Column projections for the admin list views: rows come back as plain tuples,
+# so no ORM objects are built
+_PROPERTY_COLUMNS = (
+    Property.id,
+    Property.real_estate_agent_id,
+    Property.document_id,
+    Property.property_type,
+    Property.address,
+    Property.city,
+    Property.state,
+    Property.zip_code,
+    Property.price,
+    Property.bedrooms,
+    Property.bathrooms,
+    Property.square_feet,
+    Property.description,
+    Property.amenities,
+    Property.owner_name,
+    Property.owner_phone,
+    Property.is_available,
+    Property.created_at,
+    Property.updated_at,
+)
+
+_DOCUMENT_COLUMNS = (
+    Document.id,
+    Document.real_estate_agent_id,
+    Document.file_name,
+    Document.file_type,
+    Document.file_size,
+    Document.cloudinary_url,
+    Document.description,
+    Document.created_at,
+    Document.updated_at,
+)
+
+_AGENT_COLUMNS = (
+    RealEstateAgent.id,
+    RealEstateAgent.email,
+    RealEstateAgent.full_name,
+    RealEstateAgent.company_name,
+    RealEstateAgent.phone,
+    RealEstateAgent.address,
+    RealEstateAgent.is_active,
+    RealEstateAgent.is_verified,
+    RealEstateAgent.created_at,
+    RealEstateAgent.updated_at,
+)
+
+_PHONE_NUMBER_COLUMNS = (
+    PhoneNumber.id,
+    PhoneNumber.real_estate_agent_id,
+    PhoneNumber.twilio_phone_number,
+    PhoneNumber.twilio_sid,
+    PhoneNumber.is_active,
+    PhoneNumber.created_at,
+    PhoneNumber.updated_at,
+)
+
+_CONTACT_COLUMNS = (
+    Contact.id,
+    Contact.real_estate_agent_id,
+    Contact.name,
+    Contact.phone_number,
+    Contact.email,
+    Contact.notes,
+    Contact.created_at,
+    Contact.updated_at,
+)
+
+
+# DB -> response builders. These use model_construct(), which skips pydantic
+# validation: only ever feed them rows loaded from our own database, never
+# request data.
+
+def _property_response(row) -> PropertyResponse:
+    # Price formatted here rather than in SQL: to_char only exists on Postgres
+    return PropertyResponse.model_construct(**{**row._mapping, "price": price_text(row.price)})
+
+
+def _document_response(row) -> DocumentResponse:
+    return DocumentResponse.model_construct(**row._mapping)
+
+
+def _phone_number_response(row) -> PhoneNumberResponse:
+    return PhoneNumberResponse.model_construct(**row._mapping)
+
+
+async def _fetch_all(stmt) -> list:
+    """Run a SELECT in its own session so several can be awaited concurrently"""
     async with AsyncSessionLocal() as session:
-        # Get agent
-        agent_stmt = select(RealEstateAgent).where(RealEstateAgent.id == agent_id)
-        agent_result = await session.execute(agent_stmt)
-        agent_obj = agent_result.scalar_one_or_none()
-        
-        if not agent_obj:
-            return None
-        
-        agent = {
-            "id": agent_obj.id,
-            "email": agent_obj.email,
-            "full_name": agent_obj.full_name,
-            "company_name": agent_obj.company_name,
-            "phone": agent_obj.phone,
-            "address": agent_obj.address,
-            "is_active": agent_obj.is_active,
-            "is_verified": agent_obj.is_verified,
-            "created_at": agent_obj.created_at.isoformat() if agent_obj.created_at else "",
-            "updated_at": agent_obj.updated_at.isoformat() if agent_obj.updated_at else "",
-        }
-        
-        # Get all related data in same session (faster than multiple sessions)
-        properties_stmt = select(Property).where(Property.real_estate_agent_id == agent_id)
-        documents_stmt = select(Document).where(Document.real_estate_agent_id == agent_id)
-        phone_stmt = select(PhoneNumber).where(
-            PhoneNumber.real_estate_agent_id == agent_id,
-            PhoneNumber.is_active == True
-        )
-        
-        # Execute queries sequentially but in same session (avoids multiple session overhead)
-        properties_result = await session.execute(properties_stmt)
-        documents_result = await session.execute(documents_stmt)
-        phone_result = await session.execute(phone_stmt)
-        
-        # Process properties
-        props = properties_result.scalars().all()
-        properties = [
-            {
-                "id": prop.id,
-                "real_estate_agent_id": prop.real_estate_agent_id,
-                "document_id": prop.document_id,
-                "property_type": prop.property_type,
-                "address": prop.address,
-                "city": prop.city,
-                "state": prop.state,
-                "zip_code": prop.zip_code,
-                "price": str(prop.price) if prop.price else None,
-                "bedrooms": prop.bedrooms,
-                "bathrooms": prop.bathrooms,
-                "square_feet": prop.square_feet,
-                "description": prop.description,
-                "amenities": prop.amenities,
-                "owner_name": prop.owner_name,
-                "owner_phone": prop.owner_phone,
-                "is_available": prop.is_available,
-                "created_at": prop.created_at.isoformat() if prop.created_at else "",
-                "updated_at": prop.updated_at.isoformat() if prop.updated_at else "",
-            }
-            for prop in props
-        ]
-        
-        # Process documents
-        docs = documents_result.scalars().all()
-        documents = [
-            {
-                "id": doc.id,
-                "real_estate_agent_id": doc.real_estate_agent_id,
-                "file_name": doc.file_name,
-                "file_type": doc.file_type,
-                "file_size": doc.file_size,
-                "cloudinary_url": doc.cloudinary_url,
-                "description": doc.description,
-                "created_at": doc.created_at.isoformat() if doc.created_at else "",
-                "updated_at": doc.updated_at.isoformat() if doc.updated_at else "",
-            }
-            for doc in docs
-        ]
-        
-        # Process phone number
-        phone_obj = phone_result.scalar_one_or_none()
-        phone_number = None
-        if phone_obj:
-            phone_number = {
-                "id": phone_obj.id,
-                "real_estate_agent_id": phone_obj.real_estate_agent_id,
-                "twilio_phone_number": phone_obj.twilio_phone_number,
-                "twilio_sid": phone_obj.twilio_sid,
-                "is_active": phone_obj.is_active,
-                "created_at": phone_obj.created_at.isoformat() if phone_obj.created_at else "",
-                "updated_at": phone_obj.updated_at.isoformat() if phone_obj.updated_at else "",
-            }
-        
-        # Get contacts
-        contacts_stmt = select(Contact).where(Contact.real_estate_agent_id == agent_id)
-        contacts_result = await session.execute(contacts_stmt)
-        contacts_objs = contacts_result.scalars().all()
-        contacts = [
-            {
-                "id": c.id,
-                "real_estate_agent_id": c.real_estate_agent_id,
-                "name": c.name,
-                "phone_number": c.phone_number,
-                "email": c.email,
-                "notes": c.notes,
-                "created_at": c.created_at.isoformat() if c.created_at else "",
-                "updated_at": c.updated_at.isoformat() if c.updated_at else "",
-            }
-            for c in contacts_objs
-        ]
-        
-        return {
-            "agent": agent,
-            "properties": properties,
-            "documents": documents,
-            "phone_number": phone_number,
-            "contacts": contacts,
-        }
+        result = await session.execute(stmt)
+        return result.all()
+
+
+async def _cached_count(model, agent_id: str) -> int:
+    """Number of the agent's rows in model's table, cached for _COUNT_CACHE_TTL"""
+    key = (model.__tablename__, agent_id)
+    entry = _count_cache.get(key)
+    if entry and datetime.utcnow() - entry[1] < _COUNT_CACHE_TTL:
+        return entry[0]
+    
+    version = _agent_versions.get(agent_id, 0)
+    count_stmt = select(func.count()).select_from(model).where(model.real_estate_agent_id == agent_id)
+    rows = await _fetch_all(count_stmt)
+    total = rows[0][0] or 0
+    # Same as the full details: a count raced by a write isn't cached
+    if _agent_versions.get(agent_id, 0) == version:
+        _count_cache[key] = (total, datetime.utcnow())
+    return total
+
+
+async def _stream_all(stmt, serialize: Callable) -> list:
+    """Like _fetch_all, but serialize rows batch by batch as they arrive"""
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(stmt.execution_options(yield_per=_STREAM_BATCH_SIZE))
+        return [serialize(row) async for row in result]
+
+
+async def get_agent_full_details(agent_id: str) -> Optional[dict]:
+    """Get full details of an agent including all related data - OPTIMIZED, cached for 5 minutes
+
+    Returns plain dicts and lists, ready for ORJSONResponse (datetimes are left to orjson).
+    The dict may be shared with other requests through the cache: don't mutate it.
+    """
+    version = _agent_versions.get(agent_id, 0)
+    entry = _full_details_cache.get(agent_id)
+    if entry and entry[1] == version and datetime.utcnow() - entry[2] < _FULL_DETAILS_CACHE_TTL:
+        return entry[0]
+    
+    details = await _load_agent_full_details(agent_id)
+    # A write during the load may not be in `details`: only cache it if none happened
+    if details is not None and _agent_versions.get(agent_id, 0) == version:
+        _full_details_cache[agent_id] = (details, version, datetime.utcnow())
+    return details
 
 
-async def get_agent_properties_for_admin(agent_id: str) -> Optional[List[dict]]:
-    """Get all properties for an agent (admin view) - OPTIMIZED"""
+async def _load_agent_full_details(agent_id: str) -> Optional[dict]:
+    """Uncached get_agent_full_details"""
+    # OPTIMIZATION: The five queries are independent, so run them concurrently.
+    # An AsyncSession can't multiplex statements, hence one session (and pooled
+    # connection) per query: one round-trip of latency instead of five.
+    agent_stmt = select(*_AGENT_COLUMNS).where(RealEstateAgent.id == agent_id)
+    properties_stmt = select(*_PROPERTY_COLUMNS).where(Property.real_estate_agent_id == agent_id)
+    documents_stmt = select(*_DOCUMENT_COLUMNS).where(Document.real_estate_agent_id == agent_id)
+    phone_stmt = select(*_PHONE_NUMBER_COLUMNS).where(
+        PhoneNumber.real_estate_agent_id == agent_id,
+        PhoneNumber.is_active == True
+    )
+    contacts_stmt = select(*_CONTACT_COLUMNS).where(Contact.real_estate_agent_id == agent_id)
+    
+    # The potentially large lists are streamed and serialized per batch, so the
+    # raw row tuples never pile up alongside the serialized output.
+    agent_rows, props, docs, phones, contacts = await asyncio.gather(
+        _fetch_all(agent_stmt),
+        _stream_all(properties_stmt, _property_response),
+        _stream_all(documents_stmt, _document_response),
+        _fetch_all(phone_stmt),
+        _stream_all(contacts_stmt, lambda c: dict(c._mapping)),
+    )
+    
+    if not agent_rows:
+        return None
+    agent = dict(agent_rows[0]._mapping)
+    
+    # Process properties
+    properties = _PROP_LIST_ADAPTER.dump_python(props)
+    
+    # Process documents
+    documents = _DOC_LIST_ADAPTER.dump_python(docs)
+    
+    # Process phone number
+    phone_number = _phone_number_response(phones[0]).model_dump() if phones else None
+    
+    return {
+        "agent": agent,
+        "properties": properties,
+        "documents": documents,
+        "phone_number": phone_number,
+        "contacts": contacts,
+    }
+
+
+async def get_agent_properties_for_admin(agent_id: str) -> AsyncIterator[PropertyResponse]:
+    """Stream all properties for an agent (admin view) - OPTIMIZED, rows fetched in batches"""
     # OPTIMIZATION: Skip agent verification - if agent doesn't exist, properties will be empty anyway
     # This saves one database query per request
     async with AsyncSessionLocal() as session:
-        stmt = select(Property).where(Property.real_estate_agent_id == agent_id)
-        result = await session.execute(stmt)
-        props = result.scalars().all()
-        
-        return [
-            {
-                "id": prop.id,
-                "real_estate_agent_id": prop.real_estate_agent_id,
-                "document_id": prop.document_id,
-                "property_type": prop.property_type,
-                "address": prop.address,
-                "city": prop.city,
-                "state": prop.state,
-                "zip_code": prop.zip_code,
-                "price": str(prop.price) if prop.price else None,
-                "bedrooms": prop.bedrooms,
-                "bathrooms": prop.bathrooms,
-                "square_feet": prop.square_feet,
-                "description": prop.description,
-                "amenities": prop.amenities,
-                "owner_name": prop.owner_name,
-                "owner_phone": prop.owner_phone,
-                "is_available": prop.is_available,
-                "created_at": prop.created_at.isoformat() if prop.created_at else "",
-                "updated_at": prop.updated_at.isoformat() if prop.updated_at else "",
-            }
-            for prop in props
-        ]
+        stmt = (
+            select(*_PROPERTY_COLUMNS)
+            .where(Property.real_estate_agent_id == agent_id)
+            .execution_options(yield_per=_STREAM_BATCH_SIZE)
+        )
+        result = await session.stream(stmt)
+        async for row in result:
+            yield _property_response(row)
 
 
 async def get_agent_properties_paginated_for_admin(
     agent_id: str,
     page: int = 1,
-    page_size: int = 16
-) -> Optional[tuple[List[dict], int]]:
-    """Get paginated properties for an agent (admin view)"""
-    async with AsyncSessionLocal() as session:
-        # Base query
-        base_stmt = select(Property).where(Property.real_estate_agent_id == agent_id)
-        
-        # Total count
-        count_stmt = select(func.count()).select_from(Property).where(Property.real_estate_agent_id == agent_id)
-        count_result = await session.execute(count_stmt)
-        total = count_result.scalar_one() or 0
-        
-        # Paginated query, latest first
-        stmt = (
-            base_stmt
-            .order_by(desc(Property.created_at))
-            .offset(max(page - 1, 0) * page_size)
-            .limit(page_size)
-        )
-        result = await session.execute(stmt)
-        props = result.scalars().all()
-        
-        items = [
-            {
-                "id": prop.id,
-                "real_estate_agent_id": prop.real_estate_agent_id,
-                "document_id": prop.document_id,
-                "property_type": prop.property_type,
-                "address": prop.address,
-                "city": prop.city,
-                "state": prop.state,
-                "zip_code": prop.zip_code,
-                "price": str(prop.price) if prop.price else None,
-                "bedrooms": prop.bedrooms,
-                "bathrooms": prop.bathrooms,
-                "square_feet": prop.square_feet,
-                "description": prop.description,
-                "amenities": prop.amenities,
-                "owner_name": prop.owner_name,
-                "owner_phone": prop.owner_phone,
-                "is_available": prop.is_available,
-                "created_at": prop.created_at.isoformat() if prop.created_at else "",
-                "updated_at": prop.updated_at.isoformat() if prop.updated_at else "",
-            }
-            for prop in props
-        ]
-        
-        return items, total
+    page_size: int = 16,
+    cursor: Optional[str] = None
+) -> Optional[tuple[List[dict], int, Optional[str]]]:
+    """Get paginated properties for an agent (admin view), rows as plain dicts"""
+    # Base query
+    base_stmt = select(*_PROPERTY_COLUMNS).where(Property.real_estate_agent_id == agent_id)
+    
+    # Paginated query, latest first (keyset when the caller passes a cursor)
+    stmt = paginate_latest_first(base_stmt, Property, page, page_size, cursor)
+    
+    # Count (usually cached) and page are independent: one round-trip of latency instead of two
+    total, props = await asyncio.gather(_cached_count(Property, agent_id), _fetch_all(stmt))
+    
+    items = _PROP_LIST_ADAPTER.dump_python(
+        [_property_response(prop) for prop in props]
+    )
+    
+    return items, total, next_cursor(props, page_size)
 
 
-async def get_agent_documents_for_admin(agent_id: str) -> Optional[List[dict]]:
-    """Get all documents for an agent (admin view) - OPTIMIZED"""
+async def get_agent_documents_for_admin(agent_id: str) -> AsyncIterator[DocumentResponse]:
+    """Stream all documents for an agent (admin view) - OPTIMIZED, rows fetched in batches"""
     # OPTIMIZATION: Skip agent verification - saves one query
     async with AsyncSessionLocal() as session:
-        stmt = select(Document).where(Document.real_estate_agent_id == agent_id)
-        result = await session.execute(stmt)
-        docs = result.scalars().all()
-        
-        return [
-            {
-                "id": doc.id,
-                "real_estate_agent_id": doc.real_estate_agent_id,
-                "file_name": doc.file_name,
-                "file_type": doc.file_type,
-                "file_size": doc.file_size,
-                "cloudinary_url": doc.cloudinary_url,
-                "description": doc.description,
-                "created_at": doc.created_at.isoformat() if doc.created_at else "",
-                "updated_at": doc.updated_at.isoformat() if doc.updated_at else "",
-            }
-            for doc in docs
-        ]
+        stmt = (
+            select(*_DOCUMENT_COLUMNS)
+            .where(Document.real_estate_agent_id == agent_id)
+            .execution_options(yield_per=_STREAM_BATCH_SIZE)
+        )
+        result = await session.stream(stmt)
+        async for row in result:
+            yield _document_response(row)
 
 
 async def get_agent_documents_paginated_for_admin(
     agent_id: str,
     page: int = 1,
-    page_size: int = 16
-) -> Optional[tuple[List[dict], int]]:
-    """Get paginated documents for an agent (admin view)"""
-    async with AsyncSessionLocal() as session:
-        # Base query
-        base_stmt = select(Document).where(Document.real_estate_agent_id == agent_id)
-        
-        # Total count
-        count_stmt = select(func.count()).select_from(Document).where(Document.real_estate_agent_id == agent_id)
-        count_result = await session.execute(count_stmt)
-        total = count_result.scalar_one() or 0
-        
-        # Paginated query, latest first
-        stmt = (
-            base_stmt
-            .order_by(desc(Document.created_at))
-            .offset(max(page - 1, 0) * page_size)
-            .limit(page_size)
-        )
-        result = await session.execute(stmt)
-        docs = result.scalars().all()
-        
-        items = [
-            {
-                "id": doc.id,
-                "real_estate_agent_id": doc.real_estate_agent_id,
-                "file_name": doc.file_name,
-                "file_type": doc.file_type,
-                "file_size": doc.file_size,
-                "cloudinary_url": doc.cloudinary_url,
-                "description": doc.description,
-                "created_at": doc.created_at.isoformat() if doc.created_at else "",
-                "updated_at": doc.updated_at.isoformat() if doc.updated_at else "",
-            }
-            for doc in docs
-        ]
-        
-        return items, total
+    page_size: int = 16,
+    cursor: Optional[str] = None
+) -> Optional[tuple[List[dict], int, Optional[str]]]:
+    """Get paginated documents for an agent (admin view), rows as plain dicts"""
+    # Base query
+    base_stmt = select(*_DOCUMENT_COLUMNS).where(Document.real_estate_agent_id == agent_id)
+    
+    # Paginated query, latest first (keyset when the caller passes a cursor)
+    stmt = paginate_latest_first(base_stmt, Document, page, page_size, cursor)
+    
+    # Count (usually cached) and page are independent: one round-trip of latency instead of two
+    total, docs = await asyncio.gather(_cached_count(Document, agent_id), _fetch_all(stmt))
+    
+    items = _DOC_LIST_ADAPTER.dump_python(
+        [_document_response(doc) for doc in docs]
+    )
+    
+    return items, total, next_cursor(docs, page_size)
 
 
-async def get_agent_contacts_for_admin(agent_id: str) -> Optional[List[dict]]:
-    """Get all contacts for an agent (admin view)"""
+async def get_agent_contacts_for_admin(agent_id: str) -> List[dict]:
+    """Get all contacts for an agent (admin view) - OPTIMIZED"""
+    # OPTIMIZATION: Skip agent verification - if agent doesn't exist, contacts will be empty anyway
     async with AsyncSessionLocal() as session:
-        # Verify agent exists
-        agent_stmt = select(RealEstateAgent).where(RealEstateAgent.id == agent_id)
-        agent_result = await session.execute(agent_stmt)
-        agent = agent_result.scalar_one_or_none()
-        
-        if not agent:
-            return None
-        
         # Get all contacts for this agent
-        contacts_stmt = select(Contact).where(Contact.real_estate_agent_id == agent_id)
+        contacts_stmt = select(*_CONTACT_COLUMNS).where(Contact.real_estate_agent_id == agent_id)
         contacts_result = await session.execute(contacts_stmt)
-        contacts = contacts_result.scalars().all()
         
-        return [
-            {
-                "id": contact.id,
-                "real_estate_agent_id": contact.real_estate_agent_id,
-                "name": contact.name,
-                "phone_number": contact.phone_number,
-                "email": contact.email,
-                "notes": contact.notes,
-                "created_at": contact.created_at.isoformat() if contact.created_at else "",
-                "updated_at": contact.updated_at.isoformat() if contact.updated_at else "",
-            }
-            for contact in contacts
-        ]
-
-
-async def get_agent_phone_number_for_admin(agent_id: str) -> Optional[dict]:
+        return [dict(row) for row in contacts_result.mappings()]
+
+
+async def get_agent_phone_number_for_admin(agent_id: str) -> Optional[PhoneNumberResponse]:
     """Get phone number for an agent (admin view) - OPTIMIZED"""
     # OPTIMIZATION: Skip agent verification - saves one query
     async with AsyncSessionLocal() as session:
-        stmt = select(PhoneNumber).where(
+        stmt = select(*_PHONE_NUMBER_COLUMNS).where(
             PhoneNumber.real_estate_agent_id == agent_id,
             PhoneNumber.is_active == True
         )
         result = await session.execute(stmt)
-        phone = result.scalar_one_or_none()
+        phone = result.one_or_none()
         
         if not phone:
             return None
         
-        return {
-            "id": phone.id,
-            "real_estate_agent_id": phone.real_estate_agent_id,
-            "twilio_phone_number": phone.twilio_phone_number,
-            "twilio_sid": phone.twilio_sid,
-            "is_active": phone.is_active,
-            "created_at": phone.created_at.isoformat() if phone.created_at else "",
-            "updated_at": phone.updated_at.isoformat() if phone.updated_at else "",
-        }
+        return _phone_number_response(phone)
 
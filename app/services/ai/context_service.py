@@ -2,19 +2,53 @@
 Context Service - Build rich context for LLM responses
 Reads database to provide context, but performs NO writes
 """
-from typing import Dict, List, Optional
-from sqlalchemy import select, and_, or_, func as sa_func
-from sqlalchemy.orm import selectinload
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import select, and_, true, func as sa_func
+from sqlalchemy.orm import raiseload, selectinload
 from app.database.connection import AsyncSessionLocal
-from app.models.contact import Contact
+from app.models.contact import Contact, phone_last10
 from app.models.property import Property
 from app.models.voice_agent import VoiceAgent
 from app.models.real_estate_agent import RealEstateAgent
 from app.models.showing import Showing
+from app.services.ai.prompt_service import (
+    format_properties_toon,
+    spoken_address,
+    OUTBOUND_PROPERTY_COLUMNS,
+    INBOUND_PROPERTY_COLUMNS,
+)
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Inbound context minus the caller lookup: (agent_id, voice_agent_id) -> (context, cached_at).
+# Listings change at human cadence while a busy line rings far more often
+_inbound_cache: Dict[Tuple[str, str], Tuple[Dict, datetime]] = {}
+_inbound_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+_INBOUND_CACHE_TTL = timedelta(seconds=60)
+
+
+def invalidate_inbound_context(real_estate_agent_id: str) -> None:
+    """Drop cached inbound context for an agent; call after property, agent or voice agent writes."""
+    for key in [k for k in _inbound_cache if k[0] == real_estate_agent_id]:
+        _inbound_cache.pop(key, None)
+
+
+async def _fetch_one(stmt):
+    """Run a single-entity SELECT in its own session so several can be awaited concurrently"""
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(stmt)
+        return result.scalar_one_or_none()
+
+
+async def _fetch_all(stmt) -> list:
+    """Run a SELECT in its own session so several can be awaited concurrently"""
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(stmt)
+        return result.scalars().all()
+
 
 async def build_outbound_context(
     contact_id: str,
@@ -27,135 +61,226 @@ async def build_outbound_context(
     NO DATABASE WRITES - READ ONLY
     """
     try:
-        async with AsyncSessionLocal() as session:
-            # Get contact with properties
-            contact_stmt = (
-                select(Contact)
-                .where(
-                    and_(
-                        Contact.id == contact_id,
-                        Contact.real_estate_agent_id == real_estate_agent_id
-                    )
-                )
-            )
-            contact_result = await session.execute(contact_stmt)
-            contact = contact_result.scalar_one_or_none()
-            
-            if not contact:
-                logger.warning(f"⚠️ Contact not found: {contact_id}")
-                return {"error": "Contact not found"}
-            
-            # Get contact's properties
-            properties_stmt = select(Property).where(
+        # The four reads are independent (properties are keyed on the contact_id
+        # argument, not the loaded row), so issue them concurrently, one session each
+        contact_stmt = (
+            select(Contact)
+            .options(raiseload('*'))
+            .where(
                 and_(
-                    Property.contact_id == contact_id,
-                    Property.real_estate_agent_id == real_estate_agent_id
+                    Contact.id == contact_id,
+                    Contact.real_estate_agent_id == real_estate_agent_id
                 )
             )
-            properties_result = await session.execute(properties_stmt)
-            properties = properties_result.scalars().all()
-            
-            # Get voice agent (with its Twilio phone number for notifications)
-            voice_agent_stmt = (
-                select(VoiceAgent)
-                .options(selectinload(VoiceAgent.phone_number))
-                .where(VoiceAgent.id == voice_agent_id)
+        )
+        # Contact's properties
+        properties_stmt = select(Property).options(raiseload('*')).where(
+            and_(
+                Property.contact_id == contact_id,
+                Property.real_estate_agent_id == real_estate_agent_id
             )
-            voice_agent_result = await session.execute(voice_agent_stmt)
-            voice_agent = voice_agent_result.scalar_one_or_none()
-            
-            # Get real estate agent
-            agent_stmt = select(RealEstateAgent).where(
-                RealEstateAgent.id == real_estate_agent_id
-            )
-            agent_result = await session.execute(agent_stmt)
-            agent = agent_result.scalar_one_or_none()
-            
-            # Format properties for context (include id for showing creation)
-            properties_list = []
-            for prop in properties:
-                prop_info = {
-                    "id": prop.id,
-                    "address": prop.address,
-                    "city": prop.city or "",
-                    "state": prop.state or "",
-                    "property_type": prop.property_type or "Property",
-                    "price": f"${prop.price:,.0f}" if prop.price else "Price not set",
-                    "bedrooms": prop.bedrooms,
-                    "bathrooms": prop.bathrooms,
-                    "square_feet": prop.square_feet,
-                    "is_available": prop.is_available == "true",
-                    "description": prop.description or "",
-                    "amenities": prop.amenities or ""
-                }
-                properties_list.append(prop_info)
-            
-            # Format properties text for prompt
-            properties_text = ""
-            if properties_list:
-                for i, prop in enumerate(properties_list, 1):
-                    properties_text += f"\nProperty {i}:"
-                    properties_text += f"\n  Address: {prop['address']}"
-                    if prop['city']:
-                        properties_text += f", {prop['city']}"
-                    if prop['state']:
-                        properties_text += f", {prop['state']}"
-                    properties_text += f"\n  Type: {prop['property_type']}"
-                    properties_text += f"\n  Price: {prop['price']}"
-                    if prop['bedrooms']:
-                        properties_text += f"\n  Bedrooms: {prop['bedrooms']}"
-                    if prop['bathrooms']:
-                        properties_text += f"\n  Bathrooms: {prop['bathrooms']}"
-                    if prop['square_feet']:
-                        properties_text += f"\n  Square Feet: {prop['square_feet']}"
-                    properties_text += f"\n  Available: {'Yes' if prop['is_available'] else 'No'}"
-                    if prop['description']:
-                        properties_text += f"\n  Description: {prop['description']}"
-                    if prop['amenities']:
-                        properties_text += f"\n  Amenities: {prop['amenities']}"
-            else:
-                properties_text = "No properties linked to this contact."
-            
-            va_twilio_phone = ""
-            if voice_agent and voice_agent.phone_number:
-                va_twilio_phone = voice_agent.phone_number.twilio_phone_number or ""
+        )
+        # Voice agent (with its Twilio phone number for notifications)
+        voice_agent_stmt = (
+            select(VoiceAgent)
+            .options(selectinload(VoiceAgent.phone_number), raiseload('*'))
+            .where(VoiceAgent.id == voice_agent_id)
+        )
+        # Real estate agent
+        agent_stmt = select(RealEstateAgent).options(raiseload('*')).where(
+            RealEstateAgent.id == real_estate_agent_id
+        )
+        
+        contact, properties, voice_agent, agent = await asyncio.gather(
+            _fetch_one(contact_stmt),
+            _fetch_all(properties_stmt),
+            _fetch_one(voice_agent_stmt),
+            _fetch_one(agent_stmt),
+        )
+        
+        if not contact:
+            logger.warning(f"⚠️ Contact not found: {contact_id}")
+            return {"error": "Contact not found"}
+        
+        # Format properties for context (include id for showing creation)
+        properties_list = []
+        for prop in properties:
+            prop_info = {
+                "id": prop.id,
+                "address": prop.address,
+                "city": prop.city or "",
+                "state": prop.state or "",
+                "property_type": prop.property_type or "Property",
+                "price": f"${prop.price:,.0f}" if prop.price else "Price not set",
+                "bedrooms": prop.bedrooms,
+                "bathrooms": prop.bathrooms,
+                "square_feet": prop.square_feet,
+                "is_available": prop.is_available,
+                "description": prop.description or "",
+                "amenities": prop.amenities or ""
+            }
+            properties_list.append(prop_info)
+        
+        # Format properties text for prompt (column names once, one row per property)
+        if properties_list:
+            properties_text = format_properties_toon(properties_list, OUTBOUND_PROPERTY_COLUMNS)
+        else:
+            properties_text = "No properties linked to this contact."
+        
+        va_twilio_phone = ""
+        if voice_agent and voice_agent.phone_number:
+            va_twilio_phone = voice_agent.phone_number.twilio_phone_number or ""
 
-            va_settings = {}
-            if voice_agent and voice_agent.settings:
-                va_settings = voice_agent.settings if isinstance(voice_agent.settings, dict) else {}
+        va_settings = {}
+        if voice_agent and voice_agent.settings:
+            va_settings = voice_agent.settings if isinstance(voice_agent.settings, dict) else {}
 
-            context = {
-                "contact": {
-                    "id": contact.id,
-                    "name": contact.name,
-                    "phone_number": contact.phone_number,
-                    "email": contact.email or "",
-                    "notes": contact.notes or ""
-                },
-                "properties": properties_list,
-                "properties_text": properties_text,
-                "property_count": len(properties_list),
-                "voice_agent": {
-                    "name": voice_agent.name if voice_agent else "Property Assistant",
-                    "system_prompt": voice_agent.system_prompt if voice_agent else "",
-                    "phone_number": va_twilio_phone,
-                    "settings": va_settings,
-                },
-                "real_estate_agent": {
-                    "name": agent.full_name if agent else "",
-                    "company_name": agent.company_name or "Independent Agent" if agent else "",
-                    "address": agent.address or "" if agent else ""
-                }
+        context = {
+            "contact": {
+                "id": contact.id,
+                "name": contact.name,
+                "phone_number": contact.phone_number,
+                "email": contact.email or "",
+                "notes": contact.notes or ""
+            },
+            "properties": properties_list,
+            "properties_text": properties_text,
+            "property_count": len(properties_list),
+            "voice_agent": {
+                "name": voice_agent.name if voice_agent else "Property Assistant",
+                "system_prompt": voice_agent.system_prompt if voice_agent else "",
+                "phone_number": va_twilio_phone,
+                "settings": va_settings,
+            },
+            "real_estate_agent": {
+                "name": agent.full_name if agent else "",
+                "company_name": agent.company_name or "Independent Agent" if agent else "",
+                "address": agent.address or "" if agent else "",
+                # Read aloud in the prompts; computed once per call instead of per turn
+                "address_spoken": spoken_address(agent.address) if agent else "",
             }
-            
-            logger.info(f"✅ Built outbound context for contact {contact_id} - {len(properties_list)} properties, va_phone={va_twilio_phone}")
-            return context
-            
+        }
+        
+        logger.info(f"✅ Built outbound context for contact {contact_id} - {len(properties_list)} properties, va_phone={va_twilio_phone}")
+        return context
+        
     except Exception as e:
         logger.error(f"❌ Error building outbound context: {str(e)}", exc_info=True)
         return {"error": f"Failed to build context: {str(e)}"}
 
 
+async def _load_inbound_base(real_estate_agent_id: str, voice_agent_id: str) -> Dict:
+    """Caller-independent part of the inbound context: voice agent, agent and available properties"""
+    # Get voice agent (with phone number for SMS notifications)
+    voice_agent_stmt = (
+        select(VoiceAgent)
+        .options(selectinload(VoiceAgent.phone_number), raiseload('*'))
+        .where(VoiceAgent.id == voice_agent_id)
+    )
+    # Get real estate agent
+    agent_stmt = select(RealEstateAgent).options(raiseload('*')).where(
+        RealEstateAgent.id == real_estate_agent_id
+    )
+    # Get all available properties for this agent
+    properties_stmt = select(Property).options(raiseload('*')).where(
+        and_(
+            Property.real_estate_agent_id == real_estate_agent_id,
+            Property.is_available == true()
+        )
+    )
+    
+    voice_agent, agent, properties = await asyncio.gather(
+        _fetch_one(voice_agent_stmt),
+        _fetch_one(agent_stmt),
+        _fetch_all(properties_stmt),
+    )
+    
+    # Format properties for context
+    properties_list = []
+    for prop in properties:
+        prop_info = {
+            "id": prop.id,
+            "address": prop.address,
+            "city": prop.city or "",
+            "state": prop.state or "",
+            "property_type": prop.property_type or "Property",
+            "price": f"${prop.price:,.0f}" if prop.price else "Price not set",
+            "bedrooms": prop.bedrooms,
+            "bathrooms": prop.bathrooms,
+            "square_feet": prop.square_feet,
+            "description": prop.description or "",
+            "amenities": prop.amenities or ""
+        }
+        properties_list.append(prop_info)
+    
+    # Group properties by type and city for easier reference
+    properties_by_type = {}
+    properties_by_city = {}
+    for prop in properties_list:
+        prop_type = prop['property_type']
+        city = prop['city'] or "Unknown"
+        
+        if prop_type not in properties_by_type:
+            properties_by_type[prop_type] = []
+        properties_by_type[prop_type].append(prop)
+        
+        if city not in properties_by_city:
+            properties_by_city[city] = []
+        properties_by_city[city].append(prop)
+    
+    # Format properties summary for prompt
+    if properties_list:
+        properties_summary = format_properties_toon(properties_list[:20], INBOUND_PROPERTY_COLUMNS)  # Limit to 20 for prompt size
+        if len(properties_list) > 20:
+            properties_summary += f"\n... and {len(properties_list) - 20} more properties"
+    else:
+        properties_summary = "No available properties at this time."
+    
+    voice_agent_phone = ""
+    if voice_agent and voice_agent.phone_number:
+        voice_agent_phone = voice_agent.phone_number.twilio_phone_number or ""
+
+    va_settings = {}
+    if voice_agent and voice_agent.settings:
+        va_settings = voice_agent.settings if isinstance(voice_agent.settings, dict) else {}
+
+    return {
+        "voice_agent": {
+            "name": voice_agent.name if voice_agent else "Property Assistant",
+            "system_prompt": voice_agent.system_prompt if voice_agent else "",
+            "phone_number": voice_agent_phone,
+            "settings": va_settings,
+        },
+        "real_estate_agent": {
+            "name": agent.full_name if agent else "",
+            "company_name": agent.company_name or "Independent Agent" if agent else "",
+        },
+        "properties": properties_list,
+        "properties_summary": properties_summary,
+        "properties_by_type": properties_by_type,
+        "properties_by_city": properties_by_city,
+        "total_properties": len(properties_list),
+    }
+
+
+async def _get_inbound_base(real_estate_agent_id: str, voice_agent_id: str) -> Dict:
+    """Cached _load_inbound_base; one load per key at a time, concurrent rings wait for it"""
+    key = (real_estate_agent_id, voice_agent_id)
+    entry = _inbound_cache.get(key)
+    if entry and datetime.utcnow() - entry[1] < _INBOUND_CACHE_TTL:
+        return entry[0]
+    
+    lock = _inbound_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        # Another ring may have filled it while we waited
+        entry = _inbound_cache.get(key)
+        if entry and datetime.utcnow() - entry[1] < _INBOUND_CACHE_TTL:
+            return entry[0]
+        base = await _load_inbound_base(real_estate_agent_id, voice_agent_id)
+        _inbound_cache[key] = (base, datetime.utcnow())
+        return base
+
+
 async def build_inbound_context(
     real_estate_agent_id: str,
     voice_agent_id: str,
@@ -168,167 +293,57 @@ async def build_inbound_context(
     NO DATABASE WRITES - READ ONLY
     """
     try:
-        async with AsyncSessionLocal() as session:
-            # Get voice agent (with phone number for SMS notifications)
-            voice_agent_stmt = (
-                select(VoiceAgent)
-                .options(selectinload(VoiceAgent.phone_number))
-                .where(VoiceAgent.id == voice_agent_id)
-            )
-            voice_agent_result = await session.execute(voice_agent_stmt)
-            voice_agent = voice_agent_result.scalar_one_or_none()
-            
-            # Get real estate agent
-            agent_stmt = select(RealEstateAgent).where(
-                RealEstateAgent.id == real_estate_agent_id
-            )
-            agent_result = await session.execute(agent_stmt)
-            agent = agent_result.scalar_one_or_none()
-            
-            # Get all available properties for this agent
-            properties_stmt = select(Property).where(
-                and_(
-                    Property.real_estate_agent_id == real_estate_agent_id,
-                    Property.is_available == "true"
-                )
-            )
-            properties_result = await session.execute(properties_stmt)
-            properties = properties_result.scalars().all()
-            
-            # Check if caller is an existing contact
-            caller_contact = None
-            if caller_phone:
-                # Normalize phone number for lookup
-                normalized_phone = caller_phone.strip().replace(" ", "").replace("-", "")
-                if not normalized_phone.startswith("+"):
-                    if normalized_phone.startswith("92"):
-                        normalized_phone = "+" + normalized_phone
-                    elif normalized_phone.startswith("0"):
-                        normalized_phone = "+92" + normalized_phone[1:]
-                
-                contact_stmt = select(Contact).where(
+        # Agent, voice agent and listings come from a short-lived cache; the
+        # caller lookup below always runs live
+        base = await _get_inbound_base(real_estate_agent_id, voice_agent_id)
+        properties_list = base["properties"]
+        
+        caller_contact = None
+        caller_history = None
+        if caller_phone:
+            async with AsyncSessionLocal() as session:
+                # Equality on the indexed last-10-digits key, whatever format the caller ID uses
+                contact_stmt = select(Contact).options(raiseload('*')).where(
                     and_(
                         Contact.real_estate_agent_id == real_estate_agent_id,
-                        or_(
-                            Contact.phone_number == caller_phone,
-                            Contact.phone_number == normalized_phone,
-                            Contact.phone_number.like(f"%{normalized_phone[-10:]}%")  # Last 10 digits
-                        )
+                        Contact.phone_last10 == phone_last10(caller_phone)
                     )
                 )
                 contact_result = await session.execute(contact_stmt)
                 caller_contact = contact_result.scalar_one_or_none()
-            
-            # Format properties for context
-            properties_list = []
-            for prop in properties:
-                prop_info = {
-                    "id": prop.id,
-                    "address": prop.address,
-                    "city": prop.city or "",
-                    "state": prop.state or "",
-                    "property_type": prop.property_type or "Property",
-                    "price": f"${prop.price:,.0f}" if prop.price else "Price not set",
-                    "bedrooms": prop.bedrooms,
-                    "bathrooms": prop.bathrooms,
-                    "square_feet": prop.square_feet,
-                    "description": prop.description or "",
-                    "amenities": prop.amenities or ""
-                }
-                properties_list.append(prop_info)
-            
-            # Group properties by type and city for easier reference
-            properties_by_type = {}
-            properties_by_city = {}
-            for prop in properties_list:
-                prop_type = prop['property_type']
-                city = prop['city'] or "Unknown"
                 
-                if prop_type not in properties_by_type:
-                    properties_by_type[prop_type] = []
-                properties_by_type[prop_type].append(prop)
-                
-                if city not in properties_by_city:
-                    properties_by_city[city] = []
-                properties_by_city[city].append(prop)
-            
-            # Format properties summary for prompt
-            properties_summary = f"Total available properties: {len(properties_list)}\n\n"
-            
-            if properties_list:
-                properties_summary += "PROPERTIES:\n"
-                for i, prop in enumerate(properties_list[:20], 1):  # Limit to 20 for prompt size
-                    properties_summary += f"\n{i}. {prop['address']}"
-                    if prop['city']:
-                        properties_summary += f", {prop['city']}"
-                    properties_summary += f" - {prop['property_type']} - {prop['price']}"
-                    if prop['bedrooms']:
-                        properties_summary += f" ({prop['bedrooms']} bed"
-                        if prop['bathrooms']:
-                            properties_summary += f", {prop['bathrooms']} bath"
-                        properties_summary += ")"
-                if len(properties_list) > 20:
-                    properties_summary += f"\n... and {len(properties_list) - 20} more properties"
-            else:
-                properties_summary = "No available properties at this time."
-            
-            # Caller history — how many showings this caller already has
-            caller_history = None
-            if caller_contact:
-                showings_count_stmt = select(sa_func.count()).select_from(Showing).where(
-                    and_(
-                        Showing.real_estate_agent_id == real_estate_agent_id,
-                        Showing.contact_id == caller_contact.id,
+                # Caller history — how many showings this caller already has
+                if caller_contact:
+                    showings_count_stmt = select(sa_func.count()).select_from(Showing).where(
+                        and_(
+                            Showing.real_estate_agent_id == real_estate_agent_id,
+                            Showing.contact_id == caller_contact.id,
+                        )
                     )
-                )
-                showings_count_result = await session.execute(showings_count_stmt)
-                past_showings = showings_count_result.scalar() or 0
-                caller_history = {
-                    "past_showings": past_showings,
-                    "is_returning": past_showings > 0,
-                }
+                    showings_count_result = await session.execute(showings_count_stmt)
+                    past_showings = showings_count_result.scalar() or 0
+                    caller_history = {
+                        "past_showings": past_showings,
+                        "is_returning": past_showings > 0,
+                    }
 
-            caller_contact_dict = None
-            if caller_contact:
-                caller_contact_dict = {
-                    "id": caller_contact.id,
-                    "name": caller_contact.name,
-                    "phone_number": caller_contact.phone_number,
-                    "email": getattr(caller_contact, "email", None),
-                    "has_properties": len([p for p in properties_list if p.get("contact_id") == caller_contact.id]) > 0,
-                    "history": caller_history,
-                }
-
-            voice_agent_phone = ""
-            if voice_agent and voice_agent.phone_number:
-                voice_agent_phone = voice_agent.phone_number.twilio_phone_number or ""
-
-            va_settings = {}
-            if voice_agent and voice_agent.settings:
-                va_settings = voice_agent.settings if isinstance(voice_agent.settings, dict) else {}
-
-            context = {
-                "voice_agent": {
-                    "name": voice_agent.name if voice_agent else "Property Assistant",
-                    "system_prompt": voice_agent.system_prompt if voice_agent else "",
-                    "phone_number": voice_agent_phone,
-                    "settings": va_settings,
-                },
-                "real_estate_agent": {
-                    "name": agent.full_name if agent else "",
-                    "company_name": agent.company_name or "Independent Agent" if agent else "",
-                },
-                "properties": properties_list,
-                "properties_summary": properties_summary,
-                "properties_by_type": properties_by_type,
-                "properties_by_city": properties_by_city,
-                "total_properties": len(properties_list),
-                "caller_contact": caller_contact_dict,
+        caller_contact_dict = None
+        if caller_contact:
+            caller_contact_dict = {
+                "id": caller_contact.id,
+                "name": caller_contact.name,
+                "phone_number": caller_contact.phone_number,
+                "email": getattr(caller_contact, "email", None),
+                "has_properties": len([p for p in properties_list if p.get("contact_id") == caller_contact.id]) > 0,
+                "history": caller_history,
             }
 
-            logger.info(f"✅ Built inbound context for agent {real_estate_agent_id} - {len(properties_list)} properties, caller_known={caller_contact is not None}")
-            return context
-            
+        # New top-level dict per call; the cached base is shared and never mutated here
+        context = {**base, "caller_contact": caller_contact_dict}
+
+        logger.info(f"✅ Built inbound context for agent {real_estate_agent_id} - {len(properties_list)} properties, caller_known={caller_contact is not None}")
+        return context
+        
     except Exception as e:
         logger.error(f"❌ Error building inbound context: {str(e)}", exc_info=True)
         return {"error": f"Failed to build context: {str(e)}"}
@@ -2,12 +2,19 @@
 LLM Service - Handle Google Gemini API interactions
 Optimized for fast responses with conversation history support.
 Shared httpx.AsyncClient for persistent keep-alive connections.
+Gemini context caching for system prompts that repeat across a call's turns.
 """
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+import asyncio
+import hashlib
 import json
 import httpx
 import logging
+import orjson
 from app.config import settings
+from app.services.ai.response_cache import make_cache_key, get_cached_response, cache_response
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +24,9 @@ DEFAULT_MAX_TOKENS = 150
 DEFAULT_TEMPERATURE = 0.7
 DEFAULT_TIMEOUT = 10.0
 
-# Shared httpx client — reused across requests to keep TCP + TLS alive
+# Shared httpx client — reused across requests to keep TCP + TLS alive.
+# Sized for concurrent calls (one Gemini request per turn per call); idle
+# connections stay warm for 30s so consecutive turns skip the TLS handshake.
 _shared_client: Optional[httpx.AsyncClient] = None
 
 
@@ -26,18 +35,149 @@ def _get_shared_client() -> httpx.AsyncClient:
     if _shared_client is None or _shared_client.is_closed:
         _shared_client = httpx.AsyncClient(
             timeout=httpx.Timeout(DEFAULT_TIMEOUT, connect=5.0),
-            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=100, keepalive_expiry=30.0),
         )
     return _shared_client
 
 
+# Chat roles -> Gemini content roles (anything else, e.g. system, is dropped)
+_GEMINI_ROLES = {"user": "user", "assistant": "model"}
+_HISTORY_ROLES = frozenset(("system", "user", "assistant"))
+
+# Request bodies are encoded with orjson and sent as raw bytes (content=),
+# skipping httpx's stdlib json.dumps + UTF-8 encode on every turn
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Gemini context caches for the static part of system prompts, keyed by
+# sha256(model + prompt): (cachedContents name, or None when Gemini refused to
+# cache it, local expiry). That part is identical turn to turn, so turn 2+ only
+# sends the handle plus the few lines that change per turn.
+_CONTEXT_CACHE_TTL_SECONDS = 600
+_CONTEXT_CACHE_MAX_ENTRIES = 256
+_context_caches: "OrderedDict[str, Tuple[Optional[str], datetime]]" = OrderedDict()
+_context_caches_pending: set = set()
+# Cache creations in flight; the event loop only keeps weak references to tasks
+_context_cache_tasks: "set[asyncio.Task]" = set()
+
+
+async def aclose_llm_client() -> None:
+    """Close the shared client (app shutdown)"""
+    global _shared_client
+    if _shared_client is not None and not _shared_client.is_closed:
+        await _shared_client.aclose()
+    _shared_client = None
+
+
+async def warm_llm_client() -> None:
+    """
+    Open a connection to Gemini ahead of the first call (app startup), so the first
+    greeting doesn't pay the TCP + TLS handshake. Failures are only logged.
+    """
+    if not settings.GEMINI_API_KEY:
+        return
+    try:
+        await _get_shared_client().get(
+            f"https://generativelanguage.googleapis.com/v1beta/models?pageSize=1&key={settings.GEMINI_API_KEY}",
+            timeout=httpx.Timeout(5.0),
+        )
+        logger.debug("🔥 Gemini connection warmed")
+    except Exception as e:
+        logger.debug(f"Gemini connection warm-up failed: {str(e)}")
+
+
+async def create_cached_content(system_prompt: str, model: str, ttl_seconds: int = _CONTEXT_CACHE_TTL_SECONDS) -> str:
+    """Upload a system prompt to Gemini's context cache, returns the handle (cachedContents/...)"""
+    client = _get_shared_client()
+    url = f"https://generativelanguage.googleapis.com/v1beta/cachedContents?key={settings.GEMINI_API_KEY}"
+    payload = {
+        "model": f"models/{model}",
+        "systemInstruction": {
+            "parts": [{"text": system_prompt}]
+        },
+        "ttl": f"{ttl_seconds}s",
+    }
+    response = await client.post(url, content=orjson.dumps(payload), headers=_JSON_HEADERS)
+    if response.status_code != 200:
+        raise ValueError(f"Gemini cache error ({response.status_code}): {response.text}")
+    return orjson.loads(response.content)["name"]
+
+
+async def _create_context_cache(key: str, system_prompt: str, model: str) -> None:
+    try:
+        name = await create_cached_content(system_prompt, model)
+        logger.debug(f"🗄️ Gemini context cache created: {name}")
+    except Exception as e:
+        # e.g. prompt below Gemini's minimum cacheable size: don't retry it until expiry
+        logger.debug(f"Gemini context cache not created: {str(e)}")
+        name = None
+    finally:
+        _context_caches_pending.discard(key)
+    # Expire locally a little before Gemini does, so a handle is never used past its TTL
+    _context_caches[key] = (name, datetime.utcnow() + timedelta(seconds=_CONTEXT_CACHE_TTL_SECONDS - 30))
+    _context_caches.move_to_end(key)
+    while len(_context_caches) > _CONTEXT_CACHE_MAX_ENTRIES:
+        _context_caches.popitem(last=False)
+
+
+def get_cached_content_name(system_prompt: str) -> Optional[str]:
+    """
+    Gemini context cache handle for this system prompt, or None while there is none.
+    A missing cache is created in the background, so the calling turn never waits for it.
+    Pass only the part of the prompt that doesn't change between turns (see
+    split_cacheable_prompt), or every turn would create a new cache.
+    """
+    if not settings.GEMINI_API_KEY:
+        return None
+    model = getattr(settings, "GEMINI_MODEL", None) or DEFAULT_MODEL
+    key = hashlib.sha256(f"{model}\n{system_prompt}".encode()).hexdigest()
+    
+    entry = _context_caches.get(key)
+    if entry and datetime.utcnow() < entry[1]:
+        _context_caches.move_to_end(key)
+        return entry[0]
+    
+    if key not in _context_caches_pending:
+        _context_caches_pending.add(key)
+        task = asyncio.ensure_future(_create_context_cache(key, system_prompt, model))
+        _context_cache_tasks.add(task)
+        task.add_done_callback(_context_cache_tasks.discard)
+    return None
+
+
+def _build_contents(
+    user_input: str, conversation_history: Optional[List[Dict]], uncached_prompt: str = ""
+) -> List[Dict]:
+    """
+    Gemini contents array (different format than OpenAI): the conversation history
+    followed by the current user input. System messages are skipped (systemInstruction
+    covers them). `uncached_prompt` (the system prompt lines missing from a context
+    cache) goes in front of the user input, since a request using cachedContent
+    can't also set systemInstruction.
+    """
+    contents = [
+        {"role": _GEMINI_ROLES[role], "parts": [{"text": content}]}
+        for msg in conversation_history or ()
+        if (role := msg.get("role")) in _GEMINI_ROLES and (content := msg.get("content"))
+    ]
+    parts = [{"text": uncached_prompt}] if uncached_prompt else []
+    parts.append({"text": user_input})
+    contents.append({
+        "role": "user",
+        "parts": parts
+    })
+    return contents
+
+
 async def process_with_llm(
     user_input: str,
     system_prompt: str,
     conversation_history: Optional[List[Dict]] = None,
     max_tokens: int = DEFAULT_MAX_TOKENS,
     temperature: float = DEFAULT_TEMPERATURE,
-    timeout: float = DEFAULT_TIMEOUT
+    timeout: float = DEFAULT_TIMEOUT,
+    cached_content_name: Optional[str] = None,
+    uncached_prompt: str = "",
+    cache_bypass: bool = False
 ) -> str:
     """
     Process user input with Google Gemini API
@@ -50,6 +190,11 @@ async def process_with_llm(
         max_tokens: Maximum response length
         temperature: Creativity (0.0-1.0)
         timeout: Request timeout in seconds
+        cached_content_name: Gemini context cache holding system_prompt, or all of it
+            but `uncached_prompt` (see get_cached_content_name); sent instead of the
+            prompt when given
+        uncached_prompt: Tail of system_prompt missing from cached_content_name
+        cache_bypass: Skip the response cache (turns whose reply has side effects)
     
     Returns:
         LLM response text
@@ -58,57 +203,63 @@ async def process_with_llm(
         logger.error("❌ Gemini API key not configured")
         raise ValueError("Gemini API key not configured")
     
+    # Repeated short turns ("yes", "no thanks") in the same spot of the same
+    # conversation are answered from memory, skipping the Gemini round-trip
+    cache_key = None if cache_bypass else make_cache_key(user_input, system_prompt, conversation_history, max_tokens)
+    if cache_key:
+        cached = get_cached_response(cache_key)
+        if cached is not None:
+            logger.debug(f"⚡ LLM response cache hit ({len(cached)} chars)")
+            return cached
+    
     # Get model from settings or use default
     model = getattr(settings, "GEMINI_MODEL", None) or DEFAULT_MODEL
     
-    # Build contents array for Gemini (different format than OpenAI)
-    contents = []
-    
-    # Add conversation history if provided
-    if conversation_history:
-        for msg in conversation_history:
-            role = msg.get("role")
-            content = msg.get("content", "")
-            # Skip system messages (we'll use systemInstruction instead)
-            if role == "system":
-                continue
-            if role in ["user", "assistant"] and content:
-                contents.append({
-                    "role": "user" if role == "user" else "model",
-                    "parts": [{"text": content}]
-                })
-    
-    # Add current user input
-    contents.append({
-        "role": "user",
-        "parts": [{"text": user_input}]
-    })
+    contents = _build_contents(
+        user_input, conversation_history, uncached_prompt if cached_content_name else ""
+    )
     
     try:
         client = _get_shared_client()
         url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={settings.GEMINI_API_KEY}"
 
+        system_instruction = {
+            "parts": [{"text": system_prompt}]
+        }
         payload = {
             "contents": contents,
-            "systemInstruction": {
-                "parts": [{"text": system_prompt}]
-            },
             "generationConfig": {
                 "maxOutputTokens": max_tokens,
                 "temperature": temperature
             }
         }
+        if cached_content_name:
+            payload["cachedContent"] = cached_content_name
+        else:
+            payload["systemInstruction"] = system_instruction
 
         logger.debug(f"🤖 Calling Gemini API - Model: {model}, Messages: {len(contents)}")
 
-        response = await client.post(url, json=payload, timeout=timeout)
+        response = await client.post(
+            url, content=orjson.dumps(payload), headers=_JSON_HEADERS, timeout=httpx.Timeout(timeout, connect=5.0)
+        )
+
+        if response.status_code != 200 and cached_content_name:
+            # Cache gone or rejected on Gemini's side: resend with the full prompt
+            logger.warning(f"⚠️ Gemini rejected cached content {cached_content_name}, resending full prompt")
+            del payload["cachedContent"]
+            payload["systemInstruction"] = system_instruction
+            payload["contents"] = _build_contents(user_input, conversation_history)
+            response = await client.post(
+                url, content=orjson.dumps(payload), headers=_JSON_HEADERS, timeout=httpx.Timeout(timeout, connect=5.0)
+            )
 
         if response.status_code != 200:
             error_text = response.text
             logger.error(f"❌ Gemini API error ({response.status_code}): {error_text}")
             raise ValueError(f"Gemini API error: {error_text}")
 
-        result = response.json()
+        result = orjson.loads(response.content)
 
         if "candidates" in result and len(result["candidates"]) > 0:
             candidate = result["candidates"][0]
@@ -116,6 +267,8 @@ async def process_with_llm(
                 llm_response = candidate["content"]["parts"][0].get("text", "").strip()
                 if llm_response:
                     logger.debug(f"✅ LLM response received ({len(llm_response)} chars)")
+                    if cache_key:
+                        cache_response(cache_key, llm_response)
                     return llm_response
 
         logger.warning(f"⚠️ Unexpected Gemini response structure: {result}")
@@ -125,10 +278,105 @@ async def process_with_llm(
         logger.error(f"⏱️ Gemini API timeout after {timeout}s")
         raise ValueError(f"LLM request timed out after {timeout} seconds")
     except Exception as e:
-        logger.error(f"❌ Error calling Gemini API: {str(e)}", exc_info=True)
+        # Full traceback only when debugging: a burst of 429s shouldn't format one per request
+        logger.error(f"❌ Error calling Gemini API: {str(e)}", exc_info=logger.isEnabledFor(logging.DEBUG))
         raise ValueError(f"Failed to get LLM response: {str(e)}")
 
 
+async def stream_with_llm(
+    user_input: str,
+    system_prompt: str,
+    conversation_history: Optional[List[Dict]] = None,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    temperature: float = DEFAULT_TEMPERATURE,
+    timeout: float = DEFAULT_TIMEOUT,
+    cached_content_name: Optional[str] = None,
+    uncached_prompt: str = "",
+) -> AsyncIterator[str]:
+    """
+    Streaming variant of process_with_llm (streamGenerateContent over SSE)
+    Yields the reply text piece by piece as Gemini generates it, so the caller
+    can start working on the first sentence (e.g. TTS) before the rest arrives.
+    A response cache hit is yielded as a single piece. `cached_content_name` and
+    `uncached_prompt` work as in process_with_llm.
+    
+    Raises ValueError on API errors, timeouts or an empty reply, like process_with_llm.
+    """
+    if not settings.GEMINI_API_KEY:
+        logger.error("❌ Gemini API key not configured")
+        raise ValueError("Gemini API key not configured")
+    
+    cache_key = make_cache_key(user_input, system_prompt, conversation_history, max_tokens)
+    if cache_key:
+        cached = get_cached_response(cache_key)
+        if cached is not None:
+            logger.debug(f"⚡ LLM response cache hit ({len(cached)} chars)")
+            yield cached
+            return
+    
+    model = getattr(settings, "GEMINI_MODEL", None) or DEFAULT_MODEL
+    url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:streamGenerateContent?alt=sse&key={settings.GEMINI_API_KEY}"
+    payload = {
+        "generationConfig": {
+            "maxOutputTokens": max_tokens,
+            "temperature": temperature
+        }
+    }
+    
+    client = _get_shared_client()
+    pieces = []
+    try:
+        # A rejected context cache is only discovered from the status code, before
+        # anything was yielded, so it can still be retried with the full prompt
+        for use_cached_content in ((True, False) if cached_content_name else (False,)):
+            if use_cached_content:
+                payload["cachedContent"] = cached_content_name
+                payload["contents"] = _build_contents(user_input, conversation_history, uncached_prompt)
+            else:
+                payload.pop("cachedContent", None)
+                payload["systemInstruction"] = {"parts": [{"text": system_prompt}]}
+                payload["contents"] = _build_contents(user_input, conversation_history)
+            
+            async with client.stream(
+                "POST", url, content=orjson.dumps(payload), headers=_JSON_HEADERS,
+                timeout=httpx.Timeout(timeout, connect=5.0),
+            ) as response:
+                if response.status_code != 200:
+                    error_text = (await response.aread()).decode(errors="replace")
+                    if use_cached_content:
+                        logger.warning(f"⚠️ Gemini rejected cached content {cached_content_name}, resending full prompt")
+                        continue
+                    logger.error(f"❌ Gemini API error ({response.status_code}): {error_text}")
+                    raise ValueError(f"Gemini API error: {error_text}")
+                
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    chunk = orjson.loads(line[5:])
+                    for candidate in chunk.get("candidates", ())[:1]:
+                        for part in candidate.get("content", {}).get("parts", ()):
+                            text = part.get("text")
+                            if text:
+                                pieces.append(text)
+                                yield text
+                break
+    except httpx.TimeoutException:
+        logger.error(f"⏱️ Gemini API timeout after {timeout}s")
+        raise ValueError(f"LLM request timed out after {timeout} seconds")
+    except ValueError:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error streaming from Gemini API: {str(e)}", exc_info=logger.isEnabledFor(logging.DEBUG))
+        raise ValueError(f"Failed to get LLM response: {str(e)}")
+    
+    llm_response = "".join(pieces).strip()
+    if not llm_response:
+        raise ValueError("Unexpected response format from Gemini API")
+    logger.debug(f"✅ LLM response streamed ({len(llm_response)} chars)")
+    if cache_key:
+        cache_response(cache_key, llm_response)
+
+
 async def generate_initial_greeting(
     greeting_prompt: str,
     timeout: float = 8.0
@@ -138,7 +386,8 @@ async def generate_initial_greeting(
     Raises on failure so the caller can use its own direction-aware fallback.
     """
     # Add extra emphasis to use contact name if mentioned in prompt
-    if "contacting" in greeting_prompt.lower() and "property owner" not in greeting_prompt.lower():
+    prompt_lower = greeting_prompt.lower()  # lowercased once for both checks
+    if "contacting" in prompt_lower and "property owner" not in prompt_lower:
         enhanced_prompt = greeting_prompt + "\n\nREMEMBER: You MUST use the contact's actual name in your response. DO NOT say 'property owner'."
     else:
         enhanced_prompt = greeting_prompt
@@ -156,23 +405,54 @@ async def generate_initial_greeting(
     return response
 
 
+async def generate_initial_greetings_batch(
+    greeting_prompts: List[str],
+    concurrency: int = 20,
+    qpm: int = 500,
+    timeout: float = DEFAULT_TIMEOUT
+) -> List[Optional[str]]:
+    """
+    Generate greetings for many calls at once (outbound campaigns).
+    Requests run concurrently, at most `concurrency` in flight and started no
+    faster than `qpm` per minute. Results keep the input order; a failed
+    greeting is None so the caller can use its fallback for that contact.
+    Each reply also lands in the response cache, so the live call's
+    generate_initial_greeting for the same prompt returns immediately.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    start_lock = asyncio.Lock()
+    interval = 60.0 / qpm
+    loop = asyncio.get_running_loop()
+    next_start = loop.time()
+
+    async def _one(greeting_prompt: str) -> Optional[str]:
+        nonlocal next_start
+        async with semaphore:
+            # Space request starts evenly to stay under the per-minute quota
+            async with start_lock:
+                delay = next_start - loop.time()
+                next_start = max(next_start, loop.time()) + interval
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                return await generate_initial_greeting(greeting_prompt, timeout=timeout)
+            except Exception as e:
+                logger.warning(f"⚠️ Batch greeting failed: {str(e)}")
+                return None
+
+    return list(await asyncio.gather(*[_one(p) for p in greeting_prompts]))
+
+
 def format_conversation_history_for_llm(history: List[Dict]) -> List[Dict]:
     """
     Format conversation history for LLM API
     Filters and validates history entries
     """
-    formatted = []
-    for msg in history:
-        role = msg.get("role")
-        content = msg.get("content")
-        
-        if role in ["system", "user", "assistant"] and content:
-            formatted.append({
-                "role": role,
-                "content": content
-            })
-    
-    return formatted
+    return [
+        {"role": role, "content": content}
+        for msg in history
+        if (role := msg.get("role")) in _HISTORY_ROLES and (content := msg.get("content"))
+    ]
 
 
 async def process_with_structured_output(
@@ -199,6 +479,8 @@ async def process_with_structured_output(
         max_tokens=max_tokens,
         temperature=temperature,
         timeout=timeout,
+        # Replies carry actions (create_showing): never replay them from cache
+        cache_bypass=True,
     )
 
     # Try to parse JSON from the response
@@ -2,173 +2,183 @@
 Prompt Service - Generate dynamic prompts for LLM
 Pure functions - no side effects, easy to test
 """
-from typing import Dict, Optional, Set
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 from datetime import datetime
 import logging
+import string
 
 from app.services.conversation.slot_parser import get_current_week_dates
 
 logger = logging.getLogger(__name__)
 
 
-# Outbound call prompt template
-OUTBOUND_PROMPT_TEMPLATE = """You are {voice_agent_name}, a professional real estate assistant calling on behalf of {agent_name}{company_phrase}.
+# Property columns (header name, property dict key) for the prompt tables
+OUTBOUND_PROPERTY_COLUMNS = (
+    ("address", "address"),
+    ("city", "city"),
+    ("state", "state"),
+    ("type", "property_type"),
+    ("price", "price"),
+    ("bedrooms", "bedrooms"),
+    ("bathrooms", "bathrooms"),
+    ("sqft", "square_feet"),
+    ("available", "is_available"),
+    ("description", "description"),
+    ("amenities", "amenities"),
+)
+INBOUND_PROPERTY_COLUMNS = (
+    ("address", "address"),
+    ("city", "city"),
+    ("type", "property_type"),
+    ("price", "price"),
+    ("bedrooms", "bedrooms"),
+    ("bathrooms", "bathrooms"),
+)
+
+
+def _toon_cell(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "yes" if value else "no"
+    # Keep one property per line and the delimiter unambiguous
+    return str(value).replace("|", "/").replace("\n", " ")
+
+
+def format_properties_toon(properties: List[Dict], columns: Sequence[Tuple[str, str]]) -> str:
+    """
+    Properties as a schema-once table (TOON style): one header line naming the
+    columns, then one '|'-delimited row per property, so field names are sent
+    once instead of once per property. Empty cell = unknown.
+    """
+    keys = [key for _, key in columns]
+    lines = [f"properties[{len(properties)}]{{{'|'.join(name for name, _ in columns)}}}:"]
+    for prop in properties:
+        lines.append("|".join([_toon_cell(prop.get(key)) for key in keys]))
+    return "\n".join(lines)
+
+
+def spoken_address(address: Optional[str]) -> str:
+    """Address as it should be read aloud: TTS would pronounce '/', '-' and '#'"""
+    if not address:
+        return ""
+    return address.replace("/", " ").replace("-", " ").replace("#", " ").strip()
+
+
+def _agent_address_spoken(agent: Optional[Dict]) -> str:
+    """Spoken agent address, precomputed by the context builder when available"""
+    if not agent:
+        return ""
+    return agent.get("address_spoken") or spoken_address(agent.get("address"))
 
-RESPONSE LENGTH: 1-2 SHORT sentences per turn (under 35 words). No filler phrases. Get to the point.
-Never open with praise fillers like "That's wonderful", "Absolutely", "Great to hear" — respond directly.
 
-CALL TYPE: OUTBOUND CALL — YOU initiated this call.
-NEVER say "thank you for calling" — this is NOT an inbound call. YOU called THEM.
+def _compile_template(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """
+    Split a str.format template once into (literal, field name) pieces, so a
+    render is a single join instead of re-parsing the whole template every turn.
+    Only plain {name} fields are supported ({{ }} escapes are fine).
+    """
+    pieces = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if spec or conversion:
+            raise ValueError(f"Unsupported placeholder in prompt template: {field}")
+        pieces.append((literal, field))
+    return tuple(pieces)
+
+
+def _render_template(pieces: Tuple[Tuple[str, Optional[str]], ...], values: Dict) -> str:
+    """Same output as template.format(**values) for a template compiled by _compile_template"""
+    out = []
+    for literal, field in pieces:
+        out.append(literal)
+        if field is not None:
+            out.append(str(values[field]))
+    return "".join(out)
+
+
+# Outbound call prompt template. The only part that changes between turns of a
+# call (confirmed topics) is kept last, so every turn shares the longest
+# possible identical prefix for Gemini's implicit prefix caching.
+OUTBOUND_PROMPT_TEMPLATE = """You are {voice_agent_name}, a professional real estate assistant calling on behalf of {agent_name}{company_phrase}.
+OUTBOUND CALL — YOU called {contact_name}. NEVER say "thank you for calling".
+
+STYLE: 1-2 SHORT sentences per turn (under 35 words), ONE topic per turn. No praise fillers ("That's wonderful", "Absolutely", "Great to hear") — respond directly. Sound warm and human, not scripted. Use {contact_name} naturally — never say "property owner". If they interrupt, STOP and listen.
 
 CALL CONTEXT:
-- Calling: {contact_name} ({contact_phone})
-- Contact email on file: {contact_email}
+- Calling: {contact_name} ({contact_phone}), email on file: {contact_email}
 - Properties: {property_count}
 - {current_date}
 - Office address: {agent_address_fallback}
 
-PROPERTIES:
+PROPERTIES (header line names the columns, then one row per property; empty = unknown):
 {properties_text}
 
+FLOW:
+1. The greeting is already sent — do NOT re-introduce. Wait for the answer to "Am I contacting {contact_name}?"; YES → step 2, wrong person → end (see examples).
+2. Property discussion, skipping CONFIRMED topics: mention the address and basic details, then ask about condition, repairs and interest in selling, waiting for each answer.
+3. Scheduling: collect date, time and visit type (table below). When confirmed: "I'll send a confirmation text and email with the details." Phone and email are on file — only ask for email if it shows as not on file.
+4. Next steps: "I'll send this to {agent_name} who will follow up with a cash offer."
+5. Before ending, ALWAYS ask: "{contact_name}, is there anything else you'd like to ask?" End only once they say no more questions; answer and ask again otherwise. Never end abruptly.
+
+visit_types[3]{{visit_type|when|say}}:
+property_visit|{agent_name} visits {contact_name}'s property (most common)|{agent_name} would love to visit the property at [address]. What date and time work best?
+office_visit|{contact_name} comes to the office|Sure, our office is at {agent_address_fallback}. When would you like to come by?
+custom_meeting|{contact_name} picks the place|No problem! Where would you like to meet, and what date/time work for you?
+
+examples[3]{{trigger|say}}:
+silence|Hello, are you there?
+wrong person|I apologize, I must have the wrong number. Have a good day.
+not interested|I understand, {contact_name}. Thank you for your time. Feel free to contact us if that changes. Have a great day.
+
+NEVER repeat a topic from the CONFIRMED list below.
 TOPICS ALREADY CONFIRMED (DO NOT repeat these):
-{confirmed_topics}
-
-CONVERSATION FLOW:
-1. **Identity Verification** (greeting already sent — do NOT re-introduce):
-   - Wait for response to "Am I contacting {contact_name}?"
-   - YES → move to step 3. NO / wrong person → apologize and end.
-   - If silent: "Hello, are you there?" then wait.
-
-2. **Wrong Person / Not Interested**:
-   - Wrong person: "I apologize, I must have the wrong number. Have a good day."
-   - Not interested: "I understand, {contact_name}. Thank you for your time. Feel free to contact us if that changes. Have a great day."
-
-3. **Property Discussion** (only if NOT already confirmed):
-   - Mention the property address and basic details.
-   - Ask about condition, repairs, interest in selling.
-   - ONE topic per turn. Wait for their answer before asking the next.
-
-4. **Scheduling / Meeting** — THREE possible scenarios:
-   a) **{agent_name} visits {contact_name}'s property** (most common for outbound):
-      → "{agent_name} would love to visit the property at [address]. What date and time work best?"
-      → visit_type = "property_visit"
-   b) **{contact_name} visits {agent_name}'s office**:
-      → "Sure, our office is at {agent_address_fallback}. When would you like to come by?"
-      → visit_type = "office_visit"
-   c) **Meeting at {contact_name}'s preferred location**:
-      → "No problem! Where would you like to meet, and what date/time work for you?"
-      → visit_type = "custom_meeting"
-
-   FOR ALL SCENARIOS:
-   - Collect: date, time, and visit location/type.
-   - When confirmed, say: "I'll send a confirmation text and email with the details."
-   - Do NOT ask for their email or phone — you ALREADY HAVE both on file.
-   - Only ask for email IF {contact_email} is empty/missing.
-
-5. **Before Ending — MANDATORY**:
-   - ALWAYS ask: "{contact_name}, is there anything else you'd like to ask?"
-   - ONLY end the call when they explicitly say no more questions.
-   - If they have more questions, answer them, then ask again.
-   - NEVER end the call abruptly. The user might have more to say.
-
-6. **Next Steps**: "I'll send this to {agent_name} who will follow up with a cash offer."
-
-CRITICAL RULES:
-- NEVER repeat a topic from the CONFIRMED list above.
-- Use {contact_name} naturally — never say "property owner".
-- 1-2 sentences max per response. No corporate filler.
-- When user interrupts, STOP and listen immediately.
-- Sound warm and human, not scripted."""
+{confirmed_topics}"""
+_OUTBOUND_PROMPT_PIECES = _compile_template(OUTBOUND_PROMPT_TEMPLATE)
+
+# Start of the per-turn tail of the outbound prompt (everything before it is static for a call)
+_PER_TURN_SECTION = "NEVER repeat a topic from the CONFIRMED list below."
+
+
+def split_cacheable_prompt(system_prompt: str) -> Tuple[str, str]:
+    """
+    (static prefix, per-turn tail) of a system prompt. Only the prefix is worth a
+    Gemini context cache; prompts without a per-turn tail are all prefix.
+    """
+    index = system_prompt.rfind(_PER_TURN_SECTION)
+    if index < 0:
+        return system_prompt, ""
+    return system_prompt[:index], system_prompt[index:]
 
 
 # Inbound call prompt template
 INBOUND_PROMPT_TEMPLATE = """You are {voice_agent_name}, a warm and professional real estate assistant speaking on behalf of {agent_name} at {company_name}.
+INBOUND CALL. {caller_context}
 
-RESPONSE LENGTH: 1-2 SHORT sentences per turn. No filler phrases like "That's wonderful" or "Absolutely". Get to the point.
-
-CALL TYPE: INBOUND CALL
-{caller_context}
+STYLE: 1-2 SHORT sentences per turn (more only when listing properties). No fillers like "That's wonderful" or "Absolutely". Sound like a knowledgeable, friendly person — never robotic; mirror the caller's tone. If they interrupt, STOP, listen and answer what they said without repeating yourself.
 
 CALL CONTEXT:
 - Current date: {current_date}
 - Total available properties: {total_properties}
 - You represent: {agent_name} from {company_name}
 
-AVAILABLE PROPERTIES:
+AVAILABLE PROPERTIES (header line names the columns, then one row per property; empty = unknown):
 {properties_summary}
 
-PERSONALIZATION — THIS IS CRITICAL:
-- {personalization_instructions}
-- Once you learn the caller's name (they say it OR you've asked), use it EVERY 2-3 turns naturally. Examples: "Great question, Ahmad", "Sure thing, Sarah — let me check", "That's a beautiful area, Ali".
-- NEVER say "Dear caller" or "Dear customer" — that's robotic. If you don't have their name yet, just say "you" naturally.
-- Mirror their energy: if they're casual, be casual. If they're formal, match it.
-- Remember what property or criteria they just discussed. If they say "tell me more" or "that one", it refers to the LAST property you mentioned — don't re-ask.
-
-YOUR ROLE:
-1. Make the caller feel like they're talking to a knowledgeable, friendly person — not a bot
-2. Help them find properties that match their needs
-3. Answer questions about property details
-4. Offer to schedule a visit if they're interested
-5. Be concise but warm (1-2 sentences per response unless listing properties)
-
-CONVERSATION FLOW:
-1. **Introduction**:
-   - If caller is KNOWN: "Hey {caller_known_name}! Great to hear from you again. How can I help you today?"
-   - If caller is UNKNOWN: "Hello! This is {voice_agent_name} from {company_name}, representing {agent_name}. May I know who I'm speaking with?"
-   - WAIT for their name. Once they give it, acknowledge it warmly: "Nice to meet you, [NAME]! How can I help you today?"
-
-2. **Property Inquiries**:
-   - Use their name when presenting results: "[NAME], I found 3 properties that match..."
-   - If they ask about criteria, filter and present the top 3-5 matches with key details
-   - If no matches: suggest alternatives naturally
-
-3. **Property Details**:
-   - When they ask about a specific property, give full details
-   - Then proactively suggest: "Would you like to schedule a visit to see it, [NAME]?"
-
-4. **Scheduling a Showing / Visit** — THREE possible scenarios:
-   a) **Caller wants to VISIT a listed property**:
-      → "[NAME], I can set up a visit to [ADDRESS]. When works for you?"
-      → visit_type = "property_visit"
-   b) **Caller wants the agent to COME TO THEM**:
-      → "Sure! Where should {agent_name} meet you, and when works best?"
-      → visit_type = "custom_meeting"
-   c) **Caller wants to visit the OFFICE**:
-      → "Our office is at [address]. When would you like to come by?"
-      → visit_type = "office_visit"
-
-   FOR ALL SCENARIOS:
-   - Collect: which property (if applicable), date/time, their name (you should already have it), and their email.
-   - Ask for email naturally: "[NAME], could I grab your email so we can send you a confirmation?"
-   - When they give an email, SPELL IT BACK letter by letter for confirmation:
-     Example: "Let me confirm — a, h, m, a, d, m, i, r, z, a, 9, 9, 8, 7, at gmail dot com. Is that correct?"
-   - Always spell the part before @ letter by letter. Say the domain normally (gmail.com, yahoo.com, etc.)
-   - If they say "no" or correct you, STOP and let them re-spell it. Then confirm again.
-   - Only proceed once they confirm the email is correct.
-   - If they decline giving email, proceed without it.
-   - Confirm back naturally: "[NAME], I've got you down for [ADDRESS/LOCATION] on [DATE] at [TIME]. I'll send you a text and email confirmation. Sound good?"
-   - If they confirm: "Perfect, [NAME]! You'll get a confirmation text and email shortly. Looking forward to it!"
-
-5. **Before Ending**:
-   - Use their name: "[NAME], is there anything else I can help you with?"
-   - If done: "Thanks for calling, [NAME]. Have a wonderful day! Feel free to call back anytime."
-
-INTERRUPTION HANDLING — VERY IMPORTANT:
-- If the caller starts speaking while you are talking, STOP immediately and LISTEN.
-- After they finish, acknowledge what they said and respond to it.
-- NEVER talk over the caller. Their input ALWAYS takes priority over your current sentence.
-- If you were mid-sentence, don't repeat the whole thing — just address what they said.
-
-CRITICAL RULES:
-- ASK for the caller's name in the FIRST turn if they are unknown. This is non-negotiable.
-- Once you have their name, USE IT. Don't forget it mid-conversation.
-- ALWAYS introduce yourself as speaking "on behalf of {agent_name} from {company_name}"
-- If they say "the first one" or "that property", resolve it to the LAST property you discussed
-- When scheduling is confirmed, ALWAYS mention they'll receive a text and email confirmation
-- When an email is provided, ALWAYS spell it back letter by letter for confirmation before saving
-- Keep responses concise (1-2 sentences) except when listing properties (then be thorough)
-- Sound human, warm, and genuinely helpful — never robotic or scripted
-- Before ending, ALWAYS ask if they need anything else, using their name"""
+NAME: {personalization_instructions}
+Once you know it, use their name every 2-3 turns ("Sure thing, Sarah — let me check"). Never say "Dear caller"; without a name just say "you".
+
+FLOW:
+1. Introduction — known caller: "Hey {caller_known_name}! Great to hear from you again. How can I help you today?" Unknown: "Hello! This is {voice_agent_name} from {company_name}, representing {agent_name}. May I know who I'm speaking with?" then "Nice to meet you, [NAME]! How can I help you today?"
+2. Inquiries: filter by their criteria and present the top 3-5 matches ("[NAME], I found 3 properties that match..."); no match → suggest alternatives. "that one" / "the first one" / "tell me more" means the LAST property you discussed.
+3. Details: give the full details, then offer: "Would you like to schedule a visit to see it, [NAME]?"
+4. Scheduling: collect the property (if any), date/time, visit type (table below) and email ("[NAME], could I grab your email so we can send you a confirmation?"). Spell the part before @ back letter by letter, domain normally ("a, h, m, a, d, at gmail dot com. Is that correct?"); if corrected, let them re-spell and confirm again; if they decline, continue without it. Confirm: "[NAME], I've got you down for [ADDRESS/LOCATION] on [DATE] at [TIME]. I'll send you a text and email confirmation. Sound good?" — then "Perfect, [NAME]! You'll get a confirmation text and email shortly."
+5. Before ending, ALWAYS ask: "[NAME], is there anything else I can help you with?" If done: "Thanks for calling, [NAME]. Have a wonderful day! Feel free to call back anytime."
+
+visit_types[3]{{visit_type|when|say}}:
+property_visit|caller visits a listed property|[NAME], I can set up a visit to [ADDRESS]. When works for you?
+custom_meeting|{agent_name} comes to the caller|Sure! Where should {agent_name} meet you, and when works best?
+office_visit|caller comes to the office|Our office is at [address]. When would you like to come by?"""
+_INBOUND_PROMPT_PIECES = _compile_template(INBOUND_PROMPT_TEMPLATE)
 
 
 def build_outbound_prompt(context: Dict, confirmed_topics: Optional[Set[str]] = None) -> str:
@@ -186,17 +196,13 @@ def build_outbound_prompt(context: Dict, confirmed_topics: Optional[Set[str]] =
         current_date = get_current_week_dates()
 
         agent_company = agent.get("company_name", "") if agent else ""
-        agent_address = agent.get("address", "") if agent else ""
-        agent_address_spoken = (
-            agent_address.replace("/", " ").replace("-", " ").replace("#", " ").strip()
-            if agent_address else ""
-        )
+        agent_address_spoken = _agent_address_spoken(agent)
 
         topics_str = ", ".join(sorted(confirmed_topics)) if confirmed_topics else "None yet"
 
         contact_email = contact.get("email", "") or ""
 
-        prompt = OUTBOUND_PROMPT_TEMPLATE.format(
+        prompt = _render_template(_OUTBOUND_PROMPT_PIECES, dict(
             voice_agent_name=voice_agent.get("name", "Property Assistant"),
             agent_name=agent.get("name", "Real Estate Agent"),
             company_name=agent_company or "",
@@ -209,13 +215,13 @@ def build_outbound_prompt(context: Dict, confirmed_topics: Optional[Set[str]] =
             properties_text=properties_text,
             current_date=current_date,
             confirmed_topics=topics_str,
-        )
+        ))
 
         logger.debug(f"✅ Generated outbound prompt for {contact.get('name', 'contact')}")
         return prompt
 
     except Exception as e:
-        logger.error(f"❌ Error building outbound prompt: {str(e)}", exc_info=True)
+        logger.error(f"❌ Error building outbound prompt: {str(e)}", exc_info=logger.isEnabledFor(logging.DEBUG))
         return "You are a professional real estate assistant. Be concise, friendly, and helpful."
 
 
@@ -258,7 +264,7 @@ def build_inbound_prompt(context: Dict) -> str:
             )
             caller_known_name = ""
 
-        prompt = INBOUND_PROMPT_TEMPLATE.format(
+        prompt = _render_template(_INBOUND_PROMPT_PIECES, dict(
             voice_agent_name=voice_agent.get("name", "Property Assistant"),
             agent_name=agent.get("name", "Real Estate Agent"),
             company_name=agent.get("company_name", "Independent Agent"),
@@ -268,56 +274,66 @@ def build_inbound_prompt(context: Dict) -> str:
             caller_context=caller_context,
             personalization_instructions=personalization,
             caller_known_name=caller_known_name or "[their name once known]",
-        )
+        ))
 
         logger.debug(f"✅ Generated inbound prompt — known_caller={bool(caller_contact)}")
         return prompt
 
     except Exception as e:
-        logger.error(f"❌ Error building inbound prompt: {str(e)}", exc_info=True)
+        logger.error(f"❌ Error building inbound prompt: {str(e)}", exc_info=logger.isEnabledFor(logging.DEBUG))
         return """You are a professional real estate assistant. Be friendly, professional, and helpful.
         Keep responses concise and informative."""
 
 
+def outbound_greeting_context(
+    voice_agent_name: str,
+    agent_name: Optional[str],
+    company_name: Optional[str],
+    contact_name: Optional[str],
+    property_address: Optional[str] = None,
+) -> Dict:
+    """
+    Context for get_initial_greeting_prompt(..., "outbound"). Shared by the voice
+    webhook and the batch-call greeting pre-generation, so both build the same
+    prompt and the live call hits the response cache.
+    """
+    return {
+        "voice_agent": {"name": voice_agent_name},
+        "real_estate_agent": {
+            "name": agent_name or "Real Estate Agent",
+            "company_name": company_name or "Independent Agent"
+        },
+        "contact": {"name": contact_name} if contact_name else {},  # Only include if we have name
+        "properties": [{"address": property_address}] if property_address else []
+    }
+
+
 def get_initial_greeting_prompt(context: Dict, direction: str) -> str:
     """
     Get a prompt specifically for generating the initial greeting
     Shorter and more focused than the full system prompt
+    `context` holds plain dicts (voice_agent, real_estate_agent, contact), as built
+    by context_service and the webhook's greeting context
     """
     if direction == "outbound":
         contact = context.get("contact", {})
         voice_agent = context.get("voice_agent", {})
         agent = context.get("real_estate_agent", {})
-        property_count = context.get("property_count", 0)
-        
-        # Get first property address for greeting
-        first_property_address = ""
-        properties = context.get("properties", [])
-        if properties and len(properties) > 0:
-            first_property_address = properties[0].get("address", "")
         
         # Extract contact name - handle both dict and None cases
         contact_name = None
         if contact:
-            contact_name = contact.get('name', '') if isinstance(contact, dict) else getattr(contact, 'name', '')
+            contact_name = contact.get('name', '')
             if contact_name:
                 contact_name = contact_name.strip()
         
-        agent_name = agent.get('name', 'the real estate agent') if isinstance(agent, dict) else getattr(agent, 'name', 'the real estate agent')
-        company_raw = agent.get('company_name', '') if isinstance(agent, dict) else getattr(agent, 'company_name', '')  # empty if not provided
+        agent_name = agent.get('name', 'the real estate agent')
+        company_raw = agent.get('company_name', '')  # empty if not provided
         company_name = company_raw.strip()
         company_phrase = f" from {company_name}" if company_name else ""
-        agent_address_raw = agent.get('address', '') if isinstance(agent, dict) else getattr(agent, 'address', '')
-        agent_address_spoken = (
-            agent_address_raw.replace("/", " ").replace("-", " ").replace("#", " ").strip()
-            if agent_address_raw else ""
-        )
-        agent_address_fallback = agent_address_spoken if agent_address_spoken else "Address not available"
-        voice_agent_name = voice_agent.get('name', 'Property Assistant') if isinstance(voice_agent, dict) else getattr(voice_agent, 'name', 'Property Assistant')
+        voice_agent_name = voice_agent.get('name', 'Property Assistant')
         
         # Log for debugging
-        import logging
-        logger = logging.getLogger(__name__)
         logger.info(f"🔍 [GREETING PROMPT] contact_name='{contact_name}', agent_name='{agent_name}', company_name='{company_name}'")
         
         # CRITICAL: Make it crystal clear to use the contact name
@@ -363,9 +379,10 @@ Keep it to 2-3 sentences maximum. Be warm and professional."""
         agent = context.get("real_estate_agent", {})
         caller_contact = context.get("caller_contact")
         total_properties = context.get("total_properties", 0)
-        company_raw = agent.get('company_name', '') if isinstance(agent, dict) else getattr(agent, 'company_name', '')
+        company_raw = agent.get('company_name', '')
         company_name = company_raw.strip()
         company_phrase = f" from {company_name}" if company_name else ""
+        agent_address_fallback = _agent_address_spoken(agent) or "Address not available"
         
         greeting_note = ""
         if caller_contact:
@@ -447,6 +464,7 @@ INTERRUPTION: If the user speaks, STOP and listen. Their input always takes prio
 
 On confirmation: "You'll receive a text and email confirmation shortly."
 Keep assistant_speech to 1-2 sentences. Be warm, not robotic."""
+_BOOKING_SUFFIX_PIECES = _compile_template(BOOKING_STRUCTURED_PROMPT_SUFFIX)
 
 
 OUTBOUND_BOOKING_STRUCTURED_PROMPT_SUFFIX = """
@@ -502,6 +520,7 @@ INTERRUPTION: If they speak, STOP and listen.
 
 On confirmation: "I'll send you a text and email with the meeting details."
 Keep assistant_speech to 1-2 sentences."""
+_OUTBOUND_BOOKING_SUFFIX_PIECES = _compile_template(OUTBOUND_BOOKING_STRUCTURED_PROMPT_SUFFIX)
 
 
 def _format_booking_vars(collected_slots: Dict, is_outbound: bool = False) -> tuple:
@@ -535,12 +554,12 @@ def build_booking_prompt(context: Dict, collected_slots: Dict) -> str:
     caller_contact = context.get("caller_contact") or {}
     caller_email = caller_contact.get("email", "") or ""
 
-    return base + BOOKING_STRUCTURED_PROMPT_SUFFIX.format(
+    return base + _render_template(_BOOKING_SUFFIX_PIECES, dict(
         collected_slots=collected_str,
         missing_slots=missing_str,
         current_week_dates=week_dates,
         caller_email_for_booking=caller_email if caller_email else "[not on file — ask them]",
-    )
+    ))
 
 
 def build_outbound_booking_prompt(
@@ -553,9 +572,9 @@ def build_outbound_booking_prompt(
     contact = context.get("contact", {})
     contact_email = (contact.get("email") or "") if contact else ""
 
-    return base + OUTBOUND_BOOKING_STRUCTURED_PROMPT_SUFFIX.format(
+    return base + _render_template(_OUTBOUND_BOOKING_SUFFIX_PIECES, dict(
         collected_slots=collected_str,
         missing_slots=missing_str,
         current_week_dates=week_dates,
         contact_email_for_booking=contact_email if contact_email else "[not on file — ask them]",
-    )
+    ))
@@ -0,0 +1,80 @@
+"""
+Response Cache - Reuse LLM replies for repeated short turns
+Callers often answer with the same few utterances ("yes", "no", "not interested"),
+so a turn whose prompt, previous assistant message and normalized input were
+already seen is answered from memory instead of another Gemini round-trip.
+"""
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import re
+
+_CACHE_TTL = timedelta(minutes=30)
+_CACHE_MAX_ENTRIES = 2048
+
+# Only short utterances are worth caching: long ones practically never repeat
+_MAX_CACHED_INPUT_CHARS = 80
+
+_NON_WORD = re.compile(r"[^\w\s]+")
+_SPACES = re.compile(r"\s+")
+
+# key -> (response, cached_at)
+_responses: "OrderedDict[str, Tuple[str, datetime]]" = OrderedDict()
+
+
+def _normalize(user_input: str) -> str:
+    """'Yes!!  ' and 'yes' hit the same entry"""
+    return _SPACES.sub(" ", _NON_WORD.sub(" ", user_input.lower())).strip()
+
+
+def _last_assistant_message(conversation_history: Optional[List[Dict]]) -> str:
+    for msg in reversed(conversation_history or []):
+        if msg.get("role") == "assistant":
+            return msg.get("content", "") or ""
+    return ""
+
+
+def make_cache_key(
+    user_input: str,
+    system_prompt: str,
+    conversation_history: Optional[List[Dict]],
+    max_tokens: int,
+) -> Optional[str]:
+    """
+    Cache key for a turn, or None when the turn shouldn't be cached.
+    The previous assistant message is part of the key: "yes" to "Am I speaking
+    with Ali?" and "yes" to "Shall I book Tuesday?" need different replies.
+    """
+    normalized = _normalize(user_input)
+    if not normalized or len(normalized) > _MAX_CACHED_INPUT_CHARS:
+        return None
+    raw = "\x1f".join((
+        system_prompt,
+        _last_assistant_message(conversation_history),
+        normalized,
+        str(max_tokens),
+    ))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def get_cached_response(key: str) -> Optional[str]:
+    entry = _responses.get(key)
+    if entry is None:
+        return None
+    if datetime.utcnow() - entry[1] >= _CACHE_TTL:
+        _responses.pop(key, None)
+        return None
+    _responses.move_to_end(key)
+    return entry[0]
+
+
+def cache_response(key: str, response: str) -> None:
+    _responses[key] = (response, datetime.utcnow())
+    _responses.move_to_end(key)
+    while len(_responses) > _CACHE_MAX_ENTRIES:
+        _responses.popitem(last=False)
+
+
+def clear_response_cache() -> None:
+    _responses.clear()
@@ -1,114 +1,145 @@
-from typing import Optional
-from sqlalchemy import select
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+from sqlalchemy import select, bindparam
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from app.database.connection import AsyncSessionLocal
 from app.models.admin import Admin
 from app.utils.security import verify_password
+from app.utils.ids import new_id
+
+# Admin rows by lowercased email -> (row data incl. hashed_password, cached_at).
+# Admins change rarely; the short TTL bounds how long a deactivation takes to apply.
+_admin_cache: Dict[str, Tuple[dict, datetime]] = {}
+_ADMIN_CACHE_TTL = timedelta(seconds=60)
+
+# Statements for the cache misses, built once and bound per call
+_ADMIN_BY_EMAIL = select(Admin).where(Admin.email == bindparam("email"))
+_ADMIN_BY_ID = select(Admin).where(Admin.id == bindparam("admin_id"))
+
+
+def _admin_to_dict(admin: Admin) -> dict:
+    return {
+        "id": admin.id,
+        "email": admin.email,
+        "full_name": admin.full_name,
+        "is_active": admin.is_active,
+        "is_super_admin": admin.is_super_admin,
+    }
+
+
+def _get_cached_admin(email: str) -> Optional[dict]:
+    entry = _admin_cache.get(email)
+    if entry and datetime.utcnow() - entry[1] < _ADMIN_CACHE_TTL:
+        return entry[0]
+    return None
+
+
+def _cache_admin(admin: Admin) -> dict:
+    data = {**_admin_to_dict(admin), "hashed_password": admin.hashed_password}
+    _admin_cache[admin.email] = (data, datetime.utcnow())
+    return data
+
+
+async def _load_admin_cached(email: str) -> Optional[dict]:
+    """Admin row for a lowercased email (with hashed_password), or None; read-through cache"""
+    cached = _get_cached_admin(email)
+    if cached is not None:
+        return cached
+    
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(_ADMIN_BY_EMAIL, {"email": email})
+        admin = result.scalar_one_or_none()
+    
+    if not admin:
+        _admin_cache.pop(email, None)
+        return None
+    
+    return _cache_admin(admin)
+
+
+def invalidate_admin_cache(email: str) -> None:
+    """Drop the cached admin row after a write"""
+    _admin_cache.pop(email.lower(), None)
+
+
+def clear_admin_cache() -> None:
+    _admin_cache.clear()
 
 
 async def authenticate_admin(email: str, password: str) -> Optional[dict]:
     """Authenticate admin and return admin data if valid"""
     from app.config import settings
     
-    async with AsyncSessionLocal() as session:
-        # Check if email is in admin whitelist first
-        if email.lower() not in settings.admin_email_list:
-            return None
-        
-        # Find admin by email
-        stmt = select(Admin).where(Admin.email == email.lower())
-        result = await session.execute(stmt)
-        admin = result.scalar_one_or_none()
-        
-        if not admin:
-            return None
-        
-        # Check if admin is active
-        if not admin.is_active:
-            return None
-        
-        # Verify password
-        if not verify_password(password, admin.hashed_password):
-            return None
-        
-        return {
-            "id": admin.id,
-            "email": admin.email,
-            "full_name": admin.full_name,
-            "is_active": admin.is_active,
-            "is_super_admin": admin.is_super_admin,
-        }
+    # Check if email is in admin whitelist first
+    email = email.lower()
+    if email not in settings.admin_email_set:
+        return None
+    
+    # Find admin by email
+    admin = await _load_admin_cached(email)
+    if not admin:
+        return None
+    
+    # Check if admin is active
+    if not admin["is_active"]:
+        return None
+    
+    # Verify password
+    if not verify_password(password, admin["hashed_password"]):
+        return None
+    
+    return {key: value for key, value in admin.items() if key != "hashed_password"}
 
 
 async def get_admin_by_id(admin_id: str) -> Optional[dict]:
     """Get admin by ID"""
     async with AsyncSessionLocal() as session:
-        stmt = select(Admin).where(Admin.id == admin_id)
-        result = await session.execute(stmt)
+        result = await session.execute(_ADMIN_BY_ID, {"admin_id": admin_id})
         admin = result.scalar_one_or_none()
         
         if not admin:
             return None
         
-        return {
-            "id": admin.id,
-            "email": admin.email,
-            "full_name": admin.full_name,
-            "is_active": admin.is_active,
-            "is_super_admin": admin.is_super_admin,
-        }
+        return _admin_to_dict(admin)
 
 
 async def get_or_create_admin_from_google(google_info: dict) -> dict:
     """Get existing admin or create new one from Google OAuth"""
-    import uuid
     from app.config import settings
     
-    async with AsyncSessionLocal() as session:
-        # Check if admin exists by email
-        stmt = select(Admin).where(Admin.email == google_info["email"].lower())
-        result = await session.execute(stmt)
-        admin = result.scalar_one_or_none()
-        
-        if admin:
-            # Admin exists, check if email is still in whitelist (security check)
-            if google_info["email"].lower() not in settings.admin_email_list:
-                raise ValueError("Email not authorized for admin access")
-            
-            # Check if admin is active
-            if not admin.is_active:
-                raise ValueError("Admin account is inactive")
-            
-            return {
-                "id": admin.id,
-                "email": admin.email,
-                "full_name": admin.full_name,
-                "is_active": admin.is_active,
-                "is_super_admin": admin.is_super_admin,
-            }
-        
-        # Check if email is in admin whitelist before creating new admin
-        if google_info["email"].lower() not in settings.admin_email_list:
-            raise ValueError("Email not authorized for admin access")
-        
-        # Create new admin from Google
-        admin_id = str(uuid.uuid4())
-        new_admin = Admin(
-            id=admin_id,
-            email=google_info["email"].lower(),
-            hashed_password="",  # No password for Google auth
-            full_name=google_info.get("name", ""),
-            is_active=True,
-            is_super_admin=False,
-        )
-        
-        session.add(new_admin)
-        await session.commit()
-        await session.refresh(new_admin)
-        
-        return {
-            "id": admin_id,
-            "email": google_info["email"].lower(),
-            "full_name": google_info.get("name", ""),
-            "is_active": True,
-            "is_super_admin": False,
-        }
+    email = google_info["email"].lower()
+    
+    # Whitelist check applies to existing admins too (security check)
+    if email not in settings.admin_email_set:
+        raise ValueError("Email not authorized for admin access")
+    
+    admin = _get_cached_admin(email)
+    if admin is None:
+        async with AsyncSessionLocal() as session:
+            # Get or create in one statement: INSERT ... ON CONFLICT (email) returns the
+            # existing row (no-op update) or the new one, so concurrent first logins can't race
+            insert = sqlite_insert if session.bind.dialect.name == "sqlite" else pg_insert
+            stmt = (
+                insert(Admin)
+                .values(
+                    id=new_id(),
+                    email=email,
+                    hashed_password="",  # No password for Google auth
+                    full_name=google_info.get("name", ""),
+                    is_active=True,
+                    is_super_admin=False,
+                )
+                .on_conflict_do_update(index_elements=[Admin.email], set_={"email": email})
+                .returning(Admin)
+            )
+            result = await session.execute(stmt)
+            row = result.scalar_one()
+            await session.commit()
+        admin = _cache_admin(row)
+    
+    # Check if admin is active
+    if not admin["is_active"]:
+        raise ValueError("Admin account is inactive")
+    
+    return {key: value for key, value in admin.items() if key != "hashed_password"}
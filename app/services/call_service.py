@@ -4,21 +4,94 @@ Handles call initiation, recording, and history
 """
 import asyncio
 import logging
+import re
+from collections import OrderedDict
 from typing import Optional, Dict, List, Tuple, Any
-from datetime import datetime
-import uuid
-from sqlalchemy import select, and_, or_, func, desc, literal
+from datetime import datetime, timedelta
+from sqlalchemy import select, update, and_, or_, func, desc, literal
 from sqlalchemy.orm import selectinload
 from app.database.connection import AsyncSessionLocal
 from app.models.call import Call
 from app.models.voice_agent import VoiceAgent
 from app.models.contact import Contact
-from app.services.twilio_service.client import get_twilio_client
+from app.models.phone_number import PhoneNumber
+from app.models.real_estate_agent import RealEstateAgent
+from app.services.twilio_service.client import create_call, get_twilio_http_client
 from app.services.sentiment_service import analyze_sentiment, text_for_sentiment
+from app.services.ai.llm_service import generate_initial_greetings_batch
+from app.services.ai.prompt_service import get_initial_greeting_prompt, outbound_greeting_context
 from app.config import settings
+from app.utils.pagination import next_cursor, paginate_latest_first
+from app.utils.ids import new_id
 
 logger = logging.getLogger(__name__)
 
+# Call list totals by (agent, status, direction, search): paging through a list
+# re-counts the same filtered set, which only needs to be roughly current. Free-text
+# search makes the keys unbounded, so entries go through _remember like the caches below.
+_call_count_cache: "OrderedDict[Tuple, Tuple[int, datetime]]" = OrderedDict()
+_CALL_COUNT_CACHE_TTL = timedelta(seconds=30)
+
+# Dashboard reads polled every few seconds: list pages by (agent, paging, filters) and
+# single calls by (call_id, agent). Every write to calls drops the entries it affects
+# (invalidate_agent_calls / _invalidate_call) and bumps the agent's version, so a read
+# that raced a write isn't cached.
+_call_page_cache: "OrderedDict[Tuple, Tuple[Tuple[List[Dict], int, Optional[str]], datetime]]" = OrderedDict()
+_CALL_PAGE_CACHE_TTL = timedelta(seconds=10)
+_call_cache: "OrderedDict[Tuple[str, str], Tuple[Dict, datetime]]" = OrderedDict()
+_CALL_CACHE_TTL = timedelta(seconds=30)
+_CALL_CACHE_MAX_ENTRIES = 2048
+_agent_call_versions: Dict[str, int] = {}
+
+
+def _remember(cache: OrderedDict, key: Tuple, value: Any, ttl: timedelta) -> None:
+    """Store value under key, keeping the cache in insertion (= cached_at) order and capped"""
+    now = datetime.utcnow()
+    cache[key] = (value, now)
+    cache.move_to_end(key)
+    # Oldest entries sit at the front: drop the expired ones, then any over the cap
+    while cache and now - next(iter(cache.values()))[1] >= ttl:
+        cache.popitem(last=False)
+    while len(cache) > _CALL_CACHE_MAX_ENTRIES:
+        cache.popitem(last=False)
+
+
+def invalidate_agent_calls(real_estate_agent_id: str) -> None:
+    """Drop an agent's cached call totals and list pages after a write to its calls"""
+    _agent_call_versions[real_estate_agent_id] = _agent_call_versions.get(real_estate_agent_id, 0) + 1
+    for cache in (_call_count_cache, _call_page_cache):
+        for key in [key for key in cache if key[0] == real_estate_agent_id]:
+            cache.pop(key, None)
+
+
+def _invalidate_call(call_id: str, real_estate_agent_id: str) -> None:
+    _call_cache.pop((call_id, real_estate_agent_id), None)
+    invalidate_agent_calls(real_estate_agent_id)
+
+
+def _call_version(real_estate_agent_id: str) -> int:
+    return _agent_call_versions.get(real_estate_agent_id, 0)
+
+
+def _copy_page(page: Tuple[List[Dict], int, Optional[str]]) -> Tuple[List[Dict], int, Optional[str]]:
+    """Cached page with its own item dicts, so callers can't change the cached ones"""
+    items, total, cursor = page
+    return [dict(item) for item in items], total, cursor
+
+
+def clear_call_caches() -> None:
+    for cache in (_call_count_cache, _call_page_cache, _call_cache, _agent_call_versions):
+        cache.clear()
+
+
+def _updated_call(row) -> Optional[Dict]:
+    """RETURNING row of a call update (minus real_estate_agent_id), dropping its cached reads"""
+    if not row:
+        return None
+    row = dict(row)
+    _invalidate_call(row["id"], row.pop("real_estate_agent_id"))
+    return row
+
 
 async def _persist_call_sentiment(
     call_id: str,
@@ -26,14 +99,15 @@ async def _persist_call_sentiment(
     sentiment_scores: Optional[Dict[str, Any]],
 ) -> None:
     async with AsyncSessionLocal() as session:
-        stmt = select(Call).where(Call.id == call_id)
-        result = await session.execute(stmt)
-        call = result.scalar_one_or_none()
-        if not call:
-            return
-        call.sentiment_label = sentiment_label
-        call.sentiment_scores = sentiment_scores
+        result = await session.execute(
+            update(Call)
+            .where(Call.id == call_id)
+            .values(sentiment_label=sentiment_label, sentiment_scores=sentiment_scores)
+            .returning(Call.id, Call.real_estate_agent_id)
+        )
+        row = result.mappings().one_or_none()
         await session.commit()
+    _updated_call(row)
 
 
 async def enrich_calls_with_sentiment(items: List[Dict]) -> List[Dict]:
@@ -74,6 +148,39 @@ async def enrich_calls_with_sentiment(items: List[Dict]) -> List[Dict]:
     return items
 
 
+async def _load_active_voice_agent(session, real_estate_agent_id: str) -> VoiceAgent:
+    """Active voice agent (with its phone number) for an agent; raises ValueError when it can't place calls"""
+    stmt = (
+        select(VoiceAgent)
+        .options(selectinload(VoiceAgent.phone_number))
+        .where(
+            and_(
+                VoiceAgent.real_estate_agent_id == real_estate_agent_id,
+                VoiceAgent.status == "active"
+            )
+        )
+    )
+    result = await session.execute(stmt)
+    voice_agent = result.scalar_one_or_none()
+    
+    if not voice_agent:
+        print("❌ No active voice agent found")
+        logger.error(f"No active voice agent found for agent: {real_estate_agent_id}")
+        raise ValueError("Active voice agent not found")
+    
+    print(f"✅ Voice agent found: {voice_agent.name} (ID: {voice_agent.id})")
+    logger.info(f"Voice agent found: {voice_agent.id}")
+    
+    if not voice_agent.phone_number:
+        print("❌ Voice agent has no phone number assigned")
+        logger.error(f"Voice agent {voice_agent.id} has no phone number assigned")
+        raise ValueError("Voice agent does not have a phone number assigned")
+    
+    print(f"📞 Voice agent phone number: {voice_agent.phone_number.twilio_phone_number}")
+    logger.info(f"Voice agent phone: {voice_agent.phone_number.twilio_phone_number}")
+    return voice_agent
+
+
 async def initiate_call(
     real_estate_agent_id: str,
     contact_id: Optional[str],
@@ -84,38 +191,9 @@ async def initiate_call(
     logger.info(f"Initiating call - Agent: {real_estate_agent_id}, To: {phone_number}, Contact: {contact_id}")
     
     async with AsyncSessionLocal() as session:
-        # Get voice agent
-        stmt = (
-            select(VoiceAgent)
-            .options(selectinload(VoiceAgent.phone_number))
-            .where(
-                and_(
-                    VoiceAgent.real_estate_agent_id == real_estate_agent_id,
-                    VoiceAgent.status == "active"
-                )
-            )
-        )
-        result = await session.execute(stmt)
-        voice_agent = result.scalar_one_or_none()
-        
-        if not voice_agent:
-            print("❌ No active voice agent found")
-            logger.error(f"No active voice agent found for agent: {real_estate_agent_id}")
-            raise ValueError("Active voice agent not found")
-        
-        print(f"✅ Voice agent found: {voice_agent.name} (ID: {voice_agent.id})")
-        logger.info(f"Voice agent found: {voice_agent.id}")
-        
-        if not voice_agent.phone_number:
-            print("❌ Voice agent has no phone number assigned")
-            logger.error(f"Voice agent {voice_agent.id} has no phone number assigned")
-            raise ValueError("Voice agent does not have a phone number assigned")
-        
-        print(f"📞 Voice agent phone number: {voice_agent.phone_number.twilio_phone_number}")
-        logger.info(f"Voice agent phone: {voice_agent.phone_number.twilio_phone_number}")
+        voice_agent = await _load_active_voice_agent(session, real_estate_agent_id)
         
         # Get contact if provided
-        contact = None
         if contact_id:
             contact_stmt = select(Contact).where(
                 and_(
@@ -132,150 +210,212 @@ async def initiate_call(
                 print(f"📇 Using contact phone number: {phone_number}")
                 logger.info(f"Using contact phone number: {phone_number}")
         
-        # Normalize phone number (ensure E.164 format)
-        original_phone = phone_number
-        
-        # Remove all non-digit characters except +
-        cleaned = ''.join(c for c in phone_number if c.isdigit() or c == '+')
-        
-        # Ensure it starts with +
-        if not cleaned.startswith("+"):
-            # If starts with country code 92, add +
-            if cleaned.startswith("92"):
-                cleaned = "+" + cleaned
-            # If starts with 0 (Pakistan local format), replace with +92
-            elif cleaned.startswith("0"):
-                cleaned = "+92" + cleaned[1:]
-            # Otherwise, assume Pakistan and add +92
-            else:
-                cleaned = "+92" + cleaned
+        return await _place_call(session, voice_agent, real_estate_agent_id, contact_id, phone_number)
+
+
+# Everything but digits and "+" (spaces, dashes, brackets) in a dialed number
+_PHONE_NON_DIAL = re.compile(r"[^\d+]+")
+
+
+def _normalize_phone_number(phone_number: str) -> str:
+    """E.164 form of a number (Pakistan local formats get +92); raises ValueError when it can't be one"""
+    # Normalize phone number (ensure E.164 format)
+    original_phone = phone_number
+    
+    # Remove all non-digit characters except +
+    cleaned = _PHONE_NON_DIAL.sub("", phone_number)
+    
+    # Ensure it starts with +
+    if not cleaned.startswith("+"):
+        # If starts with country code 92, add +
+        if cleaned.startswith("92"):
+            cleaned = "+" + cleaned
+        # If starts with 0 (Pakistan local format), replace with +92
+        elif cleaned.startswith("0"):
+            cleaned = "+92" + cleaned[1:]
+        # Otherwise, assume Pakistan and add +92
         else:
-            # Already has +, but check for double country code
-            # If it's +92 followed by 92 again, remove the duplicate
-            if cleaned.startswith("+9292"):
-                cleaned = "+92" + cleaned[5:]
-        
-        phone_number = cleaned
-        
-        if phone_number != original_phone:
-            print(f"📝 Normalized phone number: {original_phone} → {phone_number}")
-            logger.info(f"Normalized phone number: {original_phone} → {phone_number}")
-        
-        # Validate phone number format (basic check)
-        # E.164 format: + followed by 1-15 digits
-        if not phone_number.startswith("+") or len(phone_number) < 8 or len(phone_number) > 16:
-            error_msg = f"Invalid phone number format: {phone_number}. Expected E.164 format (e.g., +923001234567 or +1234567890)"
-            print(f"❌ {error_msg}")
-            logger.error(error_msg)
-            raise ValueError(error_msg)
-        
-        # Check for digits after +
-        digits_after_plus = phone_number[1:]
-        if not digits_after_plus.isdigit():
-            error_msg = f"Invalid phone number format: {phone_number}. Phone number should contain only digits after the + sign"
-            print(f"❌ {error_msg}")
-            logger.error(error_msg)
-            raise ValueError(error_msg)
+            cleaned = "+92" + cleaned
+    else:
+        # Already has +, but check for double country code
+        # If it's +92 followed by 92 again, remove the duplicate
+        if cleaned.startswith("+9292"):
+            cleaned = "+92" + cleaned[5:]
+    
+    phone_number = cleaned
+    
+    if phone_number != original_phone:
+        print(f"📝 Normalized phone number: {original_phone} → {phone_number}")
+        logger.info(f"Normalized phone number: {original_phone} → {phone_number}")
+    
+    # Validate phone number format (basic check)
+    # E.164 format: + followed by 1-15 digits
+    if not phone_number.startswith("+") or len(phone_number) < 8 or len(phone_number) > 16:
+        error_msg = f"Invalid phone number format: {phone_number}. Expected E.164 format (e.g., +923001234567 or +1234567890)"
+        print(f"❌ {error_msg}")
+        logger.error(error_msg)
+        raise ValueError(error_msg)
+    
+    # Check for digits after +
+    digits_after_plus = phone_number[1:]
+    if not digits_after_plus.isdigit():
+        error_msg = f"Invalid phone number format: {phone_number}. Phone number should contain only digits after the + sign"
+        print(f"❌ {error_msg}")
+        logger.error(error_msg)
+        raise ValueError(error_msg)
+    
+    return phone_number
+
+
+def _new_outbound_call(
+    voice_agent: VoiceAgent,
+    real_estate_agent_id: str,
+    contact_id: Optional[str],
+    phone_number: str
+) -> Call:
+    """Call record for a number about to be dialed (phone_number already normalized)"""
+    call_id = new_id()
+    print(f"📝 Creating call record - Call ID: {call_id}")
+    logger.info(f"Creating call record - ID: {call_id}, To: {phone_number}")
+    
+    return Call(
+        id=call_id,
+        voice_agent_id=voice_agent.id,
+        real_estate_agent_id=real_estate_agent_id,
+        # Use a temporary unique value for twilio_call_sid to satisfy unique constraint,
+        # then overwrite it with the real Twilio SID once the API call succeeds.
+        twilio_call_sid=call_id,
+        contact_id=contact_id,
+        from_number=voice_agent.phone_number.twilio_phone_number,
+        to_number=phone_number,
+        status="initiated",
+        direction="outbound",
+        started_at=datetime.utcnow()
+    )
+
+
+async def _place_call(
+    session,
+    voice_agent: VoiceAgent,
+    real_estate_agent_id: str,
+    contact_id: Optional[str],
+    phone_number: str
+) -> Dict:
+    """Normalize the number, record the call and dial it through Twilio (voice_agent from _load_active_voice_agent)"""
+    phone_number = _normalize_phone_number(phone_number)
+    return await _record_and_dial(session, voice_agent, real_estate_agent_id, contact_id, phone_number)
+
+
+async def _record_and_dial(
+    session,
+    voice_agent: VoiceAgent,
+    real_estate_agent_id: str,
+    contact_id: Optional[str],
+    phone_number: str
+) -> Dict:
+    """Record the call right before dialing it (phone_number already normalized)"""
+    new_call = _new_outbound_call(voice_agent, real_estate_agent_id, contact_id, phone_number)
+    session.add(new_call)
+    await session.commit()
+    invalidate_agent_calls(real_estate_agent_id)
+    print(f"✅ Call record created in database")
+    logger.info(f"Call record created - ID: {new_call.id}")
+    
+    return await _dial(session, new_call, voice_agent)
+
+
+async def _dial(session, new_call: Call, voice_agent: VoiceAgent) -> Dict:
+    """Dial an already recorded call through Twilio and store its SID; marks it failed if Twilio refuses"""
+    phone_number = new_call.to_number
+    
+    # Make call via Twilio
+    try:
+        print(f"🔌 Connecting to Twilio API...")
+        
+        # Get webhook URL from settings
+        base_url = settings.TWILIO_VOICE_WEBHOOK_URL
+        if not base_url:
+            print("❌ TWILIO_VOICE_WEBHOOK_URL not configured")
+            logger.error("TWILIO_VOICE_WEBHOOK_URL not configured in environment")
+            raise ValueError("TWILIO_VOICE_WEBHOOK_URL not configured in environment")
+        
+        voice_url = f"{base_url}/webhooks/twilio/voice"
+        recording_callback = f"{base_url}/webhooks/twilio/recording"
+        
+        print(f"📞 Calling Twilio API to initiate call...")
+        print(f"   From: {voice_agent.phone_number.twilio_phone_number}")
+        print(f"   To: {phone_number}")
+        print(f"   Webhook URL: {voice_url}")
+        logger.info(f"Calling Twilio API - From: {voice_agent.phone_number.twilio_phone_number}, To: {phone_number}, Webhook: {voice_url}")
+        
+        # Async REST call on the shared keep-alive client
+        call = await create_call(
+            to=phone_number,
+            from_=voice_agent.phone_number.twilio_phone_number,
+            url=voice_url,
+            method="POST",
+            record=True,  # Enable recording
+            recording_status_callback=recording_callback,
+            recording_status_callback_method="POST",
+            status_callback=f"{base_url}/webhooks/twilio/status",
+            status_callback_method="POST"
+        )
         
-        # Create call record
-        call_id = str(uuid.uuid4())
-        print(f"📝 Creating call record - Call ID: {call_id}")
-        logger.info(f"Creating call record - ID: {call_id}, To: {phone_number}")
+        print(f"✅ Twilio call created successfully!")
+        print(f"   Twilio Call SID: {call['sid']}")
+        print(f"   Call Status: {call['status']}")
+        logger.info(f"Twilio call created - SID: {call['sid']}, Status: {call['status']}")
         
-        new_call = Call(
-            id=call_id,
-            voice_agent_id=voice_agent.id,
-            real_estate_agent_id=real_estate_agent_id,
-            # Use a temporary unique value for twilio_call_sid to satisfy unique constraint,
-            # then overwrite it with the real Twilio SID once the API call succeeds.
-            twilio_call_sid=call_id,
-            contact_id=contact_id,
-            from_number=voice_agent.phone_number.twilio_phone_number,
-            to_number=phone_number,
-            status="initiated",
-            direction="outbound",
-            started_at=datetime.utcnow()
+        # Update call with Twilio SID right away: status webhooks look the call up by it
+        await session.execute(
+            update(Call)
+            .where(Call.id == new_call.id)
+            .values(twilio_call_sid=call["sid"])
         )
-        
-        session.add(new_call)
         await session.commit()
-        print(f"✅ Call record created in database")
-        logger.info(f"Call record created - ID: {call_id}")
+        _invalidate_call(new_call.id, new_call.real_estate_agent_id)
+        print(f"✅ Call record updated with Twilio SID")
+        
+        result = {
+            "id": new_call.id,
+            "twilio_call_sid": call["sid"],
+            "status": "initiated",
+            "to_number": phone_number,
+            "from_number": voice_agent.phone_number.twilio_phone_number,
+        }
         
-        # Make call via Twilio
-        try:
-            print(f"🔌 Connecting to Twilio API...")
-            client = get_twilio_client()
-            
-            # Get webhook URL from settings
-            base_url = settings.TWILIO_VOICE_WEBHOOK_URL
-            if not base_url:
-                print("❌ TWILIO_VOICE_WEBHOOK_URL not configured")
-                logger.error("TWILIO_VOICE_WEBHOOK_URL not configured in environment")
-                raise ValueError("TWILIO_VOICE_WEBHOOK_URL not configured in environment")
-            
-            voice_url = f"{base_url}/webhooks/twilio/voice"
-            recording_callback = f"{base_url}/webhooks/twilio/recording"
-            
-            print(f"📞 Calling Twilio API to initiate call...")
-            print(f"   From: {voice_agent.phone_number.twilio_phone_number}")
-            print(f"   To: {phone_number}")
-            print(f"   Webhook URL: {voice_url}")
-            logger.info(f"Calling Twilio API - From: {voice_agent.phone_number.twilio_phone_number}, To: {phone_number}, Webhook: {voice_url}")
-            
-            call = client.calls.create(
-                to=phone_number,
-                from_=voice_agent.phone_number.twilio_phone_number,
-                url=voice_url,
-                method="POST",
-                record=True,  # Enable recording
-                recording_status_callback=recording_callback,
-                recording_status_callback_method="POST",
-                status_callback=f"{base_url}/webhooks/twilio/status",
-                status_callback_method="POST"
-            )
-            
-            print(f"✅ Twilio call created successfully!")
-            print(f"   Twilio Call SID: {call.sid}")
-            print(f"   Call Status: {call.status}")
-            logger.info(f"Twilio call created - SID: {call.sid}, Status: {call.status}")
-            
-            # Update call with Twilio SID
-            new_call.twilio_call_sid = call.sid
-            await session.commit()
-            await session.refresh(new_call)
-            print(f"✅ Call record updated with Twilio SID")
-            
-            result = {
-                "id": new_call.id,
-                "twilio_call_sid": call.sid,
-                "status": "initiated",
-                "to_number": phone_number,
-                "from_number": voice_agent.phone_number.twilio_phone_number,
-            }
-            
-            return result
-        except Exception as e:
-            error_msg = str(e)
-            print(f"\n❌ ERROR: Failed to initiate Twilio call")
-            print(f"   Error: {error_msg}")
-            print(f"   Error Type: {type(e).__name__}\n")
-            logger.error(f"Failed to initiate Twilio call - Error: {error_msg}", exc_info=True)
-            
-            # Update call status to failed
-            new_call.status = "failed"
-            await session.commit()
-            raise ValueError(f"Failed to initiate call: {error_msg}")
+        return result
+    except Exception as e:
+        error_msg = str(e)
+        print(f"\n❌ ERROR: Failed to initiate Twilio call")
+        print(f"   Error: {error_msg}")
+        print(f"   Error Type: {type(e).__name__}\n")
+        logger.error(f"Failed to initiate Twilio call - Error: {error_msg}", exc_info=True)
+        
+        # Update call status to failed
+        await session.execute(
+            update(Call)
+            .where(Call.id == new_call.id)
+            .values(status="failed")
+        )
+        await session.commit()
+        _invalidate_call(new_call.id, new_call.real_estate_agent_id)
+        raise ValueError(f"Failed to initiate call: {error_msg}")
 
 
 async def initiate_batch_calls(
     real_estate_agent_id: str,
     contact_ids: List[str],
-    delay_seconds: int = 30
+    delay_seconds: int = 30,
+    max_workers: int = 10
 ) -> Dict:
-    """Initiate batch calls with delay between each"""
-    import asyncio
-    
+    """
+    Initiate batch calls with delay between each
+    Call starts are spaced `delay_seconds` apart, but a call no longer waits for the
+    previous one's Twilio request to finish; at most `max_workers` are in flight.
+    Greetings for all contacts are generated up front, alongside the dials, so the
+    voice webhook finds each one in the LLM response cache when the call connects.
+    """
     calls = []
     errors = []
     
@@ -286,39 +426,109 @@ async def initiate_batch_calls(
     if delay_seconds < 3:
         print(f"⚠️ Delay of {delay_seconds}s is too short. Using minimum 3s delay to prevent webhook conflicts.")
     
-    for i, contact_id in enumerate(contact_ids):
+    # Voice agent and all contacts up front: 2 queries instead of 3 per contact
+    async with AsyncSessionLocal() as session:
         try:
-            # Get contact phone number
-            async with AsyncSessionLocal() as session:
-                stmt = select(Contact).where(
-                    and_(
-                        Contact.id == contact_id,
-                        Contact.real_estate_agent_id == real_estate_agent_id
-                    )
+            voice_agent = await _load_active_voice_agent(session, real_estate_agent_id)
+        except ValueError as e:
+            voice_agent = None
+            voice_agent_error = str(e)
+        
+        contacts_by_id = {}
+        if voice_agent and contact_ids:
+            stmt = select(Contact).where(
+                and_(
+                    Contact.id.in_(contact_ids),
+                    Contact.real_estate_agent_id == real_estate_agent_id
                 )
-                result = await session.execute(stmt)
-                contact = result.scalar_one_or_none()
-                
-                if not contact:
-                    errors.append({"contact_id": contact_id, "error": "Contact not found"})
-                    continue
-                
-                # Initiate call
-                call_data = await initiate_call(
-                    real_estate_agent_id=real_estate_agent_id,
-                    contact_id=contact_id,
-                    phone_number=contact.phone_number
+            )
+            result = await session.execute(stmt)
+            contacts_by_id = {contact.id: contact for contact in result.scalars()}
+            agent_row = (await session.execute(
+                select(RealEstateAgent.full_name, RealEstateAgent.company_name)
+                .where(RealEstateAgent.id == real_estate_agent_id)
+            )).one_or_none()
+    
+    if not voice_agent:
+        errors = [{"contact_id": contact_id, "error": voice_agent_error} for contact_id in contact_ids]
+        return {"call_count": 0, "calls": [], "errors": errors}
+    
+    # Normalize every number first, so bad ones are reported without dialing or a row
+    to_dial = []
+    invalid = {}
+    for contact_id in contact_ids:
+        contact = contacts_by_id.get(contact_id)
+        if not contact:
+            continue
+        try:
+            to_dial.append((contact.id, _normalize_phone_number(contact.phone_number)))
+        except ValueError as e:
+            invalid[contact_id] = str(e)
+    
+    # The webhook names the contact from the call record, so its greeting prompt
+    # is built from the same fields as here
+    greeting_prompts = [
+        get_initial_greeting_prompt(
+            outbound_greeting_context(
+                voice_agent.name,
+                agent_row.full_name if agent_row else None,
+                agent_row.company_name if agent_row else None,
+                contacts_by_id[contact_id].name,
+            ),
+            "outbound",
+        )
+        for contact_id, _ in to_dial
+    ] if settings.GEMINI_API_KEY else []
+    
+    semaphore = asyncio.Semaphore(max_workers)
+    loop = asyncio.get_running_loop()
+    first_start = loop.time()
+    
+    async def _one(slot: int, contact_id: str, phone_number: str) -> Dict:
+        # Call `slot` starts slot * actual_delay after the first one
+        delay = first_start + slot * actual_delay - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        async with semaphore:
+            # One short session per call, so no connection is held while waiting.
+            # The row is only written when the call is actually dialed
+            async with AsyncSessionLocal() as session:
+                return await _record_and_dial(
+                    session, voice_agent, real_estate_agent_id, contact_id, phone_number
                 )
-                calls.append(call_data)
-                
-                # Delay before next call (except for last one)
-                # Use actual_delay to ensure minimum 2 seconds between calls
-                if i < len(contact_ids) - 1:
-                    print(f"⏱️ Waiting {actual_delay} seconds before next call...")
-                    await asyncio.sleep(actual_delay)
+    
+    async def _pregenerate_greetings() -> None:
+        # Failed greetings come back as None; the webhook then generates or falls back itself
+        greetings = await generate_initial_greetings_batch(greeting_prompts)
+        ready = sum(greeting is not None for greeting in greetings)
+        logger.info(f"Pre-generated {ready}/{len(greetings)} batch call greetings")
+    
+    greetings_task = asyncio.ensure_future(_pregenerate_greetings()) if greeting_prompts else None
+    outcomes = iter(await asyncio.gather(
+        *[_one(slot, contact_id, phone_number) for slot, (contact_id, phone_number) in enumerate(to_dial)],
+        return_exceptions=True,
+    ))
+    if greetings_task is not None:
+        # Usually long done: the later calls in a batch wait `actual_delay` per slot
+        try:
+            await greetings_task
         except Exception as e:
-            logger.error(f"Error initiating call for contact {contact_id}: {str(e)}", exc_info=True)
-            errors.append({"contact_id": contact_id, "error": str(e)})
+            logger.warning(f"Batch greeting pre-generation failed: {str(e)}")
+    
+    # Report in the order the contacts were given
+    for contact_id in contact_ids:
+        if contact_id not in contacts_by_id:
+            errors.append({"contact_id": contact_id, "error": "Contact not found"})
+            continue
+        if contact_id in invalid:
+            errors.append({"contact_id": contact_id, "error": invalid[contact_id]})
+            continue
+        outcome = next(outcomes)
+        if isinstance(outcome, BaseException):
+            logger.error(f"Error initiating call for contact {contact_id}: {str(outcome)}", exc_info=outcome)
+            errors.append({"contact_id": contact_id, "error": str(outcome)})
+        else:
+            calls.append(outcome)
     
     return {
         "call_count": len(calls),
@@ -327,20 +537,81 @@ async def initiate_batch_calls(
     }
 
 
+# Call list columns (plus the joined names), labelled with the response keys, so
+# listing reads plain rows: no ORM objects or relationship loads per call
+_CALL_LIST_COLUMNS = (
+    Call.id,
+    Call.voice_agent_id,
+    VoiceAgent.name.label("voice_agent_name"),
+    Call.real_estate_agent_id,
+    Call.twilio_call_sid,
+    Call.contact_id,
+    Contact.name.label("contact_name"),
+    Contact.phone_number.label("contact_phone"),
+    Call.from_number,
+    Call.to_number,
+    PhoneNumber.twilio_phone_number,
+    Call.status,
+    Call.direction,
+    Call.duration_seconds,
+    Call.recording_url,
+    Call.recording_sid,
+    Call.transcript,
+    Call.transcript_json,
+    Call.user_pov_summary,
+    Call.sentiment_label,
+    Call.sentiment_scores,
+    Call.started_at,
+    Call.answered_at,
+    Call.ended_at,
+    Call.created_at,
+    Call.updated_at,
+)
+
+
+def _call_mapping_to_row(mapping) -> Dict:
+    """Same dict as _call_to_row, from a _CALL_LIST_COLUMNS result row (timestamps stay datetimes)"""
+    return dict(mapping)
+
+
 async def get_calls_by_agent(
     real_estate_agent_id: str,
     page: int = 1,
     page_size: int = 20,
     status: Optional[str] = None,
     direction: Optional[str] = None,
-    search: Optional[str] = None
-) -> Tuple[List[Dict], int]:
-    """Get paginated calls for an agent with server-side filtering and search"""
+    search: Optional[str] = None,
+    cursor: Optional[str] = None
+) -> Tuple[List[Dict], int, Optional[str]]:
+    """
+    Get paginated calls for an agent with server-side filtering and search
+    Returns (items, total, next_cursor); pass next_cursor back as `cursor` for keyset
+    paging. Raises ValueError for a malformed cursor.
+    """
+    key = (real_estate_agent_id, page, page_size, status, direction, search, cursor)
+    entry = _call_page_cache.get(key)
+    if entry and datetime.utcnow() - entry[1] < _CALL_PAGE_CACHE_TTL:
+        return _copy_page(entry[0])
+    
+    version = _call_version(real_estate_agent_id)
+    result = await _query_calls_by_agent(
+        real_estate_agent_id, page, page_size, status, direction, search, cursor
+    )
+    if _call_version(real_estate_agent_id) == version:
+        _remember(_call_page_cache, key, result, _CALL_PAGE_CACHE_TTL)
+    return _copy_page(result)
+
+
+async def _query_calls_by_agent(
+    real_estate_agent_id: str,
+    page: int,
+    page_size: int,
+    status: Optional[str],
+    direction: Optional[str],
+    search: Optional[str],
+    cursor: Optional[str]
+) -> Tuple[List[Dict], int, Optional[str]]:
     async with AsyncSessionLocal() as session:
-        from sqlalchemy import or_
-        from app.models.contact import Contact
-        
-        # Build query with joins for search
         conditions = [Call.real_estate_agent_id == real_estate_agent_id]
         
         if status:
@@ -348,104 +619,72 @@ async def get_calls_by_agent(
         if direction:
             conditions.append(Call.direction == direction)
         
+        count_stmt = select(func.count(Call.id)).select_from(Call)
+        
         # Build search conditions separately to include contact name search
         if search:
             search_pattern = f"%{search}%"
             # Search in phone numbers and contact name
-            search_conditions = or_(
+            conditions.append(or_(
                 Call.from_number.ilike(search_pattern),
                 Call.to_number.ilike(search_pattern),
                 Contact.name.ilike(search_pattern),
                 Contact.phone_number.ilike(search_pattern)
-            )
-            # Combine with existing conditions
-            final_where = and_(*conditions, search_conditions)
-            
+            ))
             # Count query with contact join for search
-            count_stmt = (
-                select(func.count(Call.id))
-                .select_from(Call)
-                .outerjoin(Contact, Call.contact_id == Contact.id)
-                .where(final_where)
-            )
-            
-            # Paginated query with contact join for search
-            stmt = (
-                select(Call)
-                .outerjoin(Contact, Call.contact_id == Contact.id)
-                .options(
-                    selectinload(Call.contact),
-                    selectinload(Call.voice_agent).selectinload(VoiceAgent.phone_number)
-                )
-                .where(final_where)
-                .order_by(desc(Call.created_at))
-                .offset(max(page - 1, 0) * page_size)
-                .limit(page_size)
-            )
-        else:
-            where_clause = and_(*conditions)
-            
-            # Count query without search
-            count_stmt = select(func.count(Call.id)).select_from(Call).where(where_clause)
-            
-            # Paginated query without search
-            stmt = (
-                select(Call)
-                .options(
-                    selectinload(Call.contact),
-                    selectinload(Call.voice_agent).selectinload(VoiceAgent.phone_number)
-                )
-                .where(where_clause)
-                .order_by(desc(Call.created_at))
-                .offset(max(page - 1, 0) * page_size)
-                .limit(page_size)
-            )
+            count_stmt = count_stmt.outerjoin(Contact, Call.contact_id == Contact.id)
+        
+        where_clause = and_(*conditions)
+        count_stmt = count_stmt.where(where_clause)
+        
+        # Latest first (keyset when the caller passes a cursor)
+        stmt = paginate_latest_first(
+            select(*_CALL_LIST_COLUMNS)
+            .select_from(Call)
+            .outerjoin(Contact, Call.contact_id == Contact.id)
+            .outerjoin(VoiceAgent, Call.voice_agent_id == VoiceAgent.id)
+            .outerjoin(PhoneNumber, VoiceAgent.phone_number_id == PhoneNumber.id)
+            .where(where_clause),
+            Call, page, page_size, cursor
+        )
         
-        # Execute count query
-        count_result = await session.execute(count_stmt)
-        total = count_result.scalar_one() or 0
+        # Count query, reused for _CALL_COUNT_CACHE_TTL across pages of the same list
+        count_key = (real_estate_agent_id, status, direction, search)
+        entry = _call_count_cache.get(count_key)
+        if entry and datetime.utcnow() - entry[1] < _CALL_COUNT_CACHE_TTL:
+            total = entry[0]
+        else:
+            version = _call_version(real_estate_agent_id)
+            count_result = await session.execute(count_stmt)
+            total = count_result.scalar_one() or 0
+            if _call_version(real_estate_agent_id) == version:
+                _remember(_call_count_cache, count_key, total, _CALL_COUNT_CACHE_TTL)
         
         result = await session.execute(stmt)
-        calls = result.scalars().all()
-        
-        items = [
-            {
-                "id": call.id,
-                "voice_agent_id": call.voice_agent_id,
-                "voice_agent_name": call.voice_agent.name if call.voice_agent else None,
-                "real_estate_agent_id": call.real_estate_agent_id,
-                "twilio_call_sid": call.twilio_call_sid,
-                "contact_id": call.contact_id,
-                "contact_name": call.contact.name if call.contact else None,
-                "contact_phone": call.contact.phone_number if call.contact else None,
-                "from_number": call.from_number,
-                "to_number": call.to_number,
-                "twilio_phone_number": call.voice_agent.phone_number.twilio_phone_number if call.voice_agent and call.voice_agent.phone_number else None,
-                "status": call.status,
-                "direction": call.direction,
-                "duration_seconds": call.duration_seconds,
-                "recording_url": call.recording_url,
-                "recording_sid": call.recording_sid,
-                "transcript": call.transcript,
-                "transcript_json": call.transcript_json,
-                "user_pov_summary": call.user_pov_summary,
-                "sentiment_label": call.sentiment_label,
-                "sentiment_scores": call.sentiment_scores,
-                "started_at": call.started_at.isoformat() if call.started_at else None,
-                "answered_at": call.answered_at.isoformat() if call.answered_at else None,
-                "ended_at": call.ended_at.isoformat() if call.ended_at else None,
-                "created_at": call.created_at.isoformat() if call.created_at else "",
-                "updated_at": call.updated_at.isoformat() if call.updated_at else "",
-            }
-            for call in calls
-        ]
+        rows = result.all()
+        items = [_call_mapping_to_row(row._mapping) for row in rows]
 
         items = await enrich_calls_with_sentiment(items)
-        return items, total
+        return items, total, next_cursor(rows, page_size)
 
 
 async def get_call_by_id(call_id: str, real_estate_agent_id: str) -> Optional[Dict]:
     """Get a specific call by ID with proper joins"""
+    key = (call_id, real_estate_agent_id)
+    entry = _call_cache.get(key)
+    if entry and datetime.utcnow() - entry[1] < _CALL_CACHE_TTL:
+        return dict(entry[0])
+    
+    version = _call_version(real_estate_agent_id)
+    call = await _query_call_by_id(call_id, real_estate_agent_id)
+    if not call:
+        return None
+    if _call_version(real_estate_agent_id) == version:
+        _remember(_call_cache, key, call, _CALL_CACHE_TTL)
+    return dict(call)
+
+
+async def _query_call_by_id(call_id: str, real_estate_agent_id: str) -> Optional[Dict]:
     async with AsyncSessionLocal() as session:
         stmt = (
             select(Call)
@@ -466,35 +705,7 @@ async def get_call_by_id(call_id: str, real_estate_agent_id: str) -> Optional[Di
         if not call:
             return None
         
-        row = {
-            "id": call.id,
-            "voice_agent_id": call.voice_agent_id,
-            "voice_agent_name": call.voice_agent.name if call.voice_agent else None,
-            "real_estate_agent_id": call.real_estate_agent_id,
-            "twilio_call_sid": call.twilio_call_sid,
-            "contact_id": call.contact_id,
-            "contact_name": call.contact.name if call.contact else None,
-            "contact_phone": call.contact.phone_number if call.contact else None,
-            "from_number": call.from_number,
-            "to_number": call.to_number,
-            "twilio_phone_number": call.voice_agent.phone_number.twilio_phone_number if call.voice_agent and call.voice_agent.phone_number else None,
-            "status": call.status,
-            "direction": call.direction,
-            "duration_seconds": call.duration_seconds,
-            "recording_url": call.recording_url,
-            "recording_sid": call.recording_sid,
-            "transcript": call.transcript,
-            "transcript_json": call.transcript_json,
-            "user_pov_summary": call.user_pov_summary,
-            "sentiment_label": call.sentiment_label,
-            "sentiment_scores": call.sentiment_scores,
-            "started_at": call.started_at.isoformat() if call.started_at else None,
-            "answered_at": call.answered_at.isoformat() if call.answered_at else None,
-            "ended_at": call.ended_at.isoformat() if call.ended_at else None,
-            "created_at": call.created_at.isoformat() if call.created_at else "",
-            "updated_at": call.updated_at.isoformat() if call.updated_at else "",
-        }
-        enriched = await enrich_calls_with_sentiment([row])
+        enriched = await enrich_calls_with_sentiment([_call_to_row(call)])
         return enriched[0] if enriched else None
 
 
@@ -504,34 +715,30 @@ async def update_call_status(
     duration: Optional[int] = None
 ) -> Optional[Dict]:
     """Update call status from Twilio webhook"""
+    # Fires several times per call, so one UPDATE ... RETURNING on the unique sid
+    # index instead of load, flush and refresh
+    now = datetime.utcnow()
+    values: Dict[str, Any] = {"status": status}
+    
+    # Update timestamps based on status
+    if status == "in-progress":
+        values["answered_at"] = func.coalesce(Call.answered_at, now)
+    elif status in ["completed", "failed", "busy", "no-answer"]:
+        values["ended_at"] = now
+    
+    if duration is not None:
+        values["duration_seconds"] = duration
+    
     async with AsyncSessionLocal() as session:
-        stmt = select(Call).where(Call.twilio_call_sid == twilio_call_sid)
-        result = await session.execute(stmt)
-        call = result.scalar_one_or_none()
-        
-        if not call:
-            return None
-        
-        call.status = status
-        
-        # Update timestamps based on status
-        now = datetime.utcnow()
-        if status == "in-progress" and not call.answered_at:
-            call.answered_at = now
-        elif status in ["completed", "failed", "busy", "no-answer"]:
-            call.ended_at = now
-        
-        if duration is not None:
-            call.duration_seconds = duration
-        
+        result = await session.execute(
+            update(Call)
+            .where(Call.twilio_call_sid == twilio_call_sid)
+            .values(**values)
+            .returning(Call.id, Call.real_estate_agent_id, Call.status, Call.duration_seconds)
+        )
+        row = result.mappings().one_or_none()
         await session.commit()
-        await session.refresh(call)
-        
-        return {
-            "id": call.id,
-            "status": call.status,
-            "duration_seconds": call.duration_seconds,
-        }
+    return _updated_call(row)
 
 
 async def save_recording(
@@ -541,24 +748,15 @@ async def save_recording(
 ) -> Optional[Dict]:
     """Save recording URL from Twilio webhook"""
     async with AsyncSessionLocal() as session:
-        stmt = select(Call).where(Call.twilio_call_sid == twilio_call_sid)
-        result = await session.execute(stmt)
-        call = result.scalar_one_or_none()
-        
-        if not call:
-            return None
-        
-        call.recording_url = recording_url
-        call.recording_sid = recording_sid
-        
+        result = await session.execute(
+            update(Call)
+            .where(Call.twilio_call_sid == twilio_call_sid)
+            .values(recording_url=recording_url, recording_sid=recording_sid)
+            .returning(Call.id, Call.real_estate_agent_id, Call.recording_url, Call.recording_sid)
+        )
+        row = result.mappings().one_or_none()
         await session.commit()
-        await session.refresh(call)
-        
-        return {
-            "id": call.id,
-            "recording_url": call.recording_url,
-            "recording_sid": call.recording_sid,
-        }
+    return _updated_call(row)
 
 
 async def save_transcript(
@@ -569,24 +767,19 @@ async def save_transcript(
 ) -> Optional[Dict]:
     """Save transcript and structured history for a call"""
     async with AsyncSessionLocal() as session:
-        stmt = select(Call).where(Call.id == call_id)
-        result = await session.execute(stmt)
-        call = result.scalar_one_or_none()
-        
-        if not call:
-            return None
-        
-        call.transcript = transcript
-        call.transcript_json = transcript_json
-        call.user_pov_summary = user_pov_summary
+        result = await session.execute(
+            update(Call)
+            .where(Call.id == call_id)
+            .values(
+                transcript=transcript,
+                transcript_json=transcript_json,
+                user_pov_summary=user_pov_summary,
+            )
+            .returning(Call.id, Call.real_estate_agent_id, Call.transcript, Call.transcript_json, Call.user_pov_summary)
+        )
+        row = result.mappings().one_or_none()
         await session.commit()
-        
-        return {
-            "id": call.id,
-            "transcript": call.transcript,
-            "transcript_json": call.transcript_json,
-            "user_pov_summary": call.user_pov_summary,
-        }
+    return _updated_call(row)
 
 
 async def save_transcript_by_twilio_sid(
@@ -597,25 +790,19 @@ async def save_transcript_by_twilio_sid(
 ) -> Optional[Dict]:
     """Save transcript and structured history using the Twilio Call SID"""
     async with AsyncSessionLocal() as session:
-        stmt = select(Call).where(Call.twilio_call_sid == twilio_call_sid)
-        result = await session.execute(stmt)
-        call = result.scalar_one_or_none()
-        
-        if not call:
-            return None
-        
-        call.transcript = transcript
-        call.transcript_json = transcript_json
-        call.user_pov_summary = user_pov_summary
-        
+        result = await session.execute(
+            update(Call)
+            .where(Call.twilio_call_sid == twilio_call_sid)
+            .values(
+                transcript=transcript,
+                transcript_json=transcript_json,
+                user_pov_summary=user_pov_summary,
+            )
+            .returning(Call.id, Call.real_estate_agent_id, Call.transcript, Call.transcript_json, Call.user_pov_summary)
+        )
+        row = result.mappings().one_or_none()
         await session.commit()
-        
-        return {
-            "id": call.id,
-            "transcript": call.transcript,
-            "transcript_json": call.transcript_json,
-            "user_pov_summary": call.user_pov_summary,
-        }
+    return _updated_call(row)
 
 
 def _end_user_phone_match(user_digits: str):
@@ -666,11 +853,11 @@ def _call_to_row(call: Call) -> Dict:
         "user_pov_summary": call.user_pov_summary,
         "sentiment_label": call.sentiment_label,
         "sentiment_scores": call.sentiment_scores,
-        "started_at": call.started_at.isoformat() if call.started_at else None,
-        "answered_at": call.answered_at.isoformat() if call.answered_at else None,
-        "ended_at": call.ended_at.isoformat() if call.ended_at else None,
-        "created_at": call.created_at.isoformat() if call.created_at else "",
-        "updated_at": call.updated_at.isoformat() if call.updated_at else "",
+        "started_at": call.started_at,
+        "answered_at": call.answered_at,
+        "ended_at": call.ended_at,
+        "created_at": call.created_at,
+        "updated_at": call.updated_at,
     }
 
 
@@ -741,37 +928,26 @@ async def fetch_twilio_recording_bytes(recording_url: str) -> Tuple[bytes, str]:
     Download recording from Twilio (Basic auth). Returns (body, content_type).
     Used by agent and end-user recording proxies.
     """
-    import base64
-    import httpx
-
     if not settings.TWILIO_ACCOUNT_SID or not settings.TWILIO_AUTH_TOKEN:
         raise ValueError("Twilio credentials not configured")
 
-    credentials = f"{settings.TWILIO_ACCOUNT_SID}:{settings.TWILIO_AUTH_TOKEN}"
-    encoded_credentials = base64.b64encode(credentials.encode()).decode()
-    auth_header = f"Basic {encoded_credentials}"
-
     twilio_url = recording_url
     if not twilio_url.endswith((".mp3", ".wav", ".m4a")):
         if "api.twilio.com" in twilio_url and "/Recordings/" in twilio_url:
             twilio_url = f"{recording_url}.mp3"
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            twilio_url,
-            headers={
-                "Authorization": auth_header,
-                "Accept": "audio/mpeg, audio/mp3, */*",
-            },
-            timeout=30.0,
-            follow_redirects=True,
+    response = await get_twilio_http_client().get(
+        twilio_url,
+        headers={"Accept": "audio/mpeg, audio/mp3, */*"},
+        timeout=30.0,
+        follow_redirects=True,
+    )
+    if response.status_code != 200:
+        raise RuntimeError(
+            f"Twilio recording HTTP {response.status_code}: {response.text[:200]}"
         )
-        if response.status_code != 200:
-            raise RuntimeError(
-                f"Twilio recording HTTP {response.status_code}: {response.text[:200]}"
-            )
-        content_type = response.headers.get("content-type", "audio/mpeg")
-        if "audio" not in content_type:
-            content_type = "audio/mpeg"
-        return response.content, content_type
+    content_type = response.headers.get("content-type", "audio/mpeg")
+    if "audio" not in content_type:
+        content_type = "audio/mpeg"
+    return response.content, content_type
 
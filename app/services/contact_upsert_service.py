@@ -6,12 +6,16 @@ import uuid
 import logging
 from typing import Optional, Dict
 
-from sqlalchemy import select, and_, or_
+from sqlalchemy import select, and_
 from app.database.connection import AsyncSessionLocal
-from app.models.contact import Contact
+from app.models.contact import Contact, phone_last10
+from app.services.admin_service import invalidate_agent_full_details
 
 logger = logging.getLogger(__name__)
 
+# Formatting characters dropped from caller numbers in one str.translate pass
+_PHONE_STRIP = str.maketrans("", "", " -()\t\n")
+
 
 async def upsert_caller_contact(
     real_estate_agent_id: str,
@@ -31,11 +35,7 @@ async def upsert_caller_contact(
             stmt = select(Contact).where(
                 and_(
                     Contact.real_estate_agent_id == real_estate_agent_id,
-                    or_(
-                        Contact.phone_number == caller_phone,
-                        Contact.phone_number == normalized,
-                        Contact.phone_number.like(f"%{normalized[-10:]}%"),
-                    ),
+                    Contact.phone_last10 == phone_last10(caller_phone),
                 )
             )
             result = await session.execute(stmt)
@@ -51,6 +51,7 @@ async def upsert_caller_contact(
                     changed = True
                 if changed:
                     await session.commit()
+                    invalidate_agent_full_details(real_estate_agent_id)
                     await session.refresh(contact)
                     logger.info(f"✏️ Updated contact {contact.id} with new info")
             else:
@@ -64,6 +65,7 @@ async def upsert_caller_contact(
                 )
                 session.add(contact)
                 await session.commit()
+                invalidate_agent_full_details(real_estate_agent_id)
                 await session.refresh(contact)
                 logger.info(f"✅ Auto-created contact {contact.id} for {normalized}")
 
@@ -79,7 +81,7 @@ async def upsert_caller_contact(
 
 
 def _normalize_phone(phone: str) -> str:
-    cleaned = phone.strip().replace(" ", "").replace("-", "")
+    cleaned = phone.translate(_PHONE_STRIP)
     if not cleaned.startswith("+"):
         if cleaned.startswith("92"):
             cleaned = "+" + cleaned
@@ -5,8 +5,8 @@ Falls back gracefully; LLM handles disambiguation for ambiguous cases.
 """
 import re
 import logging
-from datetime import datetime, timedelta, timezone
-from typing import Dict, Optional, List
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Optional, List, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -132,19 +132,30 @@ def resolve_datetime(date_hint: Optional[str], time_hint: Optional[str]) -> Opti
     return datetime(base_date.year, base_date.month, base_date.day, hour, minute, tzinfo=PKT)
 
 
+# (PKT date, text) of the last get_current_week_dates() result: it only changes once a day
+_week_dates_cache: Optional[Tuple[date, str]] = None
+
+
 def get_current_week_dates() -> str:
     """
     Return a human-readable string of today + the next 7 days so the LLM
     can resolve day-of-week names ("Monday") to exact calendar dates.
     """
+    global _week_dates_cache
     today = datetime.now(PKT).date()
+    cached = _week_dates_cache
+    if cached is not None and cached[0] == today:
+        return cached[1]
+    
     lines = [f"Today is {today.strftime('%A, %B %d, %Y')}."]
     upcoming = []
     for delta in range(1, 8):
         d = today + timedelta(days=delta)
         upcoming.append(d.strftime("%a %b %d"))
     lines.append("Upcoming: " + ", ".join(upcoming) + ".")
-    return " ".join(lines)
+    text = " ".join(lines)
+    _week_dates_cache = (today, text)
+    return text
 
 
 # --------------- internal helpers ---------------
@@ -319,3 +319,25 @@ def get_turn_count(call_sid: str) -> int:
     """Return the number of user turns so far (useful for early-call logic)."""
     state = get_conversation_state(call_sid)
     return state.get("turn_count", 0) if state else 0
+
+
+# --------------- system prompt reuse ---------------
+
+def get_session_prompt(call_sid: str, kind: str, context: Dict, confirmed_topics: Set[str]) -> Optional[str]:
+    """
+    System prompt built earlier in this call for the same inputs, or None.
+    The context is compared by identity: it is only ever replaced wholesale
+    (when the background build finishes), never mutated.
+    """
+    state = get_conversation_state(call_sid)
+    cached = state.get("session_prompt") if state else None
+    if cached and cached[0] == kind and cached[1] is context and cached[2] == confirmed_topics:
+        return cached[3]
+    return None
+
+
+def set_session_prompt(call_sid: str, kind: str, context: Dict, confirmed_topics: Set[str], prompt: str) -> None:
+    """Remember the system prompt built for these inputs (see get_session_prompt)."""
+    state = get_conversation_state(call_sid)
+    if state:
+        state["session_prompt"] = (kind, context, frozenset(confirmed_topics), prompt)
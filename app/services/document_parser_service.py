@@ -176,7 +176,7 @@ async def parse_csv(file_content: bytes) -> Dict:
                 
                 # Normalize is_available
                 is_avail_raw = get_val("is_available", "true").lower()
-                is_available = "true" if is_avail_raw in ("true", "1", "yes", "y", "available") else "false"
+                is_available = is_avail_raw in ("true", "1", "yes", "y", "available")
                 
                 # Clean amenities - remove quotes and normalize separators
                 amenities_raw = get_val("amenities")
@@ -316,7 +316,7 @@ async def parse_pdf(file_content: bytes) -> List[Dict]:
             "amenities": "",
             "owner_name": "",
             "owner_phone": "",
-            "is_available": "true",
+            "is_available": True,
         }]
     except Exception as e:
         raise ValueError(f"Failed to parse PDF: {str(e)}")
@@ -342,7 +342,7 @@ async def parse_docx(file_content: bytes) -> List[Dict]:
             "amenities": "",
             "owner_name": "",
             "owner_phone": "",
-            "is_available": "true",
+            "is_available": True,
         }]
     except Exception as e:
         raise ValueError(f"Failed to parse DOCX: {str(e)}")
@@ -5,11 +5,14 @@ from sqlalchemy import select, delete
 from app.database.connection import AsyncSessionLocal
 from app.models.document import Document
 from app.models.property import Property
+from app.services.admin_service import invalidate_agent_full_details
+from app.services.ai.context_service import invalidate_inbound_context
 from app.services.cloudinary_service import upload_file_to_cloudinary, delete_file_from_cloudinary
 from app.services.document_parser_service import parse_document
 from app.services.real_estate_agent.contact_service import find_or_create_contact_by_phone
 from app.services.rag.embedding_job_service import create_embedding_job
 from app.services.rag.kb_indexing_service import run_kb_indexing
+from app.utils.serialization import iso_or
 
 
 async def upload_document(
@@ -42,6 +45,7 @@ async def upload_document(
         
         session.add(new_document)
         await session.commit()
+        invalidate_agent_full_details(real_estate_agent_id)
         await session.refresh(new_document)
 
         if (upload_kind or "property_import") == "knowledge_base":
@@ -74,7 +78,7 @@ async def upload_document(
                 "cloudinary_url": cloudinary_data["cloudinary_url"],
                 "description": description,
                 "upload_kind": new_document.upload_kind,
-                "created_at": new_document.created_at.isoformat() if new_document.created_at else "",
+                "created_at": iso_or(new_document.created_at),
             }
         
         # Parse document and extract properties + contacts
@@ -152,7 +156,7 @@ async def upload_document(
                         amenities=prop_data.get("amenities"),
                         owner_name=prop_data.get("owner_name"),
                         owner_phone=prop_data.get("owner_phone", ""),
-                        is_available=prop_data.get("is_available", "true"),
+                        is_available=prop_data.get("is_available", True),
                     )
                     session.add(new_property)
                     properties_created += 1
@@ -175,6 +179,8 @@ async def upload_document(
             print(f"{'='*60}\n")
             
             await session.commit()
+            invalidate_inbound_context(real_estate_agent_id)
+            invalidate_agent_full_details(real_estate_agent_id)
         except Exception as e:
             # Log error but don't fail document upload
             print(f"Warning: Failed to parse document: {str(e)}")
@@ -188,7 +194,7 @@ async def upload_document(
             "cloudinary_url": cloudinary_data["cloudinary_url"],
             "description": description,
             "upload_kind": new_document.upload_kind,
-            "created_at": new_document.created_at.isoformat() if new_document.created_at else "",
+            "created_at": iso_or(new_document.created_at),
         }
 
 
@@ -241,8 +247,8 @@ async def get_documents_by_agent_id(real_estate_agent_id: str) -> List[dict]:
                 "upload_kind": getattr(doc, "upload_kind", None) or "property_import",
                 "properties_count": properties_counts.get(doc.id, 0),
                 "contacts_count": contacts_counts.get(doc.id, 0),
-                "created_at": doc.created_at.isoformat() if doc.created_at else "",
-                "updated_at": doc.updated_at.isoformat() if doc.updated_at else "",
+                "created_at": iso_or(doc.created_at),
+                "updated_at": iso_or(doc.updated_at),
             }
             for doc in docs
         ]
@@ -269,5 +275,7 @@ async def delete_document(document_id: str, real_estate_agent_id: str) -> bool:
         # Delete document
         await session.delete(doc)
         await session.commit()
+        invalidate_inbound_context(real_estate_agent_id)
+        invalidate_agent_full_details(real_estate_agent_id)
         
         return True
@@ -4,6 +4,7 @@ import uuid
 from sqlalchemy import select
 from app.database.connection import AsyncSessionLocal
 from app.models.phone_number import PhoneNumber
+from app.services.admin_service import invalidate_agent_full_details
 from app.services.twilio_service.client import (
     purchase_phone_number,
     release_phone_number,
@@ -40,6 +41,7 @@ async def assign_phone_number_to_agent(real_estate_agent_id: str, area_code: Opt
         
         session.add(new_phone)
         await session.commit()
+        invalidate_agent_full_details(real_estate_agent_id)
         await session.refresh(new_phone)
         
         return {
@@ -119,6 +121,7 @@ async def update_phone_number(phone_id: str, update_data: dict) -> Optional[dict
                 setattr(phone, key, value)
         
         await session.commit()
+        invalidate_agent_full_details(phone.real_estate_agent_id)
         await session.refresh(phone)
         
         # Return updated phone number
@@ -256,6 +259,7 @@ async def assign_existing_phone_number_to_agent(real_estate_agent_id: str, phone
         logger.info(f"📞 [PHONE_ASSIGN] Step 6: Saving to database...")
         session.add(new_phone)
         await session.commit()
+        invalidate_agent_full_details(real_estate_agent_id)
         await session.refresh(new_phone)
 
         # Update webhook URLs in Twilio to match current TWILIO_VOICE_WEBHOOK_URL
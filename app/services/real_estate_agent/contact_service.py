@@ -8,6 +8,7 @@ from sqlalchemy.orm import selectinload
 from app.database.connection import AsyncSessionLocal
 from app.models.contact import Contact
 from app.models.property import Property
+from app.services.admin_service import invalidate_agent_full_details
 import uuid
 import re
 
@@ -55,6 +56,7 @@ async def create_contact(
         
         session.add(new_contact)
         await session.commit()
+        invalidate_agent_full_details(real_estate_agent_id)
         await session.refresh(new_contact)
         
         return {
@@ -64,8 +66,8 @@ async def create_contact(
             "phone_number": new_contact.phone_number,
             "email": new_contact.email,
             "notes": new_contact.notes,
-            "created_at": new_contact.created_at.isoformat() if new_contact.created_at else "",
-            "updated_at": new_contact.updated_at.isoformat() if new_contact.updated_at else "",
+            "created_at": new_contact.created_at,
+            "updated_at": new_contact.updated_at,
         }
 
 
@@ -99,8 +101,8 @@ async def find_or_create_contact_by_phone(
                 "phone_number": existing_contact.phone_number,
                 "email": existing_contact.email,
                 "notes": existing_contact.notes,
-                "created_at": existing_contact.created_at.isoformat() if existing_contact.created_at else "",
-                "updated_at": existing_contact.updated_at.isoformat() if existing_contact.updated_at else "",
+                "created_at": existing_contact.created_at,
+                "updated_at": existing_contact.updated_at,
             }
         
         # Create new contact
@@ -115,6 +117,7 @@ async def find_or_create_contact_by_phone(
         
         session.add(new_contact)
         await session.commit()
+        invalidate_agent_full_details(real_estate_agent_id)
         await session.refresh(new_contact)
         
         return {
@@ -124,8 +127,8 @@ async def find_or_create_contact_by_phone(
             "phone_number": new_contact.phone_number,
             "email": new_contact.email,
             "notes": new_contact.notes,
-            "created_at": new_contact.created_at.isoformat() if new_contact.created_at else "",
-            "updated_at": new_contact.updated_at.isoformat() if new_contact.updated_at else "",
+            "created_at": new_contact.created_at,
+            "updated_at": new_contact.updated_at,
         }
 
 
@@ -185,8 +188,8 @@ async def get_contacts_by_agent_id(
                 "phone_number": contact.phone_number,
                 "email": contact.email,
                 "notes": contact.notes,
-                "created_at": contact.created_at.isoformat() if contact.created_at else "",
-                "updated_at": contact.updated_at.isoformat() if contact.updated_at else "",
+                "created_at": contact.created_at,
+                "updated_at": contact.updated_at,
             }
             
             if include_properties:
@@ -217,8 +220,8 @@ async def get_contact_by_id(contact_id: str, real_estate_agent_id: str) -> Optio
             "phone_number": contact.phone_number,
             "email": contact.email,
             "notes": contact.notes,
-            "created_at": contact.created_at.isoformat() if contact.created_at else "",
-            "updated_at": contact.updated_at.isoformat() if contact.updated_at else "",
+            "created_at": contact.created_at,
+            "updated_at": contact.updated_at,
         }
 
 
@@ -250,6 +253,7 @@ async def update_contact(
             contact.notes = update_data["notes"]
         
         await session.commit()
+        invalidate_agent_full_details(real_estate_agent_id)
         await session.refresh(contact)
         
         return {
@@ -259,8 +263,8 @@ async def update_contact(
             "phone_number": contact.phone_number,
             "email": contact.email,
             "notes": contact.notes,
-            "created_at": contact.created_at.isoformat() if contact.created_at else "",
-            "updated_at": contact.updated_at.isoformat() if contact.updated_at else "",
+            "created_at": contact.created_at,
+            "updated_at": contact.updated_at,
         }
 
 
@@ -288,6 +292,7 @@ async def delete_contact(contact_id: str, real_estate_agent_id: str) -> bool:
         # Delete contact
         await session.delete(contact)
         await session.commit()
+        invalidate_agent_full_details(real_estate_agent_id)
         
         return True
 
@@ -358,6 +363,7 @@ async def link_property_to_contact(
         # Link property to contact
         property_obj.contact_id = contact_id
         await session.commit()
+        invalidate_agent_full_details(real_estate_agent_id)
         
         return True
 
@@ -3,7 +3,7 @@ Agent Dashboard Service - Calculates dashboard statistics
 Optimized with database aggregations for performance
 """
 from typing import Dict
-from sqlalchemy import select, func, case, cast, Boolean
+from sqlalchemy import select, func, case, cast, Boolean, true, false
 from app.database.connection import AsyncSessionLocal
 from app.models.property import Property
 from app.models.document import Document
@@ -23,8 +23,8 @@ async def get_agent_dashboard_stats(agent_id: str) -> Dict:
         # 1. Properties stats - single query
         properties_stmt = select(
             func.count(Property.id).label('total'),
-            func.sum(case((Property.is_available == 'true', 1), else_=0)).label('available'),
-            func.sum(case((Property.is_available == 'false', 1), else_=0)).label('unavailable'),
+            func.sum(case((Property.is_available == true(), 1), else_=0)).label('available'),
+            func.sum(case((Property.is_available == false(), 1), else_=0)).label('unavailable'),
             func.count(func.distinct(Property.property_type)).label('types_count')
         ).where(Property.real_estate_agent_id == agent_id)
         
@@ -7,6 +7,7 @@ from app.database.connection import AsyncSessionLocal
 from app.models.document import Document
 from app.models.property import Property
 from app.models.contact import Contact
+from app.utils.serialization import iso_or, price_text
 
 
 async def get_document_details(document_id: str, real_estate_agent_id: str) -> Optional[Dict]:
@@ -48,8 +49,8 @@ async def get_document_details(document_id: str, real_estate_agent_id: str) -> O
             "description": doc.description,
             "properties_count": properties_count,
             "contacts_count": contacts_count,
-            "created_at": doc.created_at.isoformat() if doc.created_at else "",
-            "updated_at": doc.updated_at.isoformat() if doc.updated_at else "",
+            "created_at": iso_or(doc.created_at),
+            "updated_at": iso_or(doc.updated_at),
         }
 
 
@@ -79,7 +80,7 @@ async def get_document_properties(document_id: str, real_estate_agent_id: str) -
                 "city": prop.city,
                 "state": prop.state,
                 "property_type": prop.property_type,
-                "price": str(prop.price) if prop.price else None,
+                "price": price_text(prop.price),
                 "is_available": prop.is_available,
                 "contact_id": prop.contact_id,
             }
@@ -5,6 +5,8 @@ from typing import Optional, Dict
 from sqlalchemy import select
 from app.database.connection import AsyncSessionLocal
 from app.models.real_estate_agent import RealEstateAgent
+from app.services.admin_service import invalidate_agent_full_details
+from app.services.ai.context_service import invalidate_inbound_context
 from app.utils.security import verify_password, get_password_hash
 
 
@@ -66,6 +68,8 @@ async def update_agent_profile(agent_id: str, update_data: Dict) -> Optional[Dic
             agent.email = update_data["email"].lower()
         
         await session.commit()
+        invalidate_inbound_context(agent_id)
+        invalidate_agent_full_details(agent_id)
         await session.refresh(agent)
         
         return {
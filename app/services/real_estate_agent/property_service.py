@@ -6,6 +6,9 @@ from typing import Optional, List, Dict, Tuple
 from sqlalchemy import select, or_, and_, desc, func
 from app.database.connection import AsyncSessionLocal
 from app.models.property import Property
+from app.services.admin_service import invalidate_agent_full_details
+from app.services.ai.context_service import invalidate_inbound_context
+from app.utils.serialization import iso_or, price_text
 import uuid
 
 
@@ -41,11 +44,13 @@ async def create_property(
             amenities=property_data.get("amenities"),
             owner_name=property_data.get("owner_name"),
             owner_phone=property_data.get("owner_phone", ""),
-            is_available=property_data.get("is_available", "true"),
+            is_available=property_data.get("is_available", True),
         )
         
         session.add(new_property)
         await session.commit()
+        invalidate_inbound_context(real_estate_agent_id)
+        invalidate_agent_full_details(real_estate_agent_id)
         await session.refresh(new_property)
         
         return {
@@ -58,7 +63,7 @@ async def create_property(
             "city": new_property.city,
             "state": new_property.state,
             "zip_code": new_property.zip_code,
-            "price": str(new_property.price) if new_property.price else None,
+            "price": price_text(new_property.price),
             "bedrooms": new_property.bedrooms,
             "bathrooms": new_property.bathrooms,
             "square_feet": new_property.square_feet,
@@ -67,8 +72,8 @@ async def create_property(
             "owner_name": new_property.owner_name,
             "owner_phone": new_property.owner_phone,
             "is_available": new_property.is_available,
-            "created_at": new_property.created_at.isoformat() if new_property.created_at else "",
-            "updated_at": new_property.updated_at.isoformat() if new_property.updated_at else "",
+            "created_at": iso_or(new_property.created_at),
+            "updated_at": iso_or(new_property.updated_at),
         }
 
 
@@ -77,7 +82,7 @@ async def get_properties_by_agent_id(
     search: Optional[str] = None,
     property_type: Optional[str] = None,
     city: Optional[str] = None,
-    is_available: Optional[str] = None,
+    is_available: Optional[bool] = None,
     contact_id: Optional[str] = None,
     bedrooms: Optional[int] = None,
     page: int = 1,
@@ -110,8 +115,8 @@ async def get_properties_by_agent_id(
         if city:
             conditions.append(Property.city.ilike(f"%{city}%"))
 
-        if is_available:
-            conditions.append(Property.is_available == is_available.lower())
+        if is_available is not None:
+            conditions.append(Property.is_available == is_available)
 
         if contact_id:
             conditions.append(Property.contact_id == contact_id)
@@ -149,7 +154,7 @@ async def get_properties_by_agent_id(
                 "city": prop.city,
                 "state": prop.state,
                 "zip_code": prop.zip_code,
-                "price": str(prop.price) if prop.price else None,
+                "price": price_text(prop.price),
                 "bedrooms": prop.bedrooms,
                 "bathrooms": prop.bathrooms,
                 "square_feet": prop.square_feet,
@@ -158,8 +163,8 @@ async def get_properties_by_agent_id(
                 "owner_name": prop.owner_name,
                 "owner_phone": prop.owner_phone,
                 "is_available": prop.is_available,
-                "created_at": prop.created_at.isoformat() if prop.created_at else "",
-                "updated_at": prop.updated_at.isoformat() if prop.updated_at else "",
+                "created_at": iso_or(prop.created_at),
+                "updated_at": iso_or(prop.updated_at),
             }
             for prop in props
         ]
@@ -190,7 +195,7 @@ async def get_property_by_id(property_id: str, real_estate_agent_id: str) -> Opt
             "city": prop.city,
             "state": prop.state,
             "zip_code": prop.zip_code,
-            "price": str(prop.price) if prop.price else None,
+            "price": price_text(prop.price),
             "bedrooms": prop.bedrooms,
             "bathrooms": prop.bathrooms,
             "square_feet": prop.square_feet,
@@ -199,8 +204,8 @@ async def get_property_by_id(property_id: str, real_estate_agent_id: str) -> Opt
             "owner_name": prop.owner_name,
             "owner_phone": prop.owner_phone,
             "is_available": prop.is_available,
-            "created_at": prop.created_at.isoformat() if prop.created_at else "",
-            "updated_at": prop.updated_at.isoformat() if prop.updated_at else "",
+            "created_at": iso_or(prop.created_at),
+            "updated_at": iso_or(prop.updated_at),
         }
 
 
@@ -237,6 +242,8 @@ async def update_property(
                     setattr(prop, key, value)
         
         await session.commit()
+        invalidate_inbound_context(real_estate_agent_id)
+        invalidate_agent_full_details(real_estate_agent_id)
         await session.refresh(prop)
         
         return {
@@ -249,7 +256,7 @@ async def update_property(
             "city": prop.city,
             "state": prop.state,
             "zip_code": prop.zip_code,
-            "price": str(prop.price) if prop.price else None,
+            "price": price_text(prop.price),
             "bedrooms": prop.bedrooms,
             "bathrooms": prop.bathrooms,
             "square_feet": prop.square_feet,
@@ -258,8 +265,8 @@ async def update_property(
             "owner_name": prop.owner_name,
             "owner_phone": prop.owner_phone,
             "is_available": prop.is_available,
-            "created_at": prop.created_at.isoformat() if prop.created_at else "",
-            "updated_at": prop.updated_at.isoformat() if prop.updated_at else "",
+            "created_at": iso_or(prop.created_at),
+            "updated_at": iso_or(prop.updated_at),
         }
 
 
@@ -278,6 +285,8 @@ async def delete_property(property_id: str, real_estate_agent_id: str) -> bool:
         
         await session.delete(prop)
         await session.commit()
+        invalidate_inbound_context(real_estate_agent_id)
+        invalidate_agent_full_details(real_estate_agent_id)
         
         return True
 
@@ -6,6 +6,8 @@ from app.models.property import Property
 from app.models.document import Document
 from app.models.phone_number import PhoneNumber
 from app.models.contact import Contact
+from app.services.admin_service import invalidate_agent_full_details
+from app.services.ai.context_service import invalidate_inbound_context
 
 
 async def get_agent_summary_stats(agent_id: str, session) -> dict:
@@ -186,6 +188,8 @@ async def update_real_estate_agent(agent_id: str, update_data: dict) -> Optional
                 setattr(agent, key, value)
         
         await session.commit()
+        invalidate_inbound_context(agent_id)
+        invalidate_agent_full_details(agent_id)
         await session.refresh(agent)
         
         # Return updated agent
@@ -324,11 +324,12 @@ async def update_showing(
         await session.commit()
         logger.info(f"Updated showing {showing_id}")
 
-        # Re-fetch with eager-loaded relationships
+        # Re-fetch with eager-loaded relationships, overwriting the identity-mapped copy
         reload_stmt = (
             select(Showing)
             .options(selectinload(Showing.contact), selectinload(Showing.property))
             .where(Showing.id == showing_id)
+            .execution_options(populate_existing=True)
         )
         reload_result = await session.execute(reload_stmt)
         showing = reload_result.scalar_one()
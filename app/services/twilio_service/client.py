@@ -4,13 +4,20 @@ Low-level Twilio API interactions
 """
 from twilio.rest import Client
 from app.config import settings
-from typing import Optional, Dict
+from typing import Any, Optional, Dict
+import httpx
 import logging
 
 logger = logging.getLogger(__name__)
 
 twilio_client: Optional[Client] = None
 
+TWILIO_API_BASE = "https://api.twilio.com/2010-04-01"
+
+# Shared async client for the REST calls on the call path (dialing, recording downloads):
+# keeps TCP + TLS alive across calls, without a thread hop into the SDK's blocking session
+_http_client: Optional[httpx.AsyncClient] = None
+
 
 def get_twilio_client() -> Client:
     """Get or create Twilio client singleton"""
@@ -22,6 +29,51 @@ def get_twilio_client() -> Client:
     return twilio_client
 
 
+def get_twilio_http_client() -> httpx.AsyncClient:
+    """Shared httpx client authenticated against the Twilio REST API"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        if not settings.TWILIO_ACCOUNT_SID or not settings.TWILIO_AUTH_TOKEN:
+            raise ValueError("Twilio credentials not configured. Please set TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN in .env")
+        _http_client = httpx.AsyncClient(
+            auth=(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN),
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30.0),
+        )
+    return _http_client
+
+
+async def aclose_twilio_http_client() -> None:
+    """Close the shared client (app shutdown)"""
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+
+
+async def create_call(to: str, from_: str, url: str, **options: Any) -> Dict[str, Any]:
+    """
+    Place an outbound call (POST Calls.json), returns Twilio's call resource (sid, status, ...)
+    Options take the SDK's snake_case names, e.g. status_callback=..., record=True.
+    """
+    data = {"To": to, "From": from_, "Url": url}
+    for key, value in options.items():
+        name = "".join(part.capitalize() for part in key.split("_"))
+        data[name] = str(value).lower() if isinstance(value, bool) else value
+    
+    response = await get_twilio_http_client().post(
+        f"{TWILIO_API_BASE}/Accounts/{settings.TWILIO_ACCOUNT_SID}/Calls.json",
+        data=data,
+    )
+    if response.status_code >= 400:
+        try:
+            message = response.json().get("message")
+        except ValueError:
+            message = response.text[:200]
+        raise RuntimeError(f"Twilio API error {response.status_code}: {message}")
+    return response.json()
+
+
 def purchase_phone_number_sync(area_code: Optional[str] = None) -> Dict[str, str]:
     """
     Purchase a phone number from Twilio (synchronous)
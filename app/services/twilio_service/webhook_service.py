@@ -9,9 +9,10 @@ PERFORMANCE OPTIMIZATIONS:
 - Background tasks for non-critical operations
 - Caching for frequently accessed data
 """
-from typing import Dict, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+import contextlib
+import re
 import httpx
-import uuid
 import asyncio
 import logging
 from datetime import datetime
@@ -20,8 +21,9 @@ from app.config import settings
 from app.database.connection import AsyncSessionLocal
 from app.models.voice_agent import VoiceAgent
 from app.models.call import Call
+from app.utils.ids import new_id
 from app.models.phone_number import PhoneNumber
-from sqlalchemy import select, or_
+from sqlalchemy import select, or_, bindparam
 from sqlalchemy.orm import selectinload
 from functools import lru_cache
 
@@ -47,6 +49,8 @@ from app.services.conversation.state_manager import (
     get_confirmed_topics,
     get_turn_count,
     get_last_discussed_property,
+    get_session_prompt,
+    set_session_prompt,
 )
 from app.services.conversation.slot_parser import (
     detect_scheduling_intent,
@@ -65,13 +69,17 @@ from app.services.ai.prompt_service import (
     build_inbound_prompt,
     build_booking_prompt,
     get_initial_greeting_prompt,
+    outbound_greeting_context,
+    split_cacheable_prompt,
 )
 from app.services.ai.llm_service import (
     process_with_llm,
     process_with_structured_output,
+    stream_with_llm,
     generate_initial_greeting,
+    get_cached_content_name,
 )
-from app.services.call_service import save_transcript_by_twilio_sid
+from app.services.call_service import invalidate_agent_calls, save_transcript_by_twilio_sid
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +93,47 @@ _deferred_speech: Dict[str, Dict] = {}
 
 FILLER_SOUND_PATH = "/assets/typing.wav"
 
+# Formatting characters dropped from incoming phone numbers in one str.translate pass
+_PHONE_STRIP = str.maketrans("", "", " -()\t\n")
+
+# Call lookups by Twilio SID run on every webhook; built once, bound per request
+_CALL_BY_SID = select(Call).where(Call.twilio_call_sid == bindparam("sid"))
+_CALL_CONTACT_ID_BY_SID = select(Call.contact_id).where(Call.twilio_call_sid == bindparam("sid"))
+
+
+# How long the outbound greeting waits for the LLM before the templated greeting is used
+_GREETING_LLM_BUDGET_SECONDS = 1.5
+
+
+def _fallback_outbound_greeting(
+    voice_agent_name: str,
+    agent_name: Optional[str],
+    company_name: Optional[str],
+    contact_name: Optional[str],
+    property_address: Optional[str],
+) -> str:
+    """Deterministic outbound greeting (forces personalization when we have the name)"""
+    if contact_name:
+        if agent_name and company_name:
+            return (
+                f"Hello, this is {voice_agent_name} from {company_name}. "
+                f"I'm calling on behalf of {agent_name}. Am I contacting {contact_name}?"
+            )
+        return (
+            f"Hello, this is {voice_agent_name}. Am I contacting {contact_name}? "
+            f"I'm calling about your property{f' at {property_address}' if property_address else ''}."
+        )
+    return (
+        f"Hello, this is {voice_agent_name}. "
+        f"Am I speaking with the property owner? I'm calling about your property."
+    )
+
+
+def _discard_task_result(task: "asyncio.Task") -> None:
+    """Done-callback for fire-and-forget tasks: retrieve the exception so it isn't reported as unhandled"""
+    if not task.cancelled():
+        task.exception()
+
 
 def _prepopulate_booking_slots_from_context(
     call_sid: str, context: Dict, is_outbound: bool
@@ -121,54 +170,69 @@ def _prepopulate_booking_slots_from_context(
         logger.info(f"📋 Pre-populated booking slots from context: {list(pre_slots.keys())}")
 
 
-async def _tts_or_say(element, text: str, base_url: str, voice_settings: Optional[Dict] = None):
+def _tts_synthesis_kwargs(base_url: str, voice_settings: Optional[Dict]) -> Optional[Dict]:
     """
-    Speak with the agent's chosen ElevenLabs voice only.
-
-    Uses ``voice_settings.elevenlabs_voice_id`` from the real-estate agent's Voice Studio
-    selection — never the server default voice for live calls.
-
-    Falls back to Twilio ``<Say voice="alice">`` only when: ElevenLabs is disabled, no
-    voice id is configured, synthesis fails, or there is no ``TWILIO_VOICE_WEBHOOK_URL``
-    (needed for Twilio to ``<Play>`` the audio URL).
+    synthesize_speech() keyword arguments for the agent's ElevenLabs voice, or None
+    when the utterance has to fall back to Twilio ``<Say>`` (reason is logged).
     """
-    from app.services.elevenlabs_tts_service import synthesize_speech, is_enabled
-
-    if not text or not str(text).strip():
-        return
+    from app.services.elevenlabs_tts_service import is_enabled
 
     if not is_enabled():
-        element.say(text, voice="alice")
-        return
+        return None
 
     raw_id = (voice_settings or {}).get("elevenlabs_voice_id")
     voice_id = str(raw_id).strip() if raw_id is not None else ""
     if not voice_id:
         logger.info("No elevenlabs_voice_id in agent settings; using Twilio Say for this utterance")
-        element.say(text, voice="alice")
-        return
-
-    speed = 1.0
-    stability = 0.5
-    similarity = 0.75
-    if voice_settings:
-        speed = voice_settings.get("elevenlabs_speed", 1.0)
-        stability = voice_settings.get("elevenlabs_stability", 0.5)
-        similarity = voice_settings.get("elevenlabs_similarity_boost", 0.75)
+        return None
 
     if not (base_url or "").strip():
         logger.warning("TWILIO_VOICE_WEBHOOK_URL unset; cannot <Play> TTS URL, using Twilio Say")
-        element.say(text, voice="alice")
-        return
+        return None
 
-    tts = await synthesize_speech(
-        text=text,
+    voice_settings = voice_settings or {}
+    return dict(
         voice_id=voice_id,
-        speed=speed,
-        stability=stability,
-        similarity_boost=similarity,
+        speed=voice_settings.get("elevenlabs_speed", 1.0),
+        stability=voice_settings.get("elevenlabs_stability", 0.5),
+        similarity_boost=voice_settings.get("elevenlabs_similarity_boost", 0.75),
         allow_env_default_voice=False,
     )
+
+
+async def _tts_or_say(
+    element,
+    text: str,
+    base_url: str,
+    voice_settings: Optional[Dict] = None,
+    tts_task: Optional["asyncio.Task"] = None,
+):
+    """
+    Speak with the agent's chosen ElevenLabs voice only.
+
+    Uses ``voice_settings.elevenlabs_voice_id`` from the real-estate agent's Voice Studio
+    selection — never the server default voice for live calls.
+
+    Falls back to Twilio ``<Say voice="alice">`` only when: ElevenLabs is disabled, no
+    voice id is configured, synthesis fails, or there is no ``TWILIO_VOICE_WEBHOOK_URL``
+    (needed for Twilio to ``<Play>`` the audio URL).
+
+    ``tts_task``: synthesis for ``text`` already started (see _stream_reply); awaited
+    instead of starting a new one.
+    """
+    from app.services.elevenlabs_tts_service import synthesize_speech
+
+    if not text or not str(text).strip():
+        return
+
+    if tts_task is None:
+        tts_kwargs = _tts_synthesis_kwargs(base_url, voice_settings)
+        if tts_kwargs is None:
+            element.say(text, voice="alice")
+            return
+        tts_task = synthesize_speech(text=text, **tts_kwargs)
+
+    tts = await tts_task
     if tts.token:
         play_url = f"{base_url.rstrip('/')}/tts/{tts.token}"
         element.play(play_url)
@@ -181,6 +245,155 @@ async def _tts_or_say(element, text: str, base_url: str, voice_settings: Optiona
     element.say(text, voice="alice")
 
 
+# Sentence boundary in a streamed reply: TTS for a sentence starts as soon as it is complete
+_SENTENCE_END = re.compile(r"(?<=[.?!])\s+")
+# Words whose trailing "." doesn't end a sentence ("12 Main St. Lahore", "Dr. Khan")
+_ABBREVIATIONS = frozenset((
+    "mr", "mrs", "ms", "dr", "prof", "st", "ave", "rd", "blvd", "apt", "sq", "ft", "jr", "sr", "vs",
+))
+
+
+def _split_sentences(text: str) -> Tuple[List[str], str]:
+    """(complete sentences, unfinished rest) of a partial reply; abbreviations and initials don't end one"""
+    *parts, pending = _SENTENCE_END.split(text)
+    sentences, current = [], ""
+    for part in parts:
+        current = f"{current} {part}" if current else part
+        last_word = current.rsplit(None, 1)[-1]
+        word = last_word[:-1].lower()
+        if last_word.endswith(".") and (word in _ABBREVIATIONS or (len(word) == 1 and word.isalpha())):
+            continue
+        sentences.append(current)
+        current = ""
+    return sentences, f"{current} {pending}" if current else pending
+
+
+async def _stream_reply(
+    llm_stream: AsyncIterator[str],
+    base_url: str,
+    voice_settings: Optional[Dict],
+) -> Tuple[str, List[Tuple[str, Optional["asyncio.Task"]]]]:
+    """
+    Consume a streamed LLM reply, starting ElevenLabs synthesis for each sentence as
+    soon as it is complete, so the first clip is being rendered while Gemini is still
+    generating the rest.
+
+    Returns (reply text, [(sentence, synthesis task or None when <Say> is used)]);
+    speak the clips with _speak_reply.
+    """
+    from app.services.elevenlabs_tts_service import synthesize_speech
+
+    tts_kwargs = _tts_synthesis_kwargs(base_url, voice_settings)
+    clips: List[Tuple[str, Optional[asyncio.Task]]] = []
+
+    def start_clip(sentence: str) -> None:
+        sentence = sentence.strip()
+        if not sentence:
+            return
+        task = None
+        if tts_kwargs is not None:
+            task = asyncio.create_task(synthesize_speech(text=sentence, **tts_kwargs))
+            # Also retrieved if the turn times out before the clip is spoken
+            task.add_done_callback(_discard_task_result)
+        clips.append((sentence, task))
+
+    pending = ""
+    async with contextlib.aclosing(llm_stream):
+        async for piece in llm_stream:
+            complete, pending = _split_sentences(pending + piece)
+            for sentence in complete:
+                start_clip(sentence)
+    start_clip(pending)
+
+    return " ".join(sentence for sentence, _ in clips), clips
+
+
+async def _speak_reply(
+    element,
+    text: str,
+    clips: List[Tuple[str, Optional["asyncio.Task"]]],
+    base_url: str,
+    voice_settings: Optional[Dict] = None,
+):
+    """Speak ``text``, reusing the per-sentence clips from _stream_reply when they are for this text"""
+    if not clips or " ".join(sentence for sentence, _ in clips) != text:
+        await _tts_or_say(element, text, base_url, voice_settings)
+        return
+    for sentence, task in clips:
+        if task is None:
+            element.say(sentence, voice="alice")
+        else:
+            await _tts_or_say(element, sentence, base_url, voice_settings, tts_task=task)
+
+
+# Whole utterances whose reply is already scripted in the prompt (all of them end
+# the call), answered without a Gemini round-trip. Keyed by (normalized utterance,
+# call stage); "identity" is the outbound greeting's "Am I contacting ...?" stage.
+_WRONG_NUMBER_REPLY = "I apologize, I must have the wrong number. Have a good day."
+_NOT_INTERESTED_REPLY = (
+    "I understand{contact_name}. Thank you for your time. "
+    "Feel free to contact us if that changes. Have a great day."
+)
+_OUTBOUND_BYE_REPLY = "Thank you for your time{contact_name}. Have a great day. Goodbye!"
+_INBOUND_BYE_REPLY = "Thanks for calling{contact_name}. Have a great day. Goodbye!"
+
+_SCRIPTED_REPLIES: Dict[Tuple[str, str], str] = {
+    ("no", "identity"): _WRONG_NUMBER_REPLY,
+    **{
+        (utterance, stage): _WRONG_NUMBER_REPLY
+        for utterance in ("wrong number", "you have the wrong number", "wrong person")
+        for stage in ("identity", "outbound")
+    },
+    **{
+        (utterance, stage): _NOT_INTERESTED_REPLY
+        for utterance in ("not interested", "im not interested", "no im not interested", "no not interested")
+        for stage in ("identity", "outbound")
+    },
+    **{
+        (utterance, stage): _OUTBOUND_BYE_REPLY
+        for utterance in ("bye", "goodbye", "ok bye", "okay bye", "bye bye")
+        for stage in ("identity", "outbound")
+    },
+    **{
+        (utterance, "inbound"): _INBOUND_BYE_REPLY
+        for utterance in ("bye", "goodbye", "ok bye", "okay bye", "bye bye")
+    },
+}
+
+_SCRIPT_NON_WORD = re.compile(r"[^\w\s]")
+
+
+def _scripted_reply(user_input: str, conversation_state: Optional[Dict], is_outbound: bool) -> Optional[str]:
+    """
+    Scripted reply for a deterministic utterance ("not interested", "bye", ...), or None.
+    The whole utterance must be one of the scripted phrases (punctuation and case
+    aside): "no, I'm interested" or "not interested in that one, but..." go to the LLM.
+    """
+    # "Wrong number?" is the caller asking, not telling
+    if user_input.rstrip().endswith("?"):
+        return None
+    normalized = " ".join(_SCRIPT_NON_WORD.sub("", user_input).lower().split())
+    if not normalized or len(normalized) > 30:
+        return None
+    if is_outbound:
+        # Same window _should_end_call treats a bare "no" as a wrong-person answer
+        turn_count = conversation_state.get("turn_count", 0) if conversation_state else 0
+        stage = "identity" if turn_count <= 2 else "outbound"
+    else:
+        stage = "inbound"
+    reply = _SCRIPTED_REPLIES.get((normalized, stage))
+    if reply is None:
+        return None
+
+    state = conversation_state or {}
+    context = state.get("context") or {}
+    if is_outbound:
+        name = (context.get("contact") or {}).get("name")
+    else:
+        name = get_caller_name(state.get("call_sid", "")) or (context.get("caller_contact") or {}).get("name")
+    return reply.format(contact_name=f", {name.strip()}" if name and name.strip() else "")
+
+
 def _should_end_call(user_input: str, llm_response: str, conversation_state: Optional[Dict], is_outbound: bool) -> bool:
     """
     Determine if the call should be ended based on user input or LLM response.
@@ -498,7 +711,7 @@ async def handle_voice_webhook(form_data: Dict) -> str:
             try:
                 async with AsyncSessionLocal() as session:
                     # Normalize phone number
-                    normalized_number = twilio_number.strip().replace(" ", "").replace("-", "")
+                    normalized_number = twilio_number.translate(_PHONE_STRIP)
                     if not normalized_number.startswith("+"):
                         normalized_number = "+" + normalized_number
                     
@@ -577,6 +790,7 @@ async def handle_voice_webhook(form_data: Dict) -> str:
         
         response = VoiceResponse()
         _agent_reply = ""  # collected below; spoken inside <Gather> for barge-in
+        _agent_clips: List = []  # per-sentence TTS for a streamed _agent_reply
         webhook_base_url = settings.TWILIO_VOICE_WEBHOOK_URL or ""
         voice_webhook_url = f"{webhook_base_url}/webhooks/twilio/voice" if webhook_base_url else "/webhooks/twilio/voice"
 
@@ -697,12 +911,18 @@ async def handle_voice_webhook(form_data: Dict) -> str:
             if context and not context.get("error"):
                 if is_outbound and use_structured:
                     system_prompt = build_outbound_booking_prompt(context, get_slots(call_sid), confirmed)
-                elif is_outbound:
-                    system_prompt = build_outbound_prompt(context, confirmed)
                 elif use_structured:
                     system_prompt = build_booking_prompt(context, get_slots(call_sid))
                 else:
-                    system_prompt = build_inbound_prompt(context)
+                    # Same context and topics as last turn -> reuse that prompt string
+                    prompt_kind = "outbound" if is_outbound else "inbound"
+                    system_prompt = get_session_prompt(call_sid, prompt_kind, context, confirmed)
+                    if system_prompt is None:
+                        if is_outbound:
+                            system_prompt = build_outbound_prompt(context, confirmed)
+                        else:
+                            system_prompt = build_inbound_prompt(context)
+                        set_session_prompt(call_sid, prompt_kind, context, confirmed, system_prompt)
             else:
                 system_prompt = f"You are {voice_agent_name}, a helpful real estate assistant. Be professional and concise."
 
@@ -760,14 +980,27 @@ async def handle_voice_webhook(form_data: Dict) -> str:
                             )
                         )
                         clear_intent(call_sid)
+                elif (scripted := _scripted_reply(speech_result, conversation_state, is_outbound)) is not None:
+                    llm_response = scripted
+                    logger.info(f"📜 Scripted reply for '{speech_result}', LLM skipped")
                 else:
-                    llm_response = await asyncio.wait_for(
-                        process_with_llm(
-                            user_input=speech_result,
-                            system_prompt=system_prompt,
-                            conversation_history=history,
-                            max_tokens=120,
-                            timeout=3.5,
+                    # Only the static part of the prompt is context-cached; confirmed
+                    # topics change between turns and are sent alongside the handle
+                    static_prompt, per_turn_prompt = split_cacheable_prompt(system_prompt)
+                    # Streamed: each sentence's TTS starts while the rest is generated
+                    llm_response, _agent_clips = await asyncio.wait_for(
+                        _stream_reply(
+                            stream_with_llm(
+                                user_input=speech_result,
+                                system_prompt=system_prompt,
+                                conversation_history=history,
+                                max_tokens=120,
+                                timeout=3.5,
+                                cached_content_name=get_cached_content_name(static_prompt),
+                                uncached_prompt=per_turn_prompt,
+                            ),
+                            webhook_base_url,
+                            _va_settings,
                         ),
                         timeout=4.0,
                     )
@@ -805,7 +1038,7 @@ async def handle_voice_webhook(form_data: Dict) -> str:
                 # Check if we should end the call (wrong person, no questions, or LLM indicates ending)
                 if _should_end_call(speech_result, llm_response, conversation_state, is_outbound):
                     logger.info(f"🛑 Ending call based on user input or LLM response")
-                    await _tts_or_say(response, llm_response, webhook_base_url, _va_settings)
+                    await _speak_reply(response, llm_response, _agent_clips, webhook_base_url, _va_settings)
                     response.hangup()
                     return str(response)
                 
@@ -928,7 +1161,7 @@ async def handle_voice_webhook(form_data: Dict) -> str:
                                 logger.warning(f"⚠️ Call record lookup failed: {call_lookup_error}")
                             
                             # Normalize to_number for lookup (for outbound, to_number is the contact)
-                            normalized_to = to_number.strip().replace(" ", "").replace("-", "").replace("(", "").replace(")", "")
+                            normalized_to = to_number.translate(_PHONE_STRIP)
                             if not normalized_to.startswith("+"):
                                 normalized_to = "+" + normalized_to
                             
@@ -1020,20 +1253,10 @@ async def handle_voice_webhook(form_data: Dict) -> str:
                     
                     # Generate greeting using LLM with proper context
                     try:
-                        from app.services.ai.prompt_service import get_initial_greeting_prompt
-                        from app.services.ai.llm_service import generate_initial_greeting
-                        
-                        # Build context for greeting prompt
-                        # CRITICAL: Always include contact name if available, even if empty dict
-                        greeting_context = {
-                            "voice_agent": {"name": voice_agent_name},
-                            "real_estate_agent": {
-                                "name": agent_name or "Real Estate Agent",
-                                "company_name": company_name or "Independent Agent"
-                            },
-                            "contact": {"name": contact_name} if contact_name else {},  # Only include if we have name
-                            "properties": [{"address": property_address}] if property_address else []
-                        }
+                        # Build context for greeting prompt (same as the batch-call pre-generation)
+                        greeting_context = outbound_greeting_context(
+                            voice_agent_name, agent_name, company_name, contact_name, property_address
+                        )
                         
                         # Log context for debugging
                         logger.info(f"📋 Greeting context - Contact: '{contact_name}' (type: {type(contact_name)}), Agent: {agent_name}, Company: {company_name}, Property: {property_address}")
@@ -1046,53 +1269,30 @@ async def handle_voice_webhook(form_data: Dict) -> str:
                         # Get greeting prompt with context
                         greeting_prompt = get_initial_greeting_prompt(greeting_context, "outbound")
                         
-                        # Greeting LLM — budget fits under webhook_controller wait_for (~8s) with TTS after
+                        # Race the LLM greeting against a short budget: a live caller can't
+                        # wait seconds for "hello". When the LLM is slower, the templated
+                        # greeting is spoken and the LLM call finishes in the background,
+                        # which seeds the response cache for the next call with this context.
                         logger.info(f"🤖 Generating greeting with LLM...")
-                        greeting = await asyncio.wait_for(
-                            generate_initial_greeting(greeting_prompt, timeout=4.5),
-                            timeout=5.0,
+                        greeting_task = asyncio.ensure_future(
+                            generate_initial_greeting(greeting_prompt, timeout=4.5)
                         )
-                        logger.info(f"✅ LLM generated greeting: {greeting[:50]}...")
-                        
-                    except asyncio.TimeoutError:
-                        logger.warning("⏱️ LLM greeting timeout, using fallback")
-                        # Fallback greeting (force personalization when we have the name)
-                        if contact_name:
-                            if agent_name and company_name:
-                                greeting = (
-                                    f"Hello, this is {voice_agent_name} from {company_name}. "
-                                    f"I'm calling on behalf of {agent_name}. Am I contacting {contact_name}?"
-                                )
-                            else:
-                                greeting = (
-                                    f"Hello, this is {voice_agent_name}. Am I contacting {contact_name}? "
-                                    f"I'm calling about your property{f' at {property_address}' if property_address else ''}."
-                                )
+                        done, _ = await asyncio.wait({greeting_task}, timeout=_GREETING_LLM_BUDGET_SECONDS)
+                        if greeting_task in done:
+                            greeting = greeting_task.result()
+                            logger.info(f"✅ LLM generated greeting: {greeting[:50]}...")
                         else:
-                            greeting = (
-                                f"Hello, this is {voice_agent_name}. "
-                                f"Am I speaking with the property owner? I'm calling about your property."
+                            greeting_task.add_done_callback(_discard_task_result)
+                            logger.warning(f"⏱️ LLM greeting over {_GREETING_LLM_BUDGET_SECONDS}s, using fallback")
+                            greeting = _fallback_outbound_greeting(
+                                voice_agent_name, agent_name, company_name, contact_name, property_address
                             )
-                            
+                        
                     except Exception as llm_error:
                         logger.warning(f"⚠️ LLM greeting error: {llm_error}, using fallback")
-                        # Fallback greeting (force personalization when we have the name)
-                        if contact_name:
-                            if agent_name and company_name:
-                                greeting = (
-                                    f"Hello, this is {voice_agent_name} from {company_name}. "
-                                    f"I'm calling on behalf of {agent_name}. Am I contacting {contact_name}?"
-                                )
-                            else:
-                                greeting = (
-                                    f"Hello, this is {voice_agent_name}. Am I contacting {contact_name}? "
-                                    f"I'm calling about your property{f' at {property_address}' if property_address else ''}."
-                                )
-                        else:
-                            greeting = (
-                                f"Hello, this is {voice_agent_name}. "
-                                f"Am I speaking with the property owner? I'm calling about your property."
-                            )
+                        greeting = _fallback_outbound_greeting(
+                            voice_agent_name, agent_name, company_name, contact_name, property_address
+                        )
                 else:
                     # Inbound call greeting
                     greeting = f"Hello, this is {voice_agent_name}. Thank you for calling. How can I help you?"
@@ -1139,7 +1339,7 @@ async def handle_voice_webhook(form_data: Dict) -> str:
             language="en-US",
         )
         if _agent_reply:
-            await _tts_or_say(gather, _agent_reply, webhook_base_url, _va_settings)
+            await _speak_reply(gather, _agent_reply, _agent_clips, webhook_base_url, _va_settings)
         response.append(gather)
         
         # If no speech, redirect
@@ -1238,13 +1438,12 @@ async def _update_call_record(
     """Create or update call record"""
     try:
         async with AsyncSessionLocal() as session:
-            stmt = select(Call).where(Call.twilio_call_sid == call_sid)
-            result = await session.execute(stmt)
+            result = await session.execute(_CALL_BY_SID, {"sid": call_sid})
             call = result.scalar_one_or_none()
                     
             if not call and not is_outbound:  # Create for inbound calls
                 call = Call(
-                    id=str(uuid.uuid4()),
+                    id=new_id(),
                     voice_agent_id=voice_agent_id,
                     real_estate_agent_id=real_estate_agent_id,
                     twilio_call_sid=call_sid,
@@ -1256,6 +1455,7 @@ async def _update_call_record(
                 )
                 session.add(call)
                 await session.commit()
+                invalidate_agent_calls(real_estate_agent_id)
                 logger.info(f"✅ Call record created: {call.id}")
             elif call:
                 logger.info(f"✅ Call record exists: {call.id}")
@@ -1291,8 +1491,7 @@ async def _build_context_background(
             # Get contact_id from call record
             try:
                 async with AsyncSessionLocal() as session:
-                    stmt = select(Call.contact_id).where(Call.twilio_call_sid == call_sid)
-                    result = await session.execute(stmt)
+                    result = await session.execute(_CALL_CONTACT_ID_BY_SID, {"sid": call_sid})
                     contact_id = result.scalar_one_or_none()
                     
                     if not contact_id:
@@ -1483,8 +1682,7 @@ async def _persist_conversation_history_to_db(call_sid: str) -> None:
         
         # Fetch call to determine direction and fallback transcript
         async with AsyncSessionLocal() as session:
-            stmt = select(Call).where(Call.twilio_call_sid == call_sid)
-            result = await session.execute(stmt)
+            result = await session.execute(_CALL_BY_SID, {"sid": call_sid})
             call = result.scalar_one_or_none()
         
         if not call:
@@ -12,6 +12,8 @@ from app.models.voice_agent_request import VoiceAgentRequest
 from app.models.voice_agent import VoiceAgent
 from app.models.real_estate_agent import RealEstateAgent
 from app.models.phone_number import PhoneNumber
+from app.services.ai.context_service import invalidate_inbound_context
+from app.schemas.voice_agent import AgentStatsResponse, VoiceAgentRequestResponse
 from app.services.phone_number_service import (
     # assign_phone_number_to_agent,  # DISABLED - Auto-purchase removed, admin must manually purchase
     assign_existing_phone_number_to_agent,
@@ -319,7 +321,7 @@ async def get_voice_agent(real_estate_agent_id: str) -> Optional[Dict]:
             "system_prompt": voice_agent.system_prompt,
             "use_default_prompt": voice_agent.use_default_prompt,
             "status": voice_agent.status,
-            "settings": voice_agent.settings or {},
+            "settings": voice_agent.settings,
             "created_at": voice_agent.created_at.isoformat() if voice_agent.created_at else "",
             "updated_at": voice_agent.updated_at.isoformat() if voice_agent.updated_at else "",
         }
@@ -362,6 +364,7 @@ async def update_voice_agent(real_estate_agent_id: str, update_data: Dict) -> Di
             voice_agent.settings = merged
         
         await session.commit()
+        invalidate_inbound_context(real_estate_agent_id)
         await session.refresh(voice_agent)
         
         # Get phone number
@@ -379,7 +382,7 @@ async def update_voice_agent(real_estate_agent_id: str, update_data: Dict) -> Di
             "system_prompt": voice_agent.system_prompt,
             "use_default_prompt": voice_agent.use_default_prompt,
             "status": voice_agent.status,
-            "settings": voice_agent.settings or {},
+            "settings": voice_agent.settings,
             "created_at": voice_agent.created_at.isoformat() if voice_agent.created_at else "",
             "updated_at": voice_agent.updated_at.isoformat() if voice_agent.updated_at else "",
         }
@@ -400,6 +403,7 @@ async def toggle_voice_agent_status(real_estate_agent_id: str, status: str) -> D
         
         voice_agent.status = status
         await session.commit()
+        invalidate_inbound_context(real_estate_agent_id)
         await session.refresh(voice_agent)
         
         return {
@@ -416,113 +420,96 @@ def get_default_system_prompt(agent_name: str, company_name: str) -> str:
     )
 
 
-async def get_all_voice_agent_requests(status: Optional[str] = None) -> List[Dict]:
-    """Get all voice agent requests (admin)"""
-    from app.services.real_estate_agent_service import get_agent_summary_stats
-    from app.models.voice_agent import VoiceAgent
-    from sqlalchemy import func
+async def get_all_voice_agent_requests(status: Optional[str] = None) -> List[VoiceAgentRequestResponse]:
+    """Get all voice agent requests (admin)
+
+    One joined query: agent details, the voice agent and its number, and the
+    per-agent stats (correlated counts) all come back on each request row.
+    """
+    from sqlalchemy import func, exists
+    from sqlalchemy.orm import aliased
     from app.models.property import Property
     from app.models.document import Document
     from app.models.contact import Contact
     
+    agent_id_col = VoiceAgentRequest.real_estate_agent_id
+    voice_agent_phone = aliased(PhoneNumber)
+    
+    # Per-agent stats - same counting rules as get_all_real_estate_agents
+    properties_count = (
+        select(func.count(Property.id))
+        .where(Property.real_estate_agent_id == agent_id_col)
+        .scalar_subquery()
+    )
+    documents_count = (
+        select(func.count(Document.id))
+        .where(Document.real_estate_agent_id == agent_id_col)
+        .scalar_subquery()
+    )
+    contacts_count = (
+        select(func.count(Contact.id))
+        .where(Contact.real_estate_agent_id == agent_id_col)
+        .scalar_subquery()
+    )
+    has_phone_number = exists().where(
+        PhoneNumber.real_estate_agent_id == agent_id_col,
+        PhoneNumber.is_active == True
+    )
+    
+    stmt = (
+        select(
+            VoiceAgentRequest,
+            RealEstateAgent.full_name,
+            RealEstateAgent.email,
+            RealEstateAgent.company_name,
+            VoiceAgent.id.label("voice_agent_id"),
+            voice_agent_phone.twilio_phone_number,
+            properties_count.label("properties_count"),
+            documents_count.label("documents_count"),
+            contacts_count.label("contacts_count"),
+            has_phone_number.label("has_phone_number"),
+        )
+        .outerjoin(RealEstateAgent, RealEstateAgent.id == agent_id_col)
+        .outerjoin(VoiceAgent, VoiceAgent.real_estate_agent_id == agent_id_col)
+        .outerjoin(voice_agent_phone, voice_agent_phone.id == VoiceAgent.phone_number_id)
+    )
+    if status:
+        stmt = stmt.where(VoiceAgentRequest.status == status)
+    stmt = stmt.order_by(VoiceAgentRequest.created_at.desc())
+    
     async with AsyncSessionLocal() as session:
-        stmt = select(VoiceAgentRequest).options(selectinload(VoiceAgentRequest.real_estate_agent))
-        if status:
-            stmt = stmt.where(VoiceAgentRequest.status == status)
-        stmt = stmt.order_by(VoiceAgentRequest.created_at.desc())
-        
         result = await session.execute(stmt)
-        requests = result.scalars().all()
-        
-        # Get voice agent phone numbers for approved requests
-        request_ids = [req.id for req in requests]
-        # Collect all unique agent IDs - ensure we get all of them
-        agent_ids = list(set([req.real_estate_agent_id for req in requests if req.real_estate_agent_id]))
-        
-        # Batch fetch voice agents to get phone numbers
-        voice_agents = {}
-        if agent_ids:
-            voice_agents_stmt = select(VoiceAgent).options(selectinload(VoiceAgent.phone_number)).where(VoiceAgent.real_estate_agent_id.in_(agent_ids))
-            voice_agents_result = await session.execute(voice_agents_stmt)
-            voice_agents = {va.real_estate_agent_id: va for va in voice_agents_result.scalars().all()}
-        
-        # Batch fetch agent stats - always initialize even if empty
-        # Use EXACT same query logic as get_all_real_estate_agents
-        properties_counts = {}
-        documents_counts = {}
-        contacts_counts = {}
-        agents_with_phones = set()
-        
-        if agent_ids:
-            # Properties counts - EXACT same as get_all_real_estate_agents
-            properties_counts_stmt = select(
-                Property.real_estate_agent_id,
-                func.count(Property.id).label('count')
-            ).where(
-                Property.real_estate_agent_id.in_(agent_ids)
-            ).group_by(Property.real_estate_agent_id)
-            properties_result = await session.execute(properties_counts_stmt)
-            properties_counts = {row[0]: row[1] for row in properties_result.all()}
-            
-            # Documents counts - EXACT same as get_all_real_estate_agents
-            documents_counts_stmt = select(
-                Document.real_estate_agent_id,
-                func.count(Document.id).label('count')
-            ).where(
-                Document.real_estate_agent_id.in_(agent_ids)
-            ).group_by(Document.real_estate_agent_id)
-            documents_result = await session.execute(documents_counts_stmt)
-            documents_counts = {row[0]: row[1] for row in documents_result.all()}
-            
-            # Contacts counts - EXACT same as get_all_real_estate_agents
-            contacts_counts_stmt = select(
-                Contact.real_estate_agent_id,
-                func.count(Contact.id).label('count')
-            ).where(
-                Contact.real_estate_agent_id.in_(agent_ids)
-            ).group_by(Contact.real_estate_agent_id)
-            contacts_result = await session.execute(contacts_counts_stmt)
-            contacts_counts = {row[0]: row[1] for row in contacts_result.all()}
-            
-            # Phone numbers - EXACT same as get_all_real_estate_agents
-            from app.models.phone_number import PhoneNumber
-            phone_numbers_stmt = select(PhoneNumber.real_estate_agent_id).where(
-                PhoneNumber.real_estate_agent_id.in_(agent_ids),
-                PhoneNumber.is_active == True
-            )
-            phone_result = await session.execute(phone_numbers_stmt)
-            agents_with_phones = {row[0] for row in phone_result.all()}
-        
-        requests_list = []
-        for req in requests:
-            agent_id = req.real_estate_agent_id
-            # Ensure we're using the same ID format as the queries
-            # Get stats using the agent_id - same logic as get_all_real_estate_agents
-            requests_list.append({
-                "id": req.id,
-                "real_estate_agent_id": agent_id,
-                "status": req.status,
-                "requested_at": req.requested_at.isoformat() if req.requested_at else "",
-                "reviewed_at": req.reviewed_at.isoformat() if req.reviewed_at else None,
-                "reviewed_by": req.reviewed_by,
-                "rejection_reason": req.rejection_reason,
-                "created_at": req.created_at.isoformat() if req.created_at else "",
-                "updated_at": req.updated_at.isoformat() if req.updated_at else "",
-                "agent_name": req.real_estate_agent.full_name if req.real_estate_agent else None,
-                "agent_email": req.real_estate_agent.email if req.real_estate_agent else None,
-                "agent_company_name": req.real_estate_agent.company_name if req.real_estate_agent else None,
-                "voice_agent_id": voice_agents.get(agent_id).id if agent_id in voice_agents else None,
-                "voice_agent_phone_number": voice_agents.get(agent_id).phone_number.twilio_phone_number if agent_id in voice_agents and voice_agents.get(agent_id).phone_number else None,
-                "agent_stats": {
-                    # Use .get() with default 0 - same as get_all_real_estate_agents
-                    "properties_count": properties_counts.get(agent_id, 0),
-                    "documents_count": documents_counts.get(agent_id, 0),
-                    "contacts_count": contacts_counts.get(agent_id, 0),
-                    "has_phone_number": agent_id in agents_with_phones,
-                },
-            })
-        
-        return requests_list
+        rows = result.all()
+    
+    # Rows come straight from our DB, so skip re-validation with model_construct
+    return [
+        VoiceAgentRequestResponse.model_construct(
+            id=req.id,
+            real_estate_agent_id=req.real_estate_agent_id,
+            status=req.status,
+            requested_at=req.requested_at.isoformat() if req.requested_at else "",
+            reviewed_at=req.reviewed_at.isoformat() if req.reviewed_at else None,
+            reviewed_by=req.reviewed_by,
+            rejection_reason=req.rejection_reason,
+            created_at=req.created_at.isoformat() if req.created_at else "",
+            updated_at=req.updated_at.isoformat() if req.updated_at else "",
+            agent_name=full_name,
+            agent_email=email,
+            agent_company_name=company_name,
+            voice_agent_id=voice_agent_id,
+            voice_agent_phone_number=twilio_phone_number,
+            agent_stats=AgentStatsResponse.model_construct(
+                properties_count=props or 0,
+                documents_count=docs or 0,
+                contacts_count=contacts or 0,
+                has_phone_number=bool(has_phone),
+            ),
+        )
+        for (
+            req, full_name, email, company_name, voice_agent_id, twilio_phone_number,
+            props, docs, contacts, has_phone,
+        ) in rows
+    ]
 
 
 async def get_all_voice_agents() -> List[Dict]:
@@ -546,7 +533,7 @@ async def get_all_voice_agents() -> List[Dict]:
                 "system_prompt": va.system_prompt,
                 "use_default_prompt": va.use_default_prompt,
                 "status": va.status,
-                "settings": va.settings or {},
+                "settings": va.settings,
                 "created_at": va.created_at.isoformat() if va.created_at else "",
                 "updated_at": va.updated_at.isoformat() if va.updated_at else "",
             }
@@ -0,0 +1,20 @@
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Time-ordered UUID (RFC 9562 version 7): 48-bit Unix ms timestamp, then random bits
+    Rows keyed by it are inserted at the right edge of the primary key index instead of
+    at random positions, as with uuid4.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | 0x7 << 76  # version
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC variant
+    return uuid.UUID(int=value)
+
+
+def new_id() -> str:
+    """Primary key for a new row, in the same 36-char text form as str(uuid.uuid4())"""
+    return str(uuid7())
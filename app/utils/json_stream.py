@@ -0,0 +1,26 @@
+from typing import AsyncIterator
+import orjson
+from pydantic import BaseModel
+
+
+# Flush to the socket in ~64 KiB chunks rather than once per row
+_CHUNK_SIZE = 64 * 1024
+
+
+async def orjson_stream(items: AsyncIterator[BaseModel]) -> AsyncIterator[bytes]:
+    """
+    Encode an async stream of models as one JSON array, chunk by chunk.
+    Meant for StreamingResponse: the full list is never held in memory.
+    """
+    buffer = bytearray(b"[")
+    first = True
+    async for item in items:
+        if not first:
+            buffer += b","
+        first = False
+        buffer += orjson.dumps(item.model_dump())
+        if len(buffer) >= _CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b"]"
+    yield bytes(buffer)
@@ -0,0 +1,38 @@
+"""
+Keyset ("seek") pagination for latest-first lists ordered by (created_at, id)
+"""
+import base64
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import desc, tuple_
+
+
+def encode_cursor(row) -> str:
+    """Opaque keyset cursor for the row after which the next page starts"""
+    raw = f"{row.created_at.isoformat()}|{row.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        created_at, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), row_id
+    except ValueError:  # bad base64, bad utf-8, missing separator or bad timestamp
+        raise ValueError("Invalid pagination cursor")
+
+
+def paginate_latest_first(stmt, model, page: int, page_size: int, cursor: Optional[str]):
+    """Latest-first page of `stmt`: keyset seek when a cursor is given, OFFSET otherwise"""
+    stmt = stmt.order_by(desc(model.created_at), desc(model.id)).limit(page_size)
+    if cursor:
+        # (created_at, id) row comparison walks the (agent, created_at, id) index
+        # from the cursor on, instead of reading and discarding `offset` rows
+        stmt = stmt.where(tuple_(model.created_at, model.id) < tuple_(*decode_cursor(cursor)))
+    else:
+        stmt = stmt.offset(max(page - 1, 0) * page_size)
+    return stmt
+
+
+def next_cursor(rows, page_size: int) -> Optional[str]:
+    # A short page is the last one
+    return encode_cursor(rows[-1]) if rows and len(rows) == page_size else None
@@ -0,0 +1,13 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+
+def iso_or(value: Optional[datetime], default: Optional[str] = "") -> Optional[str]:
+    """ISO-8601 text of a timestamp column, `default` when it is NULL"""
+    return value.isoformat() if value else default
+
+
+def price_text(value: Optional[Decimal]) -> Optional[str]:
+    """Price column as text, None when NULL or 0"""
+    return str(value) if value else None
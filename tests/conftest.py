@@ -119,6 +119,11 @@ async def client(db_session):
         # Restore original
         db_connection_module.AsyncSessionLocal = original_session_local
         app.dependency_overrides.clear()
+        # Cached admin rows and call reads belong to this test's database
+        from app.services.auth_service import clear_admin_cache
+        from app.services.call_service import clear_call_caches
+        clear_admin_cache()
+        clear_call_caches()
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -0,0 +1,260 @@
+"""
+Tests for the admin agent-detail views.
+Covers the full-details cache, its per-agent data version, the row serializers
+and keyset cursors.
+"""
+import base64
+import pytest
+import pytest_asyncio
+import uuid
+from datetime import datetime
+
+from app.services import admin_service
+
+
+# ─── helpers ───────────────────────────────────────────────────────────
+
+@pytest_asyncio.fixture
+async def agent_id():
+    """Fresh agent id; the admin caches are emptied afterwards"""
+    yield str(uuid.uuid4())
+    admin_service.clear_agent_full_details_cache()
+
+
+def _fake_loader(loads: list, on_load=None):
+    async def load(agent_id: str):
+        loads.append(agent_id)
+        if on_load:
+            on_load(agent_id, len(loads))
+        now = datetime.utcnow()
+        agent = {
+            "id": agent_id, "email": "agent@example.com", "full_name": "Agent",
+            "is_active": True, "is_verified": True, "created_at": now, "updated_at": now,
+        }
+        return {"agent": agent, "load": len(loads)}
+    return load
+
+
+# ─── full-details cache ───────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_full_details_served_from_cache(agent_id, monkeypatch):
+    """A second read within the TTL doesn't load again."""
+    loads = []
+    monkeypatch.setattr(admin_service, "_load_agent_full_details", _fake_loader(loads))
+
+    first = await admin_service.get_agent_full_details(agent_id)
+    second = await admin_service.get_agent_full_details(agent_id)
+
+    assert first["load"] == second["load"] == 1
+    assert len(loads) == 1
+
+
+@pytest.mark.asyncio
+async def test_full_details_reloaded_after_write(agent_id, monkeypatch):
+    """A write to the agent's data drops the cached payload."""
+    loads = []
+    monkeypatch.setattr(admin_service, "_load_agent_full_details", _fake_loader(loads))
+
+    await admin_service.get_agent_full_details(agent_id)
+    admin_service.invalidate_agent_full_details(agent_id)
+    details = await admin_service.get_agent_full_details(agent_id)
+
+    assert details["load"] == 2
+
+
+@pytest.mark.asyncio
+async def test_full_details_not_cached_when_written_during_load(agent_id, monkeypatch):
+    """A payload loaded while a write lands may predate it, so it isn't cached."""
+    def write_during_first_load(aid, load):
+        if load == 1:
+            admin_service.invalidate_agent_full_details(aid)
+
+    loads = []
+    monkeypatch.setattr(
+        admin_service, "_load_agent_full_details", _fake_loader(loads, write_during_first_load)
+    )
+
+    first = await admin_service.get_agent_full_details(agent_id)
+    second = await admin_service.get_agent_full_details(agent_id)
+    third = await admin_service.get_agent_full_details(agent_id)
+
+    assert first["load"] == 1
+    assert second["load"] == 2
+    assert third["load"] == 2
+
+
+# ─── ETags ────────────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_full_details_etag_revalidates(authenticated_admin, agent_id, monkeypatch):
+    """A matching If-None-Match gets a 304 until the agent's data changes."""
+    client, _ = authenticated_admin
+    from app.controllers import admin_controller
+    monkeypatch.setattr(admin_service, "_load_agent_full_details", _fake_loader([]))
+    monkeypatch.setattr(admin_controller, "get_agent_full_details", admin_service.get_agent_full_details)
+
+    url = f"/admin/real-estate-agents/{agent_id}/full-details"
+    response = await client.get(url)
+    etag = response.headers.get("etag")
+    assert response.status_code == 200 and etag
+
+    response = await client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    admin_service.invalidate_agent_full_details(agent_id)
+    response = await client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers.get("etag") != etag
+
+
+@pytest.mark.asyncio
+async def test_full_details_no_etag_when_written_during_load(authenticated_admin, agent_id, monkeypatch):
+    """A body built while a write landed may be outdated, so it gets no ETag."""
+    client, _ = authenticated_admin
+    from app.controllers import admin_controller
+
+    def write_during_load(aid, load):
+        admin_service.invalidate_agent_full_details(aid)
+
+    monkeypatch.setattr(admin_service, "_load_agent_full_details", _fake_loader([], write_during_load))
+    monkeypatch.setattr(admin_controller, "get_agent_full_details", admin_service.get_agent_full_details)
+
+    response = await client.get(f"/admin/real-estate-agents/{agent_id}/full-details")
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_paginated_etag_differs_per_page(authenticated_admin, agent_id, monkeypatch):
+    """Pages and cursors of the same agent's list don't share an ETag."""
+    client, _ = authenticated_admin
+    from app.controllers import admin_controller
+
+    async def fake_page(aid, page=1, page_size=16, cursor=None):
+        return [], 0, None
+
+    monkeypatch.setattr(admin_controller, "get_agent_properties_paginated_for_admin", fake_page)
+
+    url = f"/admin/real-estate-agents/{agent_id}/properties/paginated"
+    first = (await client.get(url, params={"page": 1})).headers.get("etag")
+    second = (await client.get(url, params={"page": 2})).headers.get("etag")
+    by_cursor = (await client.get(url, params={"cursor": "abc"})).headers.get("etag")
+
+    assert first and second and by_cursor
+    assert len({first, second, by_cursor}) == 3
+
+    response = await client.get(url, params={"page": 2}, headers={"If-None-Match": first})
+    assert response.status_code == 200
+
+
+# ─── row serializers ──────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_property_price_formatted_on_any_database(authenticated_agent, db_session):
+    """Prices come back as str(Decimal) text, None for NULL or 0, without Postgres-only SQL."""
+    from sqlalchemy import select
+    from app.models.property import Property
+    _, agent = authenticated_agent
+    prices = {"priced": 250000, "free": 0, "unpriced": None}
+    for address, price in prices.items():
+        db_session.add(Property(
+            id=str(uuid.uuid4()), address=address, price=price,
+            real_estate_agent_id=agent.id, owner_phone="+923001234567",
+        ))
+    await db_session.commit()
+
+    rows = (await db_session.execute(
+        select(*admin_service._PROPERTY_COLUMNS).where(Property.real_estate_agent_id == agent.id)
+    )).all()
+    by_address = {row.address: admin_service._property_response(row).price for row in rows}
+
+    assert by_address == {"priced": "250000.00", "free": None, "unpriced": None}
+
+
+# ─── keyset cursors ───────────────────────────────────────────────────
+
+async def _fake_count(model, agent_id):
+    # The tests share one session, which can't run the count and the page concurrently
+    return 0
+
+
+async def _walk_pages(client, url, page_size=2):
+    """Item ids of every page reached by following next_cursor"""
+    seen, cursor = [], None
+    for _ in range(10):
+        params = {"page_size": page_size, **({"cursor": cursor} if cursor else {})}
+        response = await client.get(url, params=params)
+        assert response.status_code == 200
+        data = response.json()
+        seen += [item["id"] for item in data["items"]]
+        cursor = data["next_cursor"]
+        if not cursor:
+            return seen
+    raise AssertionError("next_cursor never ran out")
+
+
+@pytest.mark.asyncio
+async def test_property_cursor_round_trip(authenticated_admin, db_session, monkeypatch):
+    """Following next_cursor returns every property once, latest first, ties broken by id."""
+    from app.models.property import Property
+    from app.models.real_estate_agent import RealEstateAgent
+    client, _ = authenticated_admin
+    monkeypatch.setattr(admin_service, "_cached_count", _fake_count)
+    agent = RealEstateAgent(id=str(uuid.uuid4()), email=f"{uuid.uuid4().hex}@example.com", full_name="Agent", hashed_password="x")
+    db_session.add(agent)
+    # Two share a created_at, so the id tie-break decides their order across pages
+    times = [datetime(2026, 1, 1, 12, minute) for minute in (0, 1, 1, 2, 3)]
+    props = [
+        Property(id=str(uuid.uuid4()), address=f"{i} Street", owner_phone="+923001234567",
+                 real_estate_agent_id=agent.id, created_at=created_at)
+        for i, created_at in enumerate(times)
+    ]
+    db_session.add_all(props)
+    await db_session.commit()
+
+    seen = await _walk_pages(client, f"/admin/real-estate-agents/{agent.id}/properties/paginated")
+
+    expected = sorted(props, key=lambda p: (p.created_at, p.id), reverse=True)
+    assert seen == [p.id for p in expected]
+
+
+@pytest.mark.asyncio
+async def test_document_cursor_ties_on_created_at(authenticated_admin, db_session, monkeypatch):
+    """Documents sharing a created_at are neither skipped nor repeated across pages."""
+    from app.models.document import Document
+    from app.models.real_estate_agent import RealEstateAgent
+    client, _ = authenticated_admin
+    monkeypatch.setattr(admin_service, "_cached_count", _fake_count)
+    agent = RealEstateAgent(id=str(uuid.uuid4()), email=f"{uuid.uuid4().hex}@example.com", full_name="Agent", hashed_password="x")
+    db_session.add(agent)
+    same_time = datetime(2026, 1, 1, 12, 0)
+    docs = [
+        Document(id=str(uuid.uuid4()), real_estate_agent_id=agent.id, file_name=f"{i}.csv", file_type="csv",
+                 cloudinary_public_id=f"docs/{uuid.uuid4()}", cloudinary_url="https://example.test/doc",
+                 created_at=same_time)
+        for i in range(5)
+    ]
+    db_session.add_all(docs)
+    await db_session.commit()
+
+    seen = await _walk_pages(client, f"/admin/real-estate-agents/{agent.id}/documents/paginated")
+
+    assert seen == sorted((doc.id for doc in docs), reverse=True)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("kind", ["properties", "documents"])
+@pytest.mark.parametrize("cursor", [
+    "not-a-cursor!",
+    base64.urlsafe_b64encode(b"2026-01-01T12:00:00").decode(),
+    base64.urlsafe_b64encode(b"2026-13-45T99:00:00|abc").decode(),
+])
+async def test_malformed_or_tampered_cursor_rejected(authenticated_admin, agent_id, kind, cursor):
+    """A cursor that doesn't decode to (created_at, id) is a 400, not a 500."""
+    client, _ = authenticated_admin
+
+    response = await client.get(f"/admin/real-estate-agents/{agent_id}/{kind}/paginated", params={"cursor": cursor})
+
+    assert response.status_code == 400
+    assert "cursor" in response.json()["detail"].lower()
@@ -6,6 +6,7 @@ This test suite validates the call management functionality, including call init
 call history retrieval, batch calling, and call statistics.
 """
 
+import base64
 import pytest
 import uuid
 from httpx import AsyncClient
@@ -379,3 +380,327 @@ class TestCallWebhooks:
         
         response = await client.post("/webhooks/twilio/status", data=form_data)
         assert response.status_code == 200
+
+
+def _make_call(agent, **overrides) -> Call:
+    values = dict(
+        id=str(uuid.uuid4()),
+        twilio_call_sid=f"CA{uuid.uuid4().hex}",
+        from_number="+923331234567",
+        to_number="+923009876543",
+        status="in-progress",
+        direction="outbound",
+        real_estate_agent_id=agent.id,
+        voice_agent_id=str(uuid.uuid4()),
+        started_at=datetime.utcnow(),
+    )
+    values.update(overrides)
+    return Call(**values)
+
+
+class TestCallReadCache:
+    """
+    Call list and call detail reads are cached briefly; every write to a call
+    must drop the cached copies, and callers must not be able to alter them.
+    """
+    @pytest.mark.asyncio
+    async def test_status_webhook_update_visible_immediately(self, authenticated_agent, db_session):
+        """A status update is visible in the list and the detail right after it's applied"""
+        from app.services.call_service import get_calls_by_agent, get_call_by_id, update_call_status
+        _, agent = authenticated_agent
+        call = _make_call(agent)
+        db_session.add(call)
+        await db_session.commit()
+        await db_session.refresh(call)
+
+        items, total, _ = await get_calls_by_agent(agent.id)
+        assert items[0]["status"] == "in-progress"
+        assert (await get_call_by_id(call.id, agent.id))["status"] == "in-progress"
+        in_progress_total = (await get_calls_by_agent(agent.id, status="in-progress"))[1]
+        assert in_progress_total == 1
+
+        await update_call_status(call.twilio_call_sid, "completed", duration=42)
+
+        items, _, _ = await get_calls_by_agent(agent.id)
+        assert items[0]["status"] == "completed"
+        assert (await get_call_by_id(call.id, agent.id))["duration_seconds"] == 42
+        assert (await get_calls_by_agent(agent.id, status="in-progress"))[1] == 0
+
+    @pytest.mark.asyncio
+    async def test_inbound_call_record_invalidates_list(self, authenticated_agent, db_session):
+        """A call record created by the voice webhook shows up in an already cached list"""
+        from app.services.call_service import get_calls_by_agent
+        from app.services.twilio_service.webhook_service import _update_call_record
+        _, agent = authenticated_agent
+
+        assert (await get_calls_by_agent(agent.id))[1] == 0
+
+        await _update_call_record(
+            call_sid=f"CA{uuid.uuid4().hex}",
+            is_outbound=False,
+            from_number="+923331234567",
+            to_number="+923009876543",
+            voice_agent_id=str(uuid.uuid4()),
+            real_estate_agent_id=agent.id,
+        )
+
+        items, total, _ = await get_calls_by_agent(agent.id)
+        assert total == 1
+        assert items[0]["direction"] == "inbound"
+
+    @pytest.mark.asyncio
+    async def test_cached_reads_are_copies(self, authenticated_agent, db_session):
+        """Mutating a returned call doesn't change what the next reader gets"""
+        from app.services.call_service import get_calls_by_agent, get_call_by_id
+        _, agent = authenticated_agent
+        call = _make_call(agent, status="completed")
+        db_session.add(call)
+        await db_session.commit()
+        await db_session.refresh(call)
+
+        items, _, _ = await get_calls_by_agent(agent.id)
+        items[0]["status"] = "tampered"
+        items.clear()
+        detail = await get_call_by_id(call.id, agent.id)
+        detail["status"] = "tampered"
+
+        items, _, _ = await get_calls_by_agent(agent.id)
+        assert items[0]["status"] == "completed"
+        assert (await get_call_by_id(call.id, agent.id))["status"] == "completed"
+
+
+async def _add_dialable_voice_agent(db_session, agent):
+    """Active voice agent with a Twilio number, so calls can be placed for `agent`"""
+    from app.models.phone_number import PhoneNumber
+    from app.models.voice_agent import VoiceAgent
+    phone = PhoneNumber(
+        id=str(uuid.uuid4()),
+        real_estate_agent_id=agent.id,
+        twilio_phone_number="+15005550006",
+        twilio_sid=f"PN{uuid.uuid4().hex}",
+    )
+    voice_agent = VoiceAgent(
+        id=str(uuid.uuid4()),
+        real_estate_agent_id=agent.id,
+        phone_number_id=phone.id,
+        name="Batch Agent",
+        status="active",
+    )
+    db_session.add_all([phone, voice_agent])
+    await db_session.commit()
+    return voice_agent
+
+
+def _fake_twilio(monkeypatch, sid="CAbatch0001"):
+    from app.services import call_service
+
+    async def fake_create_call(**kwargs):
+        return {"sid": sid, "status": "queued"}
+
+    monkeypatch.setattr(call_service, "create_call", fake_create_call)
+    monkeypatch.setattr(call_service.settings, "TWILIO_VOICE_WEBHOOK_URL", "https://example.test")
+
+
+class TestBatchCallRecords:
+    """
+    Batch call rows are written right before each dial, so an invalid number or a
+    cancelled batch never leaves a row behind that no webhook will ever update.
+    """
+    @pytest.mark.asyncio
+    async def test_batch_rows_written_at_dial_time(self, authenticated_agent, db_session, monkeypatch):
+        """Dialed contacts get an initiated row with the Twilio SID; invalid numbers get none"""
+        from sqlalchemy import select
+        from app.services import call_service
+        _, agent = authenticated_agent
+        await _add_dialable_voice_agent(db_session, agent)
+        valid = Contact(id=str(uuid.uuid4()), name="Valid", phone_number="+923331234567", real_estate_agent_id=agent.id)
+        invalid = Contact(id=str(uuid.uuid4()), name="Invalid", phone_number="12", real_estate_agent_id=agent.id)
+        db_session.add_all([valid, invalid])
+        await db_session.commit()
+        _fake_twilio(monkeypatch)
+        monkeypatch.setattr(call_service.settings, "GEMINI_API_KEY", None)
+
+        result = await call_service.initiate_batch_calls(agent.id, [valid.id, invalid.id], delay_seconds=3)
+
+        assert result["call_count"] == 1
+        assert [error["contact_id"] for error in result["errors"]] == [invalid.id]
+
+        db_session.expire_all()
+        rows = (await db_session.execute(select(Call).where(Call.real_estate_agent_id == agent.id))).scalars().all()
+        assert len(rows) == 1
+        assert rows[0].contact_id == valid.id
+        assert rows[0].status == "initiated"
+        assert rows[0].twilio_call_sid == "CAbatch0001"
+
+
+class TestBatchCallGreetings:
+    """
+    A batch generates every contact's greeting while dialing, with the same prompt
+    the voice webhook builds, so the live call gets it from the response cache.
+    """
+    @pytest.mark.asyncio
+    async def test_batch_pregenerates_webhook_greetings(self, authenticated_agent, db_session, monkeypatch):
+        """One greeting prompt per dialed contact, identical to the webhook's"""
+        from app.services import call_service
+        from app.services.ai.prompt_service import get_initial_greeting_prompt, outbound_greeting_context
+        _, agent = authenticated_agent
+        voice_agent = await _add_dialable_voice_agent(db_session, agent)
+        contact = Contact(id=str(uuid.uuid4()), name="Sara", phone_number="+923331234567", real_estate_agent_id=agent.id)
+        invalid = Contact(id=str(uuid.uuid4()), name="Invalid", phone_number="12", real_estate_agent_id=agent.id)
+        db_session.add_all([contact, invalid])
+        await db_session.commit()
+        _fake_twilio(monkeypatch)
+        monkeypatch.setattr(call_service.settings, "GEMINI_API_KEY", "test-key")
+
+        batches = []
+
+        async def fake_batch(prompts):
+            batches.append(prompts)
+            return [None] * len(prompts)
+
+        monkeypatch.setattr(call_service, "generate_initial_greetings_batch", fake_batch)
+
+        result = await call_service.initiate_batch_calls(agent.id, [contact.id, invalid.id], delay_seconds=3)
+
+        assert result["call_count"] == 1
+        expected = get_initial_greeting_prompt(
+            outbound_greeting_context(voice_agent.name, agent.full_name, agent.company_name, "Sara"),
+            "outbound",
+        )
+        assert batches == [[expected]]
+
+    @pytest.mark.asyncio
+    async def test_batch_dials_when_greetings_fail(self, authenticated_agent, db_session, monkeypatch):
+        """A failed greeting pre-generation doesn't fail the batch"""
+        from app.services import call_service
+        _, agent = authenticated_agent
+        await _add_dialable_voice_agent(db_session, agent)
+        contact = Contact(id=str(uuid.uuid4()), name="Sara", phone_number="+923331234567", real_estate_agent_id=agent.id)
+        db_session.add(contact)
+        await db_session.commit()
+        _fake_twilio(monkeypatch)
+        monkeypatch.setattr(call_service.settings, "GEMINI_API_KEY", "test-key")
+
+        async def failing_batch(prompts):
+            raise RuntimeError("quota exceeded")
+
+        monkeypatch.setattr(call_service, "generate_initial_greetings_batch", failing_batch)
+
+        result = await call_service.initiate_batch_calls(agent.id, [contact.id], delay_seconds=3)
+
+        assert result["call_count"] == 1
+        assert result["errors"] == []
+
+
+class TestCallKeysetPagination:
+    """
+    Call history pages can be walked with next_cursor (keyset on created_at, id)
+    instead of page numbers; a cursor that doesn't decode is rejected with 400.
+    """
+    @pytest.mark.asyncio
+    async def test_cursor_round_trip(self, authenticated_agent, db_session):
+        """Following next_cursor returns every call once, latest first, then stops"""
+        client, agent = authenticated_agent
+        base = datetime(2026, 1, 1, 12, 0, 0)
+        calls = [_make_call(agent, created_at=base.replace(minute=i)) for i in range(5)]
+        db_session.add_all(calls)
+        await db_session.commit()
+
+        seen, cursor = [], None
+        for _ in range(5):
+            params = {"page_size": 2, **({"cursor": cursor} if cursor else {})}
+            response = await client.get("/agent/calls", params=params)
+            assert response.status_code == 200
+            data = response.json()
+            seen += [item["id"] for item in data["items"]]
+            cursor = data["next_cursor"]
+            if not cursor:
+                break
+
+        assert seen == [call.id for call in reversed(calls)]
+        assert cursor is None
+
+    @pytest.mark.asyncio
+    async def test_cursor_ties_on_created_at(self, authenticated_agent, db_session):
+        """Calls sharing a created_at are neither skipped nor repeated across pages"""
+        client, agent = authenticated_agent
+        same_time = datetime(2026, 1, 1, 12, 0, 0)
+        calls = [_make_call(agent, created_at=same_time) for _ in range(5)]
+        db_session.add_all(calls)
+        await db_session.commit()
+
+        seen, cursor = [], None
+        for _ in range(5):
+            params = {"page_size": 2, **({"cursor": cursor} if cursor else {})}
+            data = (await client.get("/agent/calls", params=params)).json()
+            seen += [item["id"] for item in data["items"]]
+            cursor = data["next_cursor"]
+            if not cursor:
+                break
+
+        assert seen == sorted((call.id for call in calls), reverse=True)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("cursor", [
+        "not-a-cursor!",                                             # not base64
+        base64.urlsafe_b64encode(b"2026-01-01T12:00:00").decode(),   # no id part
+        base64.urlsafe_b64encode(b"2026-13-45T99:00:00|abc").decode(),  # edited timestamp
+        base64.urlsafe_b64encode(b"\xff\xfe|abc").decode(),          # not UTF-8
+    ])
+    async def test_malformed_or_tampered_cursor_rejected(self, authenticated_agent, cursor):
+        """A cursor that doesn't decode to (created_at, id) is a 400, not a 500"""
+        client, _ = authenticated_agent
+        response = await client.get("/agent/calls", params={"cursor": cursor})
+        assert response.status_code == 400
+        assert "cursor" in response.json()["detail"].lower()
+
+
+class TestScriptedReplies:
+    """
+    Call-ending utterances with a scripted answer skip the LLM, but only when the
+    caller said nothing else: anything longer must reach the LLM and keep the call up.
+    """
+    IDENTITY_STATE = {"turn_count": 1, "context": {"contact": {"name": "Sara"}}}
+    LATER_STATE = {"turn_count": 5, "context": {"contact": {"name": "Sara"}}}
+
+    @pytest.mark.parametrize("utterance, state, expected", [
+        ("No.", IDENTITY_STATE, "wrong number"),
+        ("Wrong number!", LATER_STATE, "wrong number"),
+        ("I'm not interested.", IDENTITY_STATE, "Thank you for your time"),
+        ("  NO, not interested ", LATER_STATE, "Thank you for your time"),
+        ("Okay, bye.", LATER_STATE, "Goodbye!"),
+    ])
+    def test_whole_utterance_matches(self, utterance, state, expected):
+        """Scripted phrases match regardless of case, spacing and punctuation"""
+        from app.services.twilio_service.webhook_service import _scripted_reply
+        reply = _scripted_reply(utterance, state, is_outbound=True)
+        assert reply is not None and expected in reply
+        assert "Sara" in reply or "wrong number" in reply
+
+    @pytest.mark.parametrize("utterance, state", [
+        ("No, I'm interested", IDENTITY_STATE),
+        ("No, I'm interested", LATER_STATE),
+        ("Not interested in that one, but what else do you have", LATER_STATE),
+        ("No", LATER_STATE),
+        ("Wrong number?", IDENTITY_STATE),
+        ("Bye the way, is it still available", LATER_STATE),
+        ("", IDENTITY_STATE),
+    ])
+    def test_partial_or_questioning_utterances_not_scripted(self, utterance, state):
+        """A scripted phrase inside a longer utterance, or asked as a question, goes to the LLM"""
+        from app.services.twilio_service.webhook_service import _scripted_reply
+        assert _scripted_reply(utterance, state, is_outbound=True) is None
+
+    def test_interested_caller_is_not_hung_up_on(self):
+        """'No, I'm interested' neither gets a scripted goodbye nor ends the call"""
+        from app.services.twilio_service.webhook_service import _scripted_reply, _should_end_call
+        utterance = "No, I'm interested"
+        assert _scripted_reply(utterance, self.IDENTITY_STATE, is_outbound=True) is None
+        llm_reply = "Great, Sara. The property at 12 Main Street has three bedrooms."
+        assert not _should_end_call(utterance, llm_reply, self.IDENTITY_STATE, is_outbound=True)
+
+    def test_inbound_bye_uses_inbound_script(self):
+        """Inbound callers get the inbound goodbye; outbound-only phrases aren't scripted"""
+        from app.services.twilio_service.webhook_service import _scripted_reply
+        assert _scripted_reply("Goodbye", {}, is_outbound=False).startswith("Thanks for calling")
+        assert _scripted_reply("Not interested", {}, is_outbound=False) is None
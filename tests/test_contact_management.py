@@ -236,7 +236,7 @@ class TestContactUpdate:
             bathrooms=2,
             price=250000,
             real_estate_agent_id=agent.id,
-            is_available="true",
+            is_available=True,
             owner_phone="+923001234567"
         )
         db_session.add(property_obj)
@@ -310,7 +310,7 @@ class TestContactDeletion:
             bathrooms=2,
             price=300000,
             real_estate_agent_id=agent.id,
-            is_available="true",
+            is_available=True,
             owner_phone="+923001234567"
         )
         db_session.add(property_obj)
@@ -335,3 +335,52 @@ class TestContactDeletion:
         data = response.json()
         # Property should have contact_id linked
         assert "contact_id" in data or "contact" in data
+
+
+class TestContactPhoneLast10:
+    """
+    Inbound callers are matched on contacts.phone_last10: the last ten digits of
+    phone_number, whatever the formatting or country code.
+    """
+    @pytest.mark.parametrize("phone_number", [
+        "+92 300-123 4567",
+        "(0300) 1234567",
+        "+923001234567",
+        "923001234567",
+        "03001234567",
+        "3001234567",
+    ])
+    def test_formats_and_country_codes_share_a_key(self, phone_number):
+        """Spaces, dashes, brackets and the +92 / 92 / 0 prefixes don't change the key"""
+        from app.models.contact import phone_last10
+        assert phone_last10(phone_number) == "3001234567"
+
+    @pytest.mark.parametrize("phone_number, expected", [
+        ("+1 (415) 555-0100", "4155550100"),
+        ("+923001", "923001"),
+        ("12345", "12345"),
+        ("", ""),
+        (None, ""),
+    ])
+    def test_other_country_codes_and_short_numbers(self, phone_number, expected):
+        """Other country codes are dropped the same way; numbers under ten digits are kept whole"""
+        from app.models.contact import phone_last10
+        assert phone_last10(phone_number) == expected
+
+    @pytest.mark.asyncio
+    async def test_key_follows_phone_number_changes(self, authenticated_agent, db_session):
+        """The stored key is set on insert and updated with the phone number"""
+        from sqlalchemy import select
+        _, agent = authenticated_agent
+        contact = Contact(id=str(uuid.uuid4()), name="Sana", phone_number="+92 300-123 4567", real_estate_agent_id=agent.id)
+        db_session.add(contact)
+        await db_session.commit()
+
+        stored = (await db_session.execute(select(Contact.phone_last10).where(Contact.id == contact.id))).scalar_one()
+        assert stored == "3001234567"
+
+        contact.phone_number = "0333-7654321"
+        await db_session.commit()
+
+        stored = (await db_session.execute(select(Contact.phone_last10).where(Contact.id == contact.id))).scalar_one()
+        assert stored == "3337654321"
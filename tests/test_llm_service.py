@@ -0,0 +1,163 @@
+"""
+Tests for the Gemini LLM service helpers that don't need the network.
+Covers batch greeting generation, the streamGenerateContent SSE parser and the
+sentence splitting of streamed replies.
+"""
+import asyncio
+import httpx
+import orjson
+import pytest
+import pytest_asyncio
+import uuid
+
+from app.services.ai import llm_service
+from app.services.ai.response_cache import clear_response_cache
+from app.services.twilio_service import webhook_service
+
+
+# ─── batch greetings ──────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_greetings_batch_spaces_request_starts(monkeypatch):
+    """Requests start at least 60/qpm seconds apart, even with free concurrency."""
+    loop = asyncio.get_running_loop()
+    starts = []
+
+    async def fake_greeting(prompt, timeout):
+        starts.append(loop.time())
+        return f"greeting for {prompt}"
+
+    monkeypatch.setattr(llm_service, "generate_initial_greeting", fake_greeting)
+
+    greetings = await llm_service.generate_initial_greetings_batch(["a", "b", "c"], concurrency=3, qpm=600)
+
+    assert greetings == ["greeting for a", "greeting for b", "greeting for c"]
+    gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+    assert all(gap >= 0.09 for gap in gaps)
+
+
+@pytest.mark.asyncio
+async def test_greetings_batch_failed_item_is_none(monkeypatch):
+    """A failed greeting is None in its slot; the others are still returned in order."""
+    async def fake_greeting(prompt, timeout):
+        if prompt == "bad":
+            raise ValueError("Gemini API error: quota")
+        return prompt.upper()
+
+    monkeypatch.setattr(llm_service, "generate_initial_greeting", fake_greeting)
+
+    greetings = await llm_service.generate_initial_greetings_batch(["ok", "bad", "fine"], qpm=6000)
+
+    assert greetings == ["OK", None, "FINE"]
+
+
+# ─── SSE parser ───────────────────────────────────────────────────────
+
+def _sse_event(text: str) -> bytes:
+    chunk = {"candidates": [{"content": {"parts": [{"text": text}]}}]}
+    return b"data: " + orjson.dumps(chunk) + b"\r\n\r\n"
+
+
+def _cut(body: bytes, *offsets: int) -> list:
+    """body split into chunks at the given byte offsets"""
+    bounds = [0, *sorted(offsets), len(body)]
+    return [body[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+@pytest_asyncio.fixture
+async def gemini_stream(monkeypatch):
+    """Serve the given byte chunks as the streamGenerateContent response body"""
+    monkeypatch.setattr(llm_service.settings, "GEMINI_API_KEY", "test-key")
+    clients = []
+
+    def serve(chunks):
+        async def body():
+            for chunk in chunks:
+                yield chunk
+
+        def handler(request):
+            return httpx.Response(200, content=body(), headers={"Content-Type": "text/event-stream"})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        clients.append(client)
+        monkeypatch.setattr(llm_service, "_get_shared_client", lambda: client)
+
+    yield serve
+    clear_response_cache()
+    for client in clients:
+        await client.aclose()
+
+
+async def _collect():
+    # A unique input keeps the response cache out of the way
+    return [piece async for piece in llm_service.stream_with_llm(
+        user_input=f"question {uuid.uuid4().hex}", system_prompt="You are a test."
+    )]
+
+
+@pytest.mark.asyncio
+async def test_stream_parses_data_lines_split_across_chunks(gemini_stream):
+    """A data: line cut anywhere (mid-keyword, mid-JSON, mid-character) is parsed once complete."""
+    first = _sse_event("Hello, ")
+    body = first + b": keep-alive\r\n\r\n" + _sse_event("café at ") + _sse_event("12 Main St.")
+    gemini_stream(_cut(body, 3, 9, len(first) + 20, body.index("é".encode()) + 1))
+
+    assert await _collect() == ["Hello, ", "café at ", "12 Main St."]
+
+
+@pytest.mark.asyncio
+async def test_stream_parses_last_event_without_trailing_newline(gemini_stream):
+    """The final event is still read when the body ends right after its JSON."""
+    gemini_stream([_sse_event("One. "), _sse_event("Two.").rstrip()])
+
+    assert await _collect() == ["One. ", "Two."]
+
+
+@pytest.mark.asyncio
+async def test_stream_without_text_is_an_error(gemini_stream):
+    """A stream with no text parts raises instead of returning an empty reply."""
+    gemini_stream([b"data: " + orjson.dumps({"candidates": [{"content": {"parts": [{}]}}]}) + b"\n\n"])
+
+    with pytest.raises(ValueError):
+        await _collect()
+
+
+# ─── streamed reply sentences ─────────────────────────────────────────
+
+async def _reply_sentences(pieces, monkeypatch):
+    """Sentences _stream_reply cuts the streamed pieces into (Twilio <Say>, no TTS)"""
+    monkeypatch.setattr(webhook_service, "_tts_synthesis_kwargs", lambda base_url, voice_settings: None)
+
+    async def stream():
+        for piece in pieces:
+            yield piece
+
+    text, clips = await webhook_service._stream_reply(stream(), "https://example.test", None)
+    assert text == " ".join(sentence for sentence, _ in clips)
+    return [sentence for sentence, _ in clips]
+
+
+@pytest.mark.asyncio
+async def test_reply_split_at_sentence_ends_across_pieces(monkeypatch):
+    """A sentence is complete at . ? or ! followed by whitespace, wherever the pieces break."""
+    sentences = await _reply_sentences(["Sure", "! It has three bed", "rooms. Want to", " visit?", " Great"], monkeypatch)
+
+    assert sentences == ["Sure!", "It has three bedrooms.", "Want to visit?", "Great"]
+
+
+@pytest.mark.asyncio
+async def test_reply_not_split_after_abbreviations(monkeypatch):
+    """'St.', 'Dr.' and initials don't end a sentence, even when a piece ends right after them."""
+    sentences = await _reply_sentences(
+        ["It's at 12 Main St", ". near the park. Dr. Khan and J.", " Ali will meet you."],
+        monkeypatch,
+    )
+
+    assert sentences == ["It's at 12 Main St. near the park.", "Dr. Khan and J. Ali will meet you."]
+
+
+def test_split_sentences_keeps_decimals_and_unfinished_rest():
+    """A '.' without following whitespace (prices, decimals) isn't a boundary; the tail stays pending."""
+    assert webhook_service._split_sentences("It's 2.5 million. Bath is 1.5 St") == (
+        ["It's 2.5 million."], "Bath is 1.5 St"
+    )
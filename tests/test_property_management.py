@@ -86,7 +86,7 @@ class TestPropertyRetrieval:
                 square_feet=1500 + i * 100,
                 price=200000 + i * 30000,
                 property_type="house",
-                is_available="true",
+                is_available=True,
                 real_estate_agent_id=agent.id,
                 owner_phone="+923001234567"
             )
@@ -119,7 +119,7 @@ class TestPropertyRetrieval:
             bathrooms=2,
             price=250000,
             real_estate_agent_id=agent.id,
-            is_available="true",
+            is_available=True,
             owner_phone="+923001234567"
         )
         db_session.add(prop)
@@ -152,7 +152,7 @@ class TestPropertyRetrieval:
                 bathrooms=2,
                 price=200000,
                 real_estate_agent_id=agent.id,
-                is_available="true",
+                is_available=True,
                 owner_phone="+923001234567"
             )
             db_session.add(prop)
@@ -187,7 +187,7 @@ class TestPropertyRetrieval:
                 bathrooms=2,
                 price=price,
                 real_estate_agent_id=agent.id,
-                is_available="true",
+                is_available=True,
                 owner_phone="+923001234567"
             )
             db_session.add(prop)
@@ -236,7 +236,7 @@ class TestPropertyUpdate:
             bathrooms=2,
             price=250000,
             real_estate_agent_id=agent.id,
-            is_available="true",
+            is_available=True,
             owner_phone="+923001234567"
         )
         db_session.add(prop)
@@ -297,7 +297,7 @@ class TestPropertyDeletion:
             bathrooms=2,
             price=200000,
             real_estate_agent_id=agent.id,
-            is_available="true",
+            is_available=True,
             owner_phone="+923001234567"
         )
         db_session.add(prop)
@@ -69,7 +69,7 @@ async def test_create_showing_with_property(db_session, authenticated_agent):
         real_estate_agent_id=agent.id,
         address="123 Main St",
         owner_phone="+10000000000",
-        is_available="true",
+        is_available=True,
     )
     db_session.add(prop)
     await db_session.commit()